@@ -0,0 +1,43 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# This file is a part of pycerberus.
+# The source code contained in this file is licensed under the MIT license.
+# See LICENSE.txt in the main project directory, for more information.
+# SPDX-License-Identifier: MIT
+"""
+Measure the throughput of a schema with many BooleanCheckbox fields (e.g. a
+settings page) as well as "revert_conversion()" (used to render the form).
+
+    python benchmarks/checkboxes.py
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import timeit
+
+from pycerberus.schema import SchemaValidator
+from pycerberus.validators import BooleanCheckbox
+
+
+def main(nr_checkboxes=50, number=2000):
+    schema = SchemaValidator()
+    schema.set_internal_state_freeze(False)
+    for i in range(nr_checkboxes):
+        schema.add('option_%d' % i, BooleanCheckbox())
+    schema.set_internal_state_freeze(True)
+    tokens = ('on', 'off', 'TRUE', '', True, None)
+    data = dict(('option_%d' % i, tokens[i % len(tokens)]) for i in range(nr_checkboxes))
+    duration = min(timeit.repeat(lambda: schema.process(data), number=number, repeat=3))
+    print('process():           %8.0f forms/s' % (number / duration))
+
+    checkbox = BooleanCheckbox()
+    values = list(data.values())
+    def revert():
+        for value in values:
+            checkbox.revert_conversion(value)
+    duration = min(timeit.repeat(revert, number=number, repeat=3))
+    print('revert_conversion(): %8.0f forms/s' % (number / duration))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# This file is a part of pycerberus.
+# The source code contained in this file is licensed under the MIT license.
+# See LICENSE.txt in the main project directory, for more information.
+# SPDX-License-Identifier: MIT
+"""
+Measure EmailAddressValidator/DomainNameValidator throughput for a large
+(generated) corpus of valid and invalid email addresses.
+
+    python benchmarks/email_addresses.py
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import random
+import string
+import time
+
+from pycerberus.validators import DomainNameValidator, EmailAddressValidator
+
+
+LOCALPART_CHARS = string.ascii_letters + string.digits + '._+-'
+DOMAIN_CHARS = string.ascii_lowercase + string.digits + '-'
+TLDS = ('com', 'de', 'org', 'net', 'co.uk', 'info')
+BROKEN = (
+    lambda a: a.replace('@', ''),
+    lambda a: a.replace('@', '@@'),
+    lambda a: a.replace('.', '..', 1),
+    lambda a: a + '.',
+    lambda a: a.replace('@', ' @'),
+    lambda a: a.replace('@', '@_'),
+    lambda a: a.split('@')[0] + '@',
+)
+
+def build_corpus(size, invalid_ratio, seed=42):
+    rnd = random.Random(seed)
+    def chunk(chars, min_length, max_length):
+        length = rnd.randint(min_length, max_length)
+        return ''.join(rnd.choice(chars) for i in range(length))
+
+    corpus = []
+    for i in range(size):
+        domain = '%s.%s' % (chunk(DOMAIN_CHARS, 2, 15), rnd.choice(TLDS))
+        address = '%s@%s' % (chunk(LOCALPART_CHARS, 1, 20), domain)
+        if rnd.random() < invalid_ratio:
+            address = rnd.choice(BROKEN)(address)
+        corpus.append(address)
+    return corpus
+
+def run(validator, corpus, context_factory):
+    start = time.time()
+    for value in corpus:
+        validator.process(value, context_factory())
+    return time.time() - start
+
+def main(size=100000):
+    for invalid_ratio in (0.0, 0.2):
+        corpus = build_corpus(size, invalid_ratio=invalid_ratio)
+        domains = [address.rsplit('@', 1)[-1] or 'x' for address in corpus]
+        for label, validator, values in (
+                ('email', EmailAddressValidator(exception_if_invalid=False), corpus),
+                ('domain', DomainNameValidator(exception_if_invalid=False), domains),
+            ):
+            duration = min(run(validator, values, dict) for i in range(3))
+            values = (label, int(invalid_ratio * 100), size / duration)
+            print('%-8s %3d%% invalid: %8.0f values/s' % values)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# This file is a part of pycerberus.
+# The source code contained in this file is licensed under the MIT license.
+# See LICENSE.txt in the main project directory, for more information.
+# SPDX-License-Identifier: MIT
+"""
+Measure the conversion between error containers and exceptions for wide
+(many fields) and deep (nested schemas/lists) error structures.
+
+    python benchmarks/error_conversion.py
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import timeit
+
+from pycerberus.errors import Error
+from pycerberus.error_conversion import exception_from_errors, exception_to_errors
+
+
+def _error(i):
+    return (Error(key='invalid', msg='error %d' % i, value=i, context=None),)
+
+def wide_errors(nr_fields=50, nr_items=20):
+    items = [dict(('field_%d' % i, _error(i)) for i in range(nr_fields // 5)) for _ in range(nr_items)]
+    errors = dict(('field_%d' % i, _error(i)) for i in range(nr_fields))
+    errors['items'] = items
+    return errors
+
+def deep_errors(depth=500):
+    errors = _error(0)
+    for level in range(depth):
+        errors = [None, errors] if (level % 2) else {'child': errors}
+    return errors
+
+
+def main(number=200):
+    for label, errors in (('wide', wide_errors()), ('deep (500)', deep_errors())):
+        exc = exception_from_errors(errors)
+        benchmarks = (
+            ('exception_from_errors', lambda: exception_from_errors(errors)),
+            ('exception_to_errors', lambda: exception_to_errors(exc)),
+            ('unpack_errors', lambda: exc.unpack_errors()),
+        )
+        for name, func in benchmarks:
+            duration = min(timeit.repeat(func, number=number, repeat=3))
+            print('%-11s %-22s %8.0f conversions/s' % (label, name, number / duration))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# This file is a part of pycerberus.
+# The source code contained in this file is licensed under the MIT license.
+# See LICENSE.txt in the main project directory, for more information.
+# SPDX-License-Identifier: MIT
+"""
+Measure the (cold) import time of pycerberus for typical import statements
+(median of several fresh interpreters, via "python -X importtime").
+
+    python benchmarks/import_time.py
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import os
+import subprocess
+import sys
+
+
+STATEMENTS = (
+    'import pycerberus',
+    'from pycerberus.validators import IntegerValidator',
+    'from pycerberus.validators import *',
+)
+
+def import_time_us(statement):
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE='')
+    process = subprocess.run(
+        (sys.executable, '-X', 'importtime', '-c', statement),
+        stderr=subprocess.PIPE, universal_newlines=True, env=env, check=True,
+    )
+    total = 0
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative, module_name = line.split('|')
+        # only count top-level imports (nested imports are already included)
+        if cumulative.strip().isdigit() and not module_name.startswith('  '):
+            total += int(cumulative)
+    return total
+
+
+def main(repeat=7):
+    for statement in STATEMENTS:
+        timings = sorted(import_time_us(statement) for _ in range(repeat))
+        print('%-52s %6.1f ms' % (statement, timings[len(timings) // 2] / 1000.0))
+
+
+if __name__ == '__main__':
+    main()
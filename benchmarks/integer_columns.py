@@ -0,0 +1,37 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# This file is a part of pycerberus.
+# The source code contained in this file is licensed under the MIT license.
+# See LICENSE.txt in the main project directory, for more information.
+# SPDX-License-Identifier: MIT
+"""
+Measure ForEach(IntegerValidator) for large numeric columns with and without
+the vectorized (NumPy) conversion.
+
+    python benchmarks/integer_columns.py
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import timeit
+
+from pycerberus.lib.vectorized import is_numpy_available
+from pycerberus.validators import ForEach, IntegerValidator
+
+
+def main(nr_items=100000):
+    if not is_numpy_available():
+        print('NumPy not installed, vectorized conversion not available')
+    strings = [str(i % 5000) for i in range(nr_items)]
+    # 1% of the values are out of range
+    strings[::100] = ['99999'] * len(strings[::100])
+    ints = [int(s) for s in strings]
+    for vectorize in (False, True):
+        validator = ForEach(IntegerValidator(min=0, max=10000), vectorize=vectorize)
+        for label, values in (('strings', strings), ('ints', ints)):
+            duration = min(timeit.repeat(lambda: validator.process(values), number=1, repeat=3))
+            print('vectorize=%-5s %-8s %10.0f items/s' % (vectorize, label, nr_items / duration))
+
+
+if __name__ == '__main__':
+    main()
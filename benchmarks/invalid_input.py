@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# This file is a part of pycerberus.
+# The source code contained in this file is licensed under the MIT license.
+# See LICENSE.txt in the main project directory, for more information.
+# SPDX-License-Identifier: MIT
+"""
+Measure the throughput of a result-based schema (exception_if_invalid=False)
+when every field contains invalid data.
+
+    python benchmarks/invalid_input.py
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import timeit
+
+from pycerberus.schema import SchemaValidator
+from pycerberus.validators import (DomainNameValidator, EmailAddressValidator,
+    MatchingFields, OneOf)
+
+
+class SignupSchema(SchemaValidator):
+    domain = DomainNameValidator(exception_if_invalid=False)
+    email = EmailAddressValidator(exception_if_invalid=False)
+    email_confirmation = EmailAddressValidator(exception_if_invalid=False)
+    country = OneOf(('de', 'at', 'ch'), exception_if_invalid=False)
+
+    formvalidators = (
+        MatchingFields('email', 'email_confirmation', exception_if_invalid=False),
+    )
+
+
+def main(number=20000):
+    schema = SignupSchema(exception_if_invalid=False)
+    invalid_fields = {
+        'domain': 'foo..example',
+        'email': 'foo bar@example.com',
+        'email_confirmation': 'foo@example..com',
+        'country': 'fr',
+    }
+    mismatch = {
+        'domain': 'example.com',
+        'email': 'foo@example.com',
+        'email_confirmation': 'bar@example.com',
+        'country': 'de',
+    }
+    for label, data in (('invalid fields', invalid_fields), ('mismatching fields', mismatch)):
+        duration = min(timeit.repeat(lambda: schema.process(data), number=number, repeat=3))
+        print('%-20s %8.0f schemas/s' % (label, number / duration))
+
+
+if __name__ == '__main__':
+    main()
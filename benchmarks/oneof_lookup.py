@@ -0,0 +1,32 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# This file is a part of pycerberus.
+# The source code contained in this file is licensed under the MIT license.
+# See LICENSE.txt in the main project directory, for more information.
+# SPDX-License-Identifier: MIT
+"""
+Measure OneOf throughput for different numbers of allowed values (passed as
+a list which is the most common case).
+
+    python benchmarks/oneof_lookup.py
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import timeit
+
+from pycerberus.validators import OneOf
+
+
+def main(number=20000):
+    for size in (10, 100, 1000, 10000):
+        allowed_values = ['code-%05d' % i for i in range(size)]
+        validator = OneOf(allowed_values, exception_if_invalid=False)
+        # worst case for a linear scan: the last value in the list
+        value = allowed_values[-1]
+        duration = min(timeit.repeat(lambda: validator.process(value), number=number, repeat=3))
+        print('%6d allowed values: %8.0f values/s' % (size, number / duration))
+
+
+if __name__ == '__main__':
+    main()
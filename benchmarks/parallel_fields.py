@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# This file is a part of pycerberus.
+# The source code contained in this file is licensed under the MIT license.
+# See LICENSE.txt in the main project directory, for more information.
+# SPDX-License-Identifier: MIT
+"""
+Compare schemas with blocking field validators (simulated by "time.sleep()"
+which releases the GIL) with and without a thread pool executor.
+
+    python benchmarks/parallel_fields.py
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+from concurrent.futures import ThreadPoolExecutor
+import time
+
+from pycerberus.schema import SchemaValidator
+from pycerberus.validators import IntegerValidator, StringValidator
+
+
+class SlowValidator(StringValidator):
+    "e.g. checking a password hash in a C extension"
+    blocking = True
+    parallel_safe = True
+
+    def convert(self, value, context):
+        time.sleep(0.002)
+        return super(SlowValidator, self).convert(value, context)
+
+
+def build_schema(executor, nr_slow_fields):
+    schema = SchemaValidator(executor=executor, exception_if_invalid=False)
+    for i in range(nr_slow_fields):
+        schema.add('slow_%d' % i, SlowValidator(exception_if_invalid=False))
+    for i in range(10):
+        schema.add('number_%d' % i, IntegerValidator(exception_if_invalid=False))
+    return schema
+
+
+def measure(schema, data, number):
+    start = time.time()
+    for _ in range(number):
+        result = schema.process(data)
+    return (time.time() - start) / number, result
+
+
+def main(number=50):
+    for nr_slow_fields in (1, 4, 8):
+        data = dict(('slow_%d' % i, 'value') for i in range(nr_slow_fields))
+        data.update(('number_%d' % i, str(i)) for i in range(10))
+        duration, expected = measure(build_schema(None, nr_slow_fields), data, number)
+        print('%d blocking fields, sequential: %6.2f ms' % (nr_slow_fields, duration * 1000))
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            duration, result = measure(build_schema(executor, nr_slow_fields), data, number)
+        assert result.value == expected.value
+        print('%d blocking fields, executor:   %6.2f ms' % (nr_slow_fields, duration * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# This file is a part of pycerberus.
+# The source code contained in this file is licensed under the MIT license.
+# See LICENSE.txt in the main project directory, for more information.
+# SPDX-License-Identifier: MIT
+"""
+Measure how fast PositionalArgumentsParsingSchema parses comma-separated
+lines (one "process()" call per line vs. "process_lines()").
+
+    python benchmarks/positional_lines.py
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import timeit
+
+from pycerberus.schemas import PositionalArgumentsParsingSchema
+from pycerberus.validators import IntegerValidator, StringValidator
+
+
+class EntrySchema(PositionalArgumentsParsingSchema):
+    name = StringValidator()
+    port = IntegerValidator()
+    comment = StringValidator(required=False)
+    parameter_order = ('name', 'port', 'comment')
+
+
+def main(nr_lines=20000):
+    schema = EntrySchema()
+    lines = ['host-%d, %d, some comment\n' % (i, 1000 + (i % 5000)) for i in range(nr_lines)]
+    lines[::100] = ['invalid line\n'] * len(lines[::100])
+
+    def per_line():
+        for line in lines:
+            try:
+                schema.process(line.rstrip('\n'))
+            except Exception:
+                pass
+
+    def bulk():
+        for line_no, value in schema.process_lines(lines):
+            pass
+
+    for label, func in (('process()', per_line), ('process_lines()', bulk)):
+        duration = min(timeit.repeat(func, number=1, repeat=3))
+        print('%-16s %8.0f lines/s' % (label, nr_lines / duration))
+
+
+if __name__ == '__main__':
+    main()
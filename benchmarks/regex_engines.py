@@ -0,0 +1,43 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# This file is a part of pycerberus.
+# The source code contained in this file is licensed under the MIT license.
+# See LICENSE.txt in the main project directory, for more information.
+# SPDX-License-Identifier: MIT
+"""
+Compare the "re" and "linear" regex engines of the RegexValidator for
+ordinary inputs and for inputs which trigger catastrophic backtracking.
+
+    python benchmarks/regex_engines.py
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import time
+
+from pycerberus.validators import RegexValidator
+
+
+CASES = (
+    ('ordinary', r'[a-z0-9._+-]+@[a-z0-9-]+(\.[a-z0-9-]+)+', 'john.smith@example.com', 2000),
+    ('ordinary', r'(\d{3})-(\d{4})', '555-1234', 2000),
+    ('pathological', r'(a+)+', 'a' * 18 + 'b', 5),
+    ('pathological', r'(a+)+', 'a' * 22 + 'b', 1),
+    ('pathological', r'(a|aa)*c', 'a' * 30, 1),
+)
+
+def main():
+    for label, pattern, value, number in CASES:
+        timings = []
+        for engine in ('re', 'linear'):
+            validator = RegexValidator(regex=pattern, regex_engine=engine)
+            start = time.time()
+            for i in range(number):
+                validator.process(value)
+            timings.append((time.time() - start) / number * 1000)
+        values = (label, pattern, len(value)) + tuple(timings)
+        print('%-13s %-40s len=%-3d re: %9.3f ms  linear: %7.3f ms' % values)
+
+
+if __name__ == '__main__':
+    main()
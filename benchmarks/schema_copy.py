@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# This file is a part of pycerberus.
+# The source code contained in this file is licensed under the MIT license.
+# See LICENSE.txt in the main project directory, for more information.
+# SPDX-License-Identifier: MIT
+"""
+Copy a large declarative schema (e.g. once per tenant) and add a
+tenant-specific field to each copy.
+
+    python benchmarks/schema_copy.py [number]
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import sys
+import timeit
+
+from pycerberus.schema import SchemaValidator
+from pycerberus.validators import IntegerValidator, OneOf, StringValidator
+
+
+def build_schema_class(nr_fields=100):
+    attributes = {
+        'exception_if_invalid': False,
+        'formvalidators': (OneOf(['a', 'b'], exception_if_invalid=False), ),
+    }
+    for i in range(nr_fields):
+        if i % 2:
+            attributes['text_%d' % i] = StringValidator(exception_if_invalid=False)
+        else:
+            attributes['number_%d' % i] = IntegerValidator(exception_if_invalid=False)
+    return type(str('LargeSchema'), (SchemaValidator, ), attributes)
+
+
+def copy_for_tenant(schema, tenant):
+    tenant_schema = schema.copy()
+    tenant_schema.set_internal_state_freeze(False)
+    tenant_schema.add('tenant_%d' % tenant, StringValidator(exception_if_invalid=False))
+    tenant_schema.set_internal_state_freeze(True)
+    return tenant_schema
+
+
+def main(number=2000):
+    schema = build_schema_class()()
+    copies = [copy_for_tenant(schema, tenant) for tenant in range(3)]
+    assert len(schema.fieldvalidators()) == 100
+    assert all(len(tenant_schema.fieldvalidators()) == 101 for tenant_schema in copies)
+    for label, func in (('copy()', schema.copy),
+                        ('copy() + add field', lambda: copy_for_tenant(schema, 1))):
+        duration = min(timeit.repeat(func, number=number, repeat=3))
+        print('%-20s %7.2f µs' % (label, duration / number * 1e6))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
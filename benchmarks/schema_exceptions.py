@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# This file is a part of pycerberus.
+# The source code contained in this file is licensed under the MIT license.
+# See LICENSE.txt in the main project directory, for more information.
+# SPDX-License-Identifier: MIT
+"""
+Measure how expensive it is to build the exception for a failing schema
+(exception_if_invalid=True) when the caller only looks at the first error
+and when it inspects all nested errors.
+
+    python benchmarks/schema_exceptions.py
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import timeit
+
+from pycerberus.error_conversion import exception_from_errors, exception_from_result
+from pycerberus.schema import SchemaValidator
+from pycerberus.validators import ForEach, IntegerValidator
+
+
+def build_schema(nr_fields=30, nr_item_fields=5):
+    item_schema = SchemaValidator(exception_if_invalid=False)
+    item_schema.set_internal_state_freeze(False)
+    for i in range(nr_item_fields):
+        item_schema.add('item_field_%d' % i, IntegerValidator(exception_if_invalid=False))
+    item_schema.set_internal_state_freeze(True)
+
+    schema = SchemaValidator(exception_if_invalid=False)
+    schema.set_internal_state_freeze(False)
+    for i in range(nr_fields):
+        schema.add('field_%d' % i, IntegerValidator(exception_if_invalid=False))
+    schema.add('items', ForEach(item_schema))
+    schema.set_internal_state_freeze(True)
+    data = dict(('field_%d' % i, 'invalid') for i in range(nr_fields))
+    data['items'] = [dict(('item_field_%d' % i, 'invalid') for i in range(nr_item_fields))] * 10
+    return schema, data
+
+
+def main(number=2000):
+    schema, data = build_schema()
+    result = schema.process(data)
+    benchmarks = (
+        ('eager, first error', lambda: exception_from_errors(result.errors).details()),
+        ('lazy, first error', lambda: exception_from_result(result).details()),
+        ('eager, all errors', lambda: exception_from_errors(result.errors).unpack_errors()),
+        ('lazy, all errors', lambda: exception_from_result(result).unpack_errors()),
+    )
+    for label, func in benchmarks:
+        duration = min(timeit.repeat(func, number=number, repeat=3))
+        print('%-20s %8.0f exceptions/s' % (label, number / duration))
+
+
+if __name__ == '__main__':
+    main()
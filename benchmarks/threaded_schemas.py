@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# This file is a part of pycerberus.
+# The source code contained in this file is licensed under the MIT license.
+# See LICENSE.txt in the main project directory, for more information.
+# SPDX-License-Identifier: MIT
+"""
+Stress test: process the same schema instances from several threads and
+check that every thread gets exactly the same results as a single-threaded
+run (values, error keys and translated messages). Prints the throughput for
+each number of threads (scaling is only expected on free-threaded Python).
+
+    python benchmarks/threaded_schemas.py [max threads]
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import sys
+import threading
+import time
+
+from pycerberus.i18n import negotiate_locales
+from pycerberus.schema import SchemaValidator
+from pycerberus.validators import (BooleanCheckbox, Cached, EmailAddressValidator,
+    ForEach, IntegerValidator, OneOf, StringValidator)
+
+
+def build_schema():
+    address = SchemaValidator(exception_if_invalid=False)
+    address.set_internal_state_freeze(False)
+    address.add('zip', IntegerValidator(min=1000, max=99999, exception_if_invalid=False))
+    address.add('country', Cached(OneOf(['DE', 'AT', 'CH'], exception_if_invalid=False)))
+    address.set_internal_state_freeze(True)
+
+    schema = SchemaValidator(exception_if_invalid=False)
+    schema.set_internal_state_freeze(False)
+    schema.add('name', StringValidator(min_length=2, exception_if_invalid=False))
+    schema.add('email', EmailAddressValidator(exception_if_invalid=False))
+    schema.add('newsletter', BooleanCheckbox())
+    schema.add('addresses', ForEach(address))
+    schema.set_internal_state_freeze(True)
+    return schema
+
+
+def build_inputs(nr_inputs=50):
+    inputs = []
+    for i in range(nr_inputs):
+        locale = negotiate_locales(('de-DE,de;q=0.8', 'en-US', 'fr')[i % 3])
+        data = {
+            'name': 'x' * (i % 4),
+            'email': ('user%d@example.com' % i) if (i % 5) else 'invalid@',
+            'newsletter': ('on', 'off', 'maybe')[i % 3],
+            'addresses': [{'zip': str(900 + i * 100), 'country': ('DE', 'XX')[i % 2]}] * (i % 3),
+        }
+        inputs.append((data, locale))
+    return inputs
+
+
+def summarize(result):
+    errors = tuple(sorted(
+        (path, tuple((e.key, e.msg) for e in errors))
+        for path, errors in result.errors_by_path().items()
+    ))
+    return (repr(sorted(result.value.items())), errors)
+
+
+def run(schema, inputs, nr_threads, repetitions, expected):
+    failures = []
+    def worker():
+        for _ in range(repetitions):
+            for (data, locale), expected_summary in zip(inputs, expected):
+                summary = summarize(schema.process(data, {'locale': locale}))
+                if summary != expected_summary:
+                    failures.append((data, locale, summary))
+    threads = [threading.Thread(target=worker) for _ in range(nr_threads)]
+    start = time.time()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    duration = time.time() - start
+    return (nr_threads * repetitions * len(inputs)) / duration, failures
+
+
+def main(max_threads=8, repetitions=40):
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print('Python %s (GIL %s)' % (sys.version.split()[0], 'enabled' if is_gil_enabled else 'disabled'))
+    schema = build_schema()
+    inputs = build_inputs()
+    expected = [summarize(schema.process(data, {'locale': locale})) for data, locale in inputs]
+
+    nr_threads = 1
+    baseline = None
+    while nr_threads <= max_threads:
+        throughput, failures = run(schema, inputs, nr_threads, repetitions, expected)
+        if baseline is None:
+            baseline = throughput
+        print('%2d threads: %8.0f inputs/s (speedup %.2f), %d wrong results' % (
+            nr_threads, throughput, throughput / baseline, len(failures)))
+        if failures:
+            data, locale, summary = failures[0]
+            print('  first wrong result for %r (%r): %r' % (data, locale, summary))
+            sys.exit(1)
+        nr_threads *= 2
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,41 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# This file is a part of pycerberus.
+# The source code contained in this file is licensed under the MIT license.
+# See LICENSE.txt in the main project directory, for more information.
+# SPDX-License-Identifier: MIT
+"""
+Measure the cost of translated error messages (requires compiled catalogs,
+see "i18n-compile-catalog.sh").
+
+    python benchmarks/translations.py
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import timeit
+
+from pycerberus.errors import InvalidDataError
+from pycerberus.validators import IntegerValidator
+
+
+def main(number=20000):
+    validator = IntegerValidator()
+    for locale in ('en', 'de'):
+        context = {'locale': locale}
+        def lookup():
+            return validator.message('invalid_number', context)
+        duration = min(timeit.repeat(lookup, number=number, repeat=3))
+        print('%-4s %10.0f messages/s' % (locale, number / duration))
+
+    def invalid_input():
+        try:
+            validator.process('abc', {'locale': 'de'})
+        except InvalidDataError:
+            pass
+    duration = min(timeit.repeat(invalid_input, number=number, repeat=3))
+    print('%-4s %10.0f invalid inputs/s' % ('de', number / duration))
+
+
+if __name__ == '__main__':
+    main()
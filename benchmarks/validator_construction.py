@@ -0,0 +1,40 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# This file is a part of pycerberus.
+# The source code contained in this file is licensed under the MIT license.
+# See LICENSE.txt in the main project directory, for more information.
+# SPDX-License-Identifier: MIT
+"""
+Measure how long it takes to construct (and freeze) common validators, e.g.
+when schemas are built per request.
+
+    python benchmarks/validator_construction.py [number]
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import sys
+import timeit
+
+from pycerberus.validators import (ForEach, IntegerValidator, RegexValidator,
+    StringValidator)
+
+
+def factories():
+    return (
+        ('StringValidator', lambda: StringValidator(min_length=2, exception_if_invalid=False)),
+        ('IntegerValidator', lambda: IntegerValidator(min=0, exception_if_invalid=False)),
+        ('RegexValidator', lambda: RegexValidator(r'^\d+$', exception_if_invalid=False)),
+        ('ForEach', lambda: ForEach(StringValidator(exception_if_invalid=False))),
+        ('custom messages', lambda: StringValidator(messages={'empty': 'fill me'}, exception_if_invalid=False)),
+    )
+
+
+def main(number=20000):
+    for label, factory in factories():
+        duration = min(timeit.repeat(factory, number=number, repeat=3))
+        print('%-18s %6.2f µs' % (label, duration / number * 1e6))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
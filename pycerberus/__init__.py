@@ -1,4 +1,21 @@
+import sys
 
-from pycerberus.api import *
-from pycerberus.errors import *
+from pycerberus.compat import lazy_module_attributes
 
+
+# The modules are only imported when one of their attributes is used so a
+# plain "import pycerberus" is cheap.
+_module_attributes = {
+    '.api': ('BaseValidator', 'Validator'),
+    '.errors': (
+        'BudgetExceededError', 'EmptyError', 'Error', 'InvalidArgumentsError',
+        'InvalidDataError', 'ThreadSafetyError', 'ValidationError',
+    ),
+}
+__all__ = [name for names in _module_attributes.values() for name in names]
+
+if sys.version_info >= (3, 7):
+    __getattr__, __dir__ = lazy_module_attributes(__name__, _module_attributes)
+else:
+    from pycerberus.api import *
+    from pycerberus.errors import *
@@ -16,8 +16,10 @@ import six
 
 from pycerberus.error_conversion import exception_from_errors
 from pycerberus.errors import *
-from pycerberus.i18n import _, GettextTranslation
+from pycerberus.i18n import _, MessageSource, translate_message
 from pycerberus.lib.form_data import FieldData
+from pycerberus.lib.lru_cache import LRUCache
+from pycerberus.lib.message_template import compile_template, compile_translation
 
 
 __all__ = ['BaseValidator', 'Validator']
@@ -27,12 +29,75 @@ class NoValueSet(object):
     pass
 
 
+_IMMUTABLE_TYPES = frozenset(
+    (bool, bytes, float, frozenset, six.text_type, tuple, type(None)) + six.integer_types
+)
+
+
 class EarlyBindForMethods(type):
     def __new__(cls, classname, direct_superclasses, class_attributes_dict):
         validator_class = type.__new__(cls, classname, direct_superclasses, class_attributes_dict)
         cls._simulate_early_binding_for_message_methods(validator_class)
         return validator_class
     
+    def __setattr__(cls, name, value):
+        super(EarlyBindForMethods, cls).__setattr__(name, value)
+        cls._discard_copy_plan(name)
+    
+    def __delattr__(cls, name):
+        super(EarlyBindForMethods, cls).__delattr__(name)
+        cls._discard_copy_plan(name)
+    
+    def _discard_copy_plan(cls, name):
+        if name == '_copy_plan':
+            return
+        # subclasses inherit the changed attribute
+        classes = [cls]
+        while classes:
+            klass = classes.pop()
+            if '_copy_plan' in klass.__dict__:
+                type.__delattr__(klass, '_copy_plan')
+            classes.extend(klass.__subclasses__())
+    
+    def _attributes_to_copy(cls):
+        """Return the names of all class-level attributes which must be copied
+        by ``BaseValidator.copy()`` (mutable values, no methods/descriptors).
+        The plan is computed once per class (and again if a class attribute is
+        changed)."""
+        copy_plan = cls.__dict__.get('_copy_plan')
+        if copy_plan is None:
+            copy_plan = tuple(cls._build_copy_plan())
+            type.__setattr__(cls, '_copy_plan', copy_plan)
+        return copy_plan
+    
+    def _build_copy_plan(cls):
+        for name in dir(cls):
+            if name in ('__dict__', '__doc__', '__module__', '__slotnames__',
+                        '__weakref__', '_copy_plan', 'super'):
+                continue
+            value = getattr(cls, name)
+            if name.startswith('__') and callable(value):
+                continue
+            elif inspect.isroutine(value) or isinstance(value, type):
+                continue
+            elif type(value) in _IMMUTABLE_TYPES:
+                # copy.copy() would return the same object
+                continue
+            elif hasattr(type(value), '__get__'):
+                # descriptors (e.g. properties) return per-instance values
+                continue
+            yield name
+    
+    def __call__(cls, *args, **kwargs):
+        validator = super(EarlyBindForMethods, cls).__call__(*args, **kwargs)
+        # Freeze once after the complete initialization (including all
+        # subclass constructors) instead of checking the freeze state on every
+        # assignment in __init__. Validators which explicitly set the freeze
+        # state during initialization keep it.
+        if cls._freeze_after_init:
+            validator.__dict__.setdefault('_is_internal_state_frozen', True)
+        return validator
+    
     def _simulate_early_binding_for_message_methods(cls, validator_class):
         # Need to create a dynamic method if messages are defined in a 
         # class-level dict.
@@ -75,7 +140,17 @@ class BaseValidator(object):
     
     You can pass ``messages`` a dict of messages during instantiation to 
     overwrite messages specified in the validator without the need to create 
-    a subclass."""
+    a subclass.
+    
+    Validators which spend most of their time in code which releases the GIL
+    (I/O, C extensions) should set ``blocking = True``. If ``process()`` only
+    uses the context it receives (no state shared with other fields) the
+    validator is also ``parallel_safe``. Schemas with an ``executor`` run
+    fields with such validators in parallel."""
+    blocking = False
+    parallel_safe = False
+    _freeze_after_init = False
+
     def __init__(self, messages=None, id=None):
         self.id = id if id else _class_name_to_validator_id(self.__class__.__name__)
         if not messages:
@@ -93,6 +168,12 @@ class BaseValidator(object):
             if key in messages:
                 return messages[key]
             return old_message_for_key(key, context)
+        # like the generated method this only depends on the key (so message
+        # templates can be cached) unless there is a custom fallback.
+        message_for_key.autogenerated = getattr(old_message_for_key, 'autogenerated', False)
+        # These instance attributes are only set during initialization (before
+        # the validator can be used by other threads), afterwards they are
+        # read-only.
         self.messages = self._new_instancemethod(messages_)
         self.keys = self._new_instancemethod(keys_)
         self.message_for_key = self._new_instancemethod(message_for_key)
@@ -122,31 +203,20 @@ class BaseValidator(object):
         if hasattr(clone, 'is_internal_state_frozen'):
             was_frozen = clone.is_internal_state_frozen()
             clone.set_internal_state_freeze(False)
-        # deepcopy only copies instance-level attribute but we need to copy also
-        # class-level attributes to support the declarative syntax properly.
-        # I did not want to add more metaclass magic (that's already complicated
-        # enough).
+        # copy.copy() only copies instance-level attributes but we need to copy
+        # also (mutable) class-level attributes to support the declarative
+        # syntax properly. The metaclass knows which attributes need copying.
         klass = self.__class__
-        for name in dir(clone):
-            if name in ('__dict__', '__doc__', '__module__', '__slotnames__',
-                        '__weakref__', 'super'):
-                continue
-            elif not hasattr(klass, name):
-                # this is an instance-specific attribute/method, already copied
-                continue
-            clone_value = getattr(clone, name)
+        instance_attributes = clone.__dict__
+        for name in klass._attributes_to_copy():
             klass_value = getattr(klass, name)
-            if id(clone_value) != id(klass_value):
-                continue
-            if name.startswith('__') and callable(clone_value):
+            if instance_attributes.get(name, klass_value) is not klass_value:
+                # this is an instance-specific attribute, already copied
                 continue
-            elif inspect.isroutine(clone_value):
-                continue
-            
-            if hasattr(clone_value, 'copy'):
-                copied_value = clone_value.copy()
+            if hasattr(klass_value, 'copy'):
+                copied_value = klass_value.copy()
             else:
-                copied_value = copy.copy(clone_value)
+                copied_value = copy.copy(klass_value)
             setattr(clone, name, copied_value)
         if was_frozen:
             clone.set_internal_state_freeze(True)
@@ -164,8 +234,8 @@ class BaseValidator(object):
     
     def raise_error(self, key, value, context, errorclass=InvalidDataError, **values):
         """Raise an InvalidDataError for the given key."""
-        msg_template = self.message_for_key(key, context)
-        raise errorclass(msg_template % values, value, key=key, context=context)
+        msg_template = compile_template(self.message_for_key(key, context))
+        raise errorclass(msg_template.render(values), value, key=key, context=context)
 
     def process(self, value, context=None):
         """This is the method to validate your input. The validator returns a
@@ -218,7 +288,12 @@ class Validator(BaseValidator):
     
     In order to prevent programmer errors, an exception will be raised if 
     you set ``required`` to True but provide a default value as well.
+    
+    Validators must not store state during validation: Instances are frozen
+    after construction (when ``__init__()`` of the subclass returned) and
+    assigning attributes afterwards raises a ``ThreadSafetyError``.
     """
+    _freeze_after_init = True
 
     def __init__(self, default=NoValueSet, required=NoValueSet, id=None,
                  exception_if_invalid=NoValueSet, strip=False, messages=None):
@@ -232,8 +307,8 @@ class Validator(BaseValidator):
             self._exception_if_invalid = value
         self._strip_input = strip
         self._implementations, self._implementation_by_class = self._freeze_implementations_for_class()
-        if self.is_internal_state_frozen() not in (True, False):
-            self._is_internal_state_frozen = True
+        # compiled (translated) message templates and message sources by key/locale
+        self._message_templates = LRUCache(maxsize=128)
     
     # --------------------------------------------------------------------------
     # initialization
@@ -259,24 +334,40 @@ class Validator(BaseValidator):
     def _freeze_implementations_for_class(self):
         class_for_key = {}
         implementations_for_class = {}
-        known_functions = set()
-        for cls in reversed(inspect.getmro(self.__class__)):
-            if not self._class_defines_custom_keys(cls, known_functions):
-                continue
-            defined_keys = cls.keys(self)
+        for cls, implementations in self._implementations_for_mro():
             if cls == self.__class__:
+                # messages/keys might be overridden for this instance
                 cls = self
                 defined_keys = self.keys()
-            known_functions.add(cls.keys)
+                implementations = self._implementations_by_key(self)
+            else:
+                defined_keys = cls.keys(self)
             for key in defined_keys:
-                class_for_key[key] = self._implementations_by_key(cls)
-                implementations_for_class[cls] = class_for_key[key]
+                class_for_key[key] = implementations
+                implementations_for_class[cls] = implementations
         return class_for_key, implementations_for_class
     
+    def _implementations_for_mro(self):
+        # The implementations of all classes in the MRO only depend on the
+        # class so they are computed once per class (the dicts are read-only).
+        klass = self.__class__
+        mro_implementations = klass.__dict__.get('_mro_implementations')
+        if mro_implementations is None:
+            mro_implementations = []
+            known_functions = set()
+            for cls in reversed(inspect.getmro(klass)):
+                if not self._class_defines_custom_keys(cls, known_functions):
+                    continue
+                known_functions.add(cls.keys)
+                mro_implementations.append((cls, self._implementations_by_key(cls)))
+            mro_implementations = tuple(mro_implementations)
+            klass._mro_implementations = mro_implementations
+        return mro_implementations
+    
     def _implementations_by_key(self, cls):
         implementations_by_key = dict()
         for name in ['translation_parameters', 'keys', 'message_for_key', 'translate_message']:
-            implementations_by_key[name] = getattr(cls, name)
+            implementations_by_key[name] = getattr(cls, name, None)
         return implementations_by_key
     
     def _class_defines_custom_keys(self, cls, known_functions):
@@ -286,13 +377,17 @@ class Validator(BaseValidator):
     # Implementation of BaseValidator API
     
     def messages(self):
-        return {'empty': _('Value must not be empty.')}
+        return {
+            'empty': _('Value must not be empty.'),
+            'budget_exceeded': _('Validation aborted because it required too much work.'),
+        }
     
     def exception(self, key, value, context, errorclass=InvalidDataError, 
             error_dict=None, error_list=(), **values):
         translated_message = self.message(key, context, **values)
         return errorclass(translated_message, value, key=key, context=context, 
-            error_dict=error_dict, error_list=error_list)
+            error_dict=error_dict, error_list=error_list,
+            msg_values=values, message_source=self._message_source(key, context))
     
     def raise_error(self, key, value, context, errorclass=InvalidDataError, 
             error_dict=None, error_list=(), **values):
@@ -310,6 +405,9 @@ class Validator(BaseValidator):
         value = super(Validator, self).process(value, context)
 
         result = self.get_result(value, context)
+        budget = context.get('budget')
+        if (budget is not None) and (not budget.charge()):
+            return self.handle_exceeded_budget(value, context, old_result)
         if self.is_empty(value, context) == True:
             return self.handle_empty_input(value, context, old_result)
 
@@ -345,6 +443,15 @@ class Validator(BaseValidator):
         # This reduces the number of "context restores" in this branch
         return result
 
+    def handle_exceeded_budget(self, value, context, old_result):
+        result = context['result']
+        if self._exception_if_invalid:
+            self._restore_old_result_in_context(context, old_result)
+            self.raise_error('budget_exceeded', value, context, errorclass=BudgetExceededError)
+        self.new_error('budget_exceeded', value, context)
+        self._restore_old_result_in_context(context, old_result)
+        return self.handle_validator_result(None, result, context, nr_new_errors=1)
+
     def handle_validator_result(self, converted_value, result, context, errors=None, nr_new_errors=None):
         if nr_new_errors is not None:
             is_input_valid = (nr_new_errors <= 0)
@@ -436,21 +543,53 @@ class Validator(BaseValidator):
     
     def translate_message(self, key, native_message, translation_parameters, context):
         # This method can be overridden on a by-class basis to get translations 
-        # to support non-gettext translation mechanisms (e.g. from a db)
-        return GettextTranslation(**translation_parameters).ugettext(native_message)
+        # to support non-gettext translation mechanisms (e.g. from a db).
+        # Alternatively "translation_parameters()" can return a
+        # "TranslationProvider" (key: "provider").
+        return translate_message(native_message, translation_parameters, context)
     
     def message(self, key, context, **values):
         # This method can be overridden globally to use a different message 
         # lookup / translation mechanism altogether
-        native_message = self._implementation(key, 'message_for_key', context)(key)
-        translation_parameters = self._implementation(key, 'translation_parameters', context)()
-        translation_function = self._implementation(key, 'translate_message', context)
-        translated_template = translation_function(key, native_message, translation_parameters)
-        return translated_template % values
+        return self.message_template(key, context).render(values)
+
+    def message_template(self, key, context):
+        """Return the translated template for the given key as a
+        ``MessageTemplate``.
+
+        Templates translated by gettext are cached per key, locale and
+        translation parameters. Custom messages or translations (e.g.
+        ``message_for_key()`` or ``translate_message()`` overridden or a
+        translation "provider") are looked up for every message (only parsing
+        the template is cached)."""
+        return self._template_and_source(key, context)[0]
     
     # -------------------------------------------------------------------------
     # private 
     
+    def _message_source(self, key, context):
+        # picklable information to render the message later (errors must not
+        # keep a reference to the validator)
+        return self._template_and_source(key, context, translate=False)[1]
+    
+    def _template_and_source(self, key, context, translate=True):
+        translation_parameters = self._implementation(key, 'translation_parameters', context)()
+        cache_key = self._template_cache_key(key, context, translation_parameters)
+        if cache_key is not None:
+            cached = self._message_templates.get(cache_key)
+            if cached is not None:
+                return cached
+        native_message = self._implementation(key, 'message_for_key', context)(key)
+        message_source = MessageSource(native_message, translation_parameters)
+        if not translate:
+            return (None, message_source)
+        translation_function = self._implementation(key, 'translate_message', context)
+        translated_template = translation_function(key, native_message, translation_parameters)
+        template = compile_translation(native_message, translated_template)
+        if cache_key is not None:
+            self._message_templates.set(cache_key, (template, message_source))
+        return (template, message_source)
+    
     def _implementation(self, key, methodname, context):
         def context_key_wrapper(*args):
             method = self._implementations[key][methodname]
@@ -460,6 +599,26 @@ class Validator(BaseValidator):
             return method(*args)
         return context_key_wrapper
     
+    def _template_cache_key(self, key, context, translation_parameters):
+        implementations = self._implementations[key]
+        translate_message = implementations['translate_message']
+        if getattr(translate_message, '__func__', translate_message) is not _gettext_translate_message:
+            return None
+        elif not getattr(implementations['message_for_key'], 'autogenerated', False):
+            # custom "message_for_key()" might use the context
+            return None
+        elif 'provider' in translation_parameters:
+            return None
+        locale = (context or {}).get('locale', 'en')
+        if isinstance(locale, list):
+            locale = tuple(locale)
+        cache_key = (key, locale, tuple(sorted(translation_parameters.items())))
+        try:
+            hash(cache_key)
+        except TypeError:
+            return None
+        return cache_key
+
     def _is_unbound(self, method):
         if six.PY2:
             return (method.im_self is None)
@@ -476,14 +635,22 @@ class Validator(BaseValidator):
     
     def __setattr__(self, name, value):
         "Prevent non-threadsafe use of Validators by unexperienced developers"
-        if self.is_internal_state_frozen():
+        # The instance is frozen by the metaclass after __init__ so the flag
+        # is not set during construction.
+        if self.__dict__.get('_is_internal_state_frozen'):
             raise ThreadSafetyError('Do not store state in a validator instance as this violates thread safety.')
         self.__dict__[name] = value
 
     def _error(self, key, value, context, msg_values=None, is_critical=True):
-        msg = self.message(key, context, **(msg_values or {}))
-        return Error(key, msg, value, context, is_critical=is_critical)
+        msg_values = msg_values or {}
+        msg = self.message(key, context, **msg_values)
+        return Error(key, msg, value, context, is_critical=is_critical,
+                     msg_values=msg_values,
+                     message_source=self._message_source(key, context))
 
     # -------------------------------------------------------------------------
 
 
+# used to detect validators which use the default (gettext) translation so
+# their message templates can be cached
+_gettext_translate_message = six.get_unbound_function(Validator.translate_message)
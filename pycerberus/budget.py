@@ -0,0 +1,60 @@
+# -*- coding: UTF-8 -*-
+# This file is a part of pycerberus.
+# The source code contained in this file is licensed under the MIT license.
+# See LICENSE.txt in the main project directory, for more information.
+# SPDX-License-Identifier: MIT
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import time
+
+
+__all__ = ['ValidationBudget']
+
+# Python 2.7 does not provide a monotonic clock
+_monotonic = getattr(time, 'monotonic', time.time)
+
+
+class ValidationBudget(object):
+    """Limit the work done for a single validation run (opt-in).
+
+    Put an instance in the context (``context['budget']``) and every
+    ``Validator.process()`` call (including all validators nested in schemas
+    and ``ForEach``) consumes one step. Once more than ``max_steps`` steps
+    were used or more than ``max_seconds`` passed since the first step, all
+    remaining validators return a "budget_exceeded" error (or raise a
+    ``BudgetExceededError``) without doing any actual work.
+
+    Please note that the budget is only checked between validators so a
+    single slow validator (e.g. a regex with catastrophic backtracking) can
+    not be interrupted.
+
+    Budgets count the work for a single validation so do not share them
+    between different validation runs/threads."""
+
+    def __init__(self, max_steps=None, max_seconds=None, clock=_monotonic):
+        self.max_steps = max_steps
+        self.max_seconds = max_seconds
+        self.clock = clock
+        self.steps = 0
+        self.started = None
+        self._is_exceeded = False
+
+    def charge(self, steps=1):
+        """Consume the given number of steps and return True if the work is
+        still within the budget."""
+        if self._is_exceeded:
+            return False
+        self.steps += steps
+        if (self.max_steps is not None) and (self.steps > self.max_steps):
+            self._is_exceeded = True
+        elif self.max_seconds is not None:
+            now = self.clock()
+            if self.started is None:
+                self.started = now
+            elif (now - self.started) > self.max_seconds:
+                self._is_exceeded = True
+        return not self._is_exceeded
+
+    def is_exceeded(self):
+        return self._is_exceeded
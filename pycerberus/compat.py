@@ -14,3 +14,49 @@ try:
 except ImportError:
     # Python 2.6
     from ordereddict import OrderedDict
+
+
+def lazy_module_attributes(package_name, module_attributes):
+    """Return ``__getattr__`` and ``__dir__`` functions (PEP 562) for the
+    given package which import a module only when one of its attributes is
+    accessed for the first time. Submodules are imported on attribute access
+    as well (e.g. ``pycerberus.api`` after ``import pycerberus``).
+
+    ``module_attributes`` maps module names (relative to the package) to the
+    names of the attributes which the package exports from that module."""
+    import importlib
+    import sys
+
+    attribute_modules = {}
+    for module_name, attribute_names in module_attributes.items():
+        for attribute_name in attribute_names:
+            attribute_modules[attribute_name] = module_name
+
+    def __getattr__(name):
+        module_name = attribute_modules.get(name)
+        if module_name is None:
+            # submodules are available as attributes (like with eager imports)
+            return _import_submodule(name)
+        module = importlib.import_module(module_name, package_name)
+        value = getattr(module, name)
+        # no need to call __getattr__ again for subsequent lookups
+        setattr(sys.modules[package_name], name, value)
+        return value
+
+    def _import_submodule(name):
+        submodule_name = package_name + '.' + name
+        if name.startswith('__'):
+            # e.g. "__wrapped__" (introspection)
+            raise AttributeError('module %r has no attribute %r' % (package_name, name))
+        try:
+            # also binds the module as attribute of the package
+            return importlib.import_module(submodule_name)
+        except ImportError as e:
+            if getattr(e, 'name', None) != submodule_name:
+                # the submodule exists but failed to import
+                raise
+        raise AttributeError('module %r has no attribute %r' % (package_name, name))
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[package_name])).union(attribute_modules))
+    return __getattr__, __dir__
@@ -18,53 +18,80 @@ from __future__ import absolute_import, print_function, unicode_literals
 import six
 
 from .lib.form_data import is_iterable, is_simple_error
-from .errors import Error, InvalidDataError
+from .errors import _detail_fields, Error, ErrorDetails, InvalidDataError, ValidationError
 
 
 __all__ = [
     'error_from_exception',
     'exception_from_errors',
+    'exception_from_result',
     'exception_to_errors',
+    'LazyInvalidDataError',
 ]
 
 def error_from_exception(e, is_critical=True):
     if isinstance(e, Error):
         return e
-    d = e.details()
+    key, msg, value, context, msg_values, message_source = _detail_fields(e.details())
     return Error(
-        key=d.key(),
-        msg=d.msg(),
-        value=d.value(),
-        context=d.context(),
-        is_critical=is_critical
+        key=key,
+        msg=msg,
+        value=value,
+        context=context,
+        is_critical=is_critical,
+        msg_values=msg_values,
+        message_source=message_source,
     )
 
 
 def exception_to_errors(e):
     if e is None:
         return None
-
-    error_dict = None
-    error_list = None
-    if hasattr(e, '_error_dict') and e._error_dict:
-        error_dict = e._error_dict
-    elif hasattr(e, '_error_list') and e._error_list:
-        error_list = e._error_list
-
+    error_dict, error_list = _nested_errors(e)
     if (not error_dict) and (not error_list):
         assert isinstance(e, (Exception, Error)), 'not a single exception: %r' % (e,)
         return error_from_exception(e)
-    elif error_dict:
-        error_info = dict()
-        for field, error in error_dict.items():
-            error_info[field] = exception_to_errors(error)
-        return error_info
-    else: # error_list
-        error_info_list = []
-        for error in error_list:
-            error_info = exception_to_errors(error)
-            error_info_list.append(error_info)
-        return error_info_list
+
+    # the conversion uses an explicit stack (instead of recursion) so deeply
+    # nested errors can not exceed Python's recursion limit. Only nested
+    # containers are put on the stack, simple errors are converted directly.
+    root = {}
+    stack = [(root, None, error_dict, error_list)]
+    while stack:
+        container, slot, error_dict, error_list = stack.pop()
+        if error_dict:
+            error_info = {}
+            children = error_dict.items()
+        else:
+            error_info = [None] * len(error_list)
+            children = enumerate(error_list)
+        container[slot] = error_info
+        for key, error in children:
+            if error is None:
+                error_info[key] = None
+                continue
+            nested_dict, nested_list = _nested_errors(error)
+            if nested_dict or nested_list:
+                # reserve the slot to preserve the order of the keys
+                error_info[key] = None
+                stack.append((error_info, key, nested_dict, nested_list))
+            else:
+                assert isinstance(error, (Exception, Error)), 'not a single exception: %r' % (error,)
+                error_info[key] = error_from_exception(error)
+    return root[None]
+
+def _nested_errors(e):
+    if isinstance(e, InvalidDataError):
+        error_dict = e._error_dict or None
+        error_list = (not error_dict) and e._error_list or None
+        return error_dict, error_list
+    elif isinstance(e, Error):
+        return None, None
+    if getattr(e, '_error_dict', None):
+        return e._error_dict, None
+    elif getattr(e, '_error_list', None):
+        return None, e._error_list
+    return None, None
 
 
 def exception_from_error(error, error_dict=None, error_list=()):
@@ -73,63 +100,16 @@ def exception_from_error(error, error_dict=None, error_list=()):
     return InvalidDataError(
         error.message, error.value, error.key, error.context,
         error_dict=error_dict,
-        error_list=error_list
+        error_list=error_list,
+        msg_values=getattr(error, 'msg_values', None),
+        message_source=getattr(error, 'message_source', None),
     )
 
 def exception_from_error_dict(error_dict):
-    first_exc = None
-    _error_dict = {}
-    for field_name, field_errors in error_dict.items():
-        if not field_errors:
-            continue
-        if isinstance(field_errors, dict):
-            exc = exception_from_error_dict(field_errors)
-        else:
-            first_error = field_errors[0]
-            # We need to differentiate between a list of errors referring
-            # to the same (simple) field and a list of errors referring to
-            # a list of fields. We can't deduct that from the container (tuple).
-            if is_simple_error(first_error):
-                exc = exception_from_errors(first_error)
-            else:
-                exc = exception_from_errors(field_errors)
-        if first_exc is None:
-            first_exc = exc
-        _error_dict[field_name] = exc
-
-    assert first_exc is not None, 'no error found?'
-    first_error = error_from_exception(first_exc)
-    return exception_from_error(first_error, error_dict=_error_dict)
+    return _build_exception(_ERROR_DICT, error_dict)
 
 def exception_from_error_list(errors):
-    first_exc = None
-    error_list = []
-    for item_errors in errors:
-        if is_simple_error(item_errors):
-            exc = exception_from_error(item_errors)
-        elif not item_errors: # None, (), {}
-            exc = None
-        elif isinstance(item_errors, dict):
-            exc = exception_from_error_dict(item_errors)
-        else:
-            if is_simple_error(item_errors):
-                error = item_errors
-            elif is_iterable(item_errors) and not isinstance(item_errors, six.string_types):
-                error = item_errors[0]
-            else:
-                raise ValueError('should not reach this.')
-
-            errors_ = [exception_from_error(error)]
-            exc = exception_from_error(error, error_list=errors_)
-
-        if (exc is not None) and (first_exc is None):
-            first_exc = exc
-        error_list.append(exc)
-
-    if first_exc is None:
-        return None
-    first_error = error_from_exception(first_exc)
-    return exception_from_error(first_error, error_list=tuple(error_list))
+    return _build_exception(_ERROR_LIST, errors)
 
 def exception_from_errors(errors):
     if is_simple_error(errors):
@@ -138,3 +118,189 @@ def exception_from_errors(errors):
         return exception_from_error_dict(errors)
     else:
         return exception_from_error_list(errors)
+
+
+# node types for "_build_exception()"
+_NO_ERROR, _ERROR, _WRAPPED_ERROR, _ERROR_DICT, _ERROR_LIST = range(5)
+
+def _build_exception(kind, errors):
+    """Convert (possibly nested) error dicts/lists to an InvalidDataError.
+
+    Each exception needs the details of its first child error so the errors
+    are collected first (parents always before their children) and then
+    converted in reverse order."""
+    # list of (kind, errors, [(key, child node index), ...])
+    nodes = [(kind, errors, [])]
+    position = 0
+    while position < len(nodes):
+        kind, errors, children = nodes[position]
+        position += 1
+        if kind == _ERROR_DICT:
+            for field_name, field_errors in errors.items():
+                if not field_errors:
+                    continue
+                children.append((field_name, len(nodes)))
+                nodes.append(_dict_item_node(field_errors))
+        elif kind == _ERROR_LIST:
+            for item_errors in errors:
+                children.append((None, len(nodes)))
+                nodes.append(_list_item_node(item_errors))
+
+    exceptions = [None] * len(nodes)
+    for index in range(len(nodes) - 1, -1, -1):
+        kind, errors, children = nodes[index]
+        if kind == _ERROR:
+            exc = exception_from_error(errors)
+        elif kind == _WRAPPED_ERROR:
+            errors_ = [exception_from_error(errors)]
+            exc = exception_from_error(errors, error_list=errors_)
+        elif kind == _ERROR_DICT:
+            _error_dict = {}
+            for field_name, child_index in children:
+                _error_dict[field_name] = exceptions[child_index]
+            first_exc = _first_exception(exceptions, children)
+            assert first_exc is not None, 'no error found?'
+            first_error = error_from_exception(first_exc)
+            exc = exception_from_error(first_error, error_dict=_error_dict)
+        elif kind == _ERROR_LIST:
+            error_list = tuple([exceptions[child_index] for _, child_index in children])
+            first_exc = _first_exception(exceptions, children)
+            exc = None
+            if first_exc is not None:
+                first_error = error_from_exception(first_exc)
+                exc = exception_from_error(first_error, error_list=error_list)
+        else:
+            exc = None
+        exceptions[index] = exc
+    return exceptions[0]
+
+def _first_exception(exceptions, children):
+    for _, child_index in children:
+        exc = exceptions[child_index]
+        if exc is not None:
+            return exc
+    return None
+
+def _dict_item_node(field_errors):
+    if isinstance(field_errors, dict):
+        return (_ERROR_DICT, field_errors, [])
+    first_error = field_errors[0]
+    # We need to differentiate between a list of errors referring
+    # to the same (simple) field and a list of errors referring to
+    # a list of fields. We can't deduct that from the container (tuple).
+    if is_simple_error(first_error):
+        return (_ERROR, first_error, None)
+    return (_ERROR_LIST, field_errors, [])
+
+def _list_item_node(item_errors):
+    if is_simple_error(item_errors):
+        return (_ERROR, item_errors, None)
+    elif not item_errors: # None, (), {}
+        return (_NO_ERROR, None, None)
+    elif isinstance(item_errors, dict):
+        return (_ERROR_DICT, item_errors, [])
+    elif is_iterable(item_errors) and not isinstance(item_errors, six.string_types):
+        return (_WRAPPED_ERROR, item_errors[0], None)
+    raise ValueError('should not reach this.')
+
+
+def exception_from_result(result):
+    """Return an exception for all errors in the given result container (e.g.
+    ``FormData``). Nested exceptions are only built when they are accessed
+    (see ``LazyInvalidDataError``)."""
+    exc = _lazy_exception(result.errors, result=result)
+    assert exc is not None, 'no error found?'
+    return exc
+
+def _lazy_exception(errors, result=None):
+    first_error = _first_error(errors)
+    if first_error is None:
+        return None
+    return LazyInvalidDataError(errors, first_error, result=result)
+
+def _first_error(errors):
+    """Return the first simple error in (nested) error dicts/lists (the same
+    error which "exception_from_errors()" would use for the details)."""
+    kind = _ERROR_DICT if isinstance(errors, dict) else _ERROR_LIST
+    stack = [_child_nodes(kind, errors)]
+    while stack:
+        for kind, errors, _ in stack[-1]:
+            if kind in (_ERROR, _WRAPPED_ERROR):
+                return errors
+            elif kind in (_ERROR_DICT, _ERROR_LIST):
+                stack.append(_child_nodes(kind, errors))
+                break
+        else:
+            stack.pop()
+    return None
+
+def _child_nodes(kind, errors):
+    if kind == _ERROR_DICT:
+        for field_errors in errors.values():
+            if field_errors:
+                yield _dict_item_node(field_errors)
+    else:
+        for item_errors in errors:
+            yield _list_item_node(item_errors)
+
+
+class LazyInvalidDataError(InvalidDataError):
+    """An InvalidDataError for (nested) error dicts/lists which only extracts
+    the details of the first error immediately. Nested exceptions (as returned
+    by ``error_dict()``/``errors()``/``unpack_errors()``) are built on first
+    access as many callers just look at the first error.
+
+    ``result`` is the result container (if any) which contains the errors."""
+
+    def __init__(self, errors, first_error, result=None):
+        if isinstance(first_error, InvalidDataError):
+            details = first_error.details()
+        else:
+            details = ErrorDetails(first_error.key, first_error.message,
+                                   first_error.value, first_error.context,
+                                   getattr(first_error, 'msg_values', None),
+                                   getattr(first_error, 'message_source', None))
+        ValidationError.__init__(self, details.msg())
+        self._details = details
+        self._errors = errors
+        self._nested = None
+        self.result = result
+
+    @property
+    def _error_dict(self):
+        if not isinstance(self._errors, dict):
+            return {}
+        return self._nested_exceptions()
+
+    @property
+    def _error_list(self):
+        if isinstance(self._errors, dict):
+            return ()
+        return self._nested_exceptions()
+
+    def _nested_exceptions(self):
+        nested = self._nested
+        if nested is None:
+            if isinstance(self._errors, dict):
+                nested = {}
+                for field_name, field_errors in self._errors.items():
+                    if field_errors:
+                        nested[field_name] = self._exception_for(_dict_item_node(field_errors))
+            else:
+                nested = tuple([self._exception_for(_list_item_node(item_errors)) for item_errors in self._errors])
+            self._nested = nested
+        return nested
+
+    def _exception_for(self, node):
+        kind, errors, _ = node
+        if kind == _ERROR:
+            return exception_from_error(errors)
+        elif kind == _WRAPPED_ERROR:
+            return exception_from_error(errors, error_list=[exception_from_error(errors)])
+        elif kind == _ERROR_DICT:
+            exc = _lazy_exception(errors)
+            assert exc is not None, 'no error found?'
+            return exc
+        elif kind == _ERROR_LIST:
+            return _lazy_exception(errors)
+        return None
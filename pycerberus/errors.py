@@ -6,10 +6,11 @@
 
 from __future__ import absolute_import, print_function, unicode_literals
 
-from pycerberus.lib import AttrDict
+from pycerberus.lib.form_data import localize_errors
 
 
 __all__ = [
+    'BudgetExceededError',
     'EmptyError',
     'Error',
     'InvalidArgumentsError',
@@ -34,10 +35,10 @@ class ValidationError(Exception):
 class InvalidDataError(ValidationError):
     """All exceptions which were caused by data to be validated must be derived 
     from this base class."""
-    def __init__(self, msg, value, key=None, context=None, error_dict=None, error_list=()):
+    def __init__(self, msg, value, key=None, context=None, error_dict=None, error_list=(),
+                 msg_values=None, message_source=None):
         ValidationError.__init__(self, msg)
-        self._details = AttrDict(key=lambda: key, msg=lambda: msg, 
-                                 value=lambda: value, context=lambda: context)
+        self._details = ErrorDetails(key, msg, value, context, msg_values, message_source)
         self._error_dict = error_dict or {}
         self._error_list = tuple(error_list) if (error_list is not None) else None
         if self._error_dict and self._error_list:
@@ -72,28 +73,127 @@ class InvalidDataError(ValidationError):
             return tuple(self._error_dict.values())
         return tuple([self])
     
+    def localized(self, locale):
+        """Return a copy of this exception with the message of the first error
+        (see ``details()``) in the given locale. Nested errors are not
+        changed, use ``localized_errors()`` to translate all errors."""
+        details = self._details.localized(locale)
+        if details is self._details:
+            return self
+        klass = self.__class__
+        exc = klass.__new__(klass, details.msg())
+        exc.__dict__.update(self.__dict__)
+        exc.args = (details.msg(), )
+        exc._msg = details.msg()
+        exc._details = details
+        return exc
+
+    def localized_errors(self, locale):
+        """Return all errors (like ``unpack_errors()``) with their messages in
+        the given locale without validating the input again."""
+        return localize_errors(self.unpack_errors(), locale)
+
     def unpack_errors(self):
-        if self._error_dict:
-            error_dict = {}
-            for key, error in self._error_dict.items():
-                if error is not None:
-                    error_dict[key] = error.unpack_errors()
-            return error_dict
-        elif self._error_list:
-            error_list = []
-            for error in self._error_list:
-                unpacked = None
-                if error is not None:
-                    unpacked = error.unpack_errors()
-                error_list.append(unpacked)
-            return error_list
-        return self
+        if not (self._error_dict or self._error_list):
+            return self
+        # explicit stack instead of recursion so deeply nested errors can not
+        # exceed Python's recursion limit. Only nested containers are put on
+        # the stack, simple errors are unpacked directly.
+        root = {}
+        stack = [(root, None, self)]
+        while stack:
+            container, slot, error = stack.pop()
+            if error._error_dict:
+                unpacked = {}
+                children = error._error_dict.items()
+            else:
+                unpacked = [None] * len(error._error_list)
+                children = enumerate(error._error_list)
+            container[slot] = unpacked
+            for key, e in children:
+                if e is None:
+                    continue
+                if not isinstance(e, InvalidDataError):
+                    unpacked[key] = e.unpack_errors()
+                elif e._error_dict or e._error_list:
+                    # reserve the slot to preserve the order of the keys
+                    unpacked[key] = None
+                    stack.append((unpacked, key, e))
+                else:
+                    unpacked[key] = e
+        return root[None]
+
+
+class ErrorDetails(object):
+    "Information about a single error (see ``InvalidDataError.details()``)."
+    __slots__ = ('_key', '_msg', '_value', '_context', '_msg_values', '_message_source')
+
+    def __init__(self, key, msg, value, context, msg_values=None, message_source=None):
+        self._key = key
+        self._msg = msg
+        self._value = value
+        self._context = context
+        self._msg_values = msg_values or {}
+        self._message_source = message_source
+
+    def key(self):
+        return self._key
+
+    def msg(self):
+        return self._msg
+
+    def value(self):
+        return self._value
+
+    def context(self):
+        return self._context
+
+    def msg_values(self):
+        return self._msg_values
+
+    def message_source(self):
+        return self._message_source
+
+    def localized(self, locale):
+        if self._message_source is None:
+            return self
+        context = _context_for_locale(self._context, locale)
+        msg = self._message_source.render(self._msg_values, context)
+        return ErrorDetails(self._key, msg, self._value, context,
+                            self._msg_values, self._message_source)
+
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            setattr(self, name, value)
+
+
+def _detail_fields(details):
+    """Return ``(key, msg, value, context, msg_values, message_source)`` for
+    the details of an exception. Custom exceptions might return other objects
+    from ``details()`` which only provide ``key()``, ``msg()``, ``value()``
+    and ``context()``."""
+    if type(details) is ErrorDetails:
+        # fast path: read the slots directly (no method calls)
+        return (details._key, details._msg, details._value, details._context,
+                details._msg_values, details._message_source)
+    fields = (details.key(), details.msg(), details.value(), details.context())
+    if isinstance(details, ErrorDetails):
+        return fields + (details.msg_values(), details.message_source())
+    return fields + (None, None)
 
 
 class EmptyError(InvalidDataError):
     pass
 
 
+class BudgetExceededError(InvalidDataError):
+    "The validation was aborted because the ValidationBudget was used up."
+    pass
+
+
 class InvalidArgumentsError(ValidationError):
     pass
 
@@ -102,13 +202,30 @@ class ThreadSafetyError(ValidationError):
     pass
 
 
+def _context_for_locale(context, locale):
+    context = dict(context or ())
+    context.pop('result', None)
+    context['locale'] = locale
+    return context
+
+
 class Error(object):
-    def __init__(self, key, msg, value, context, is_critical=True, **custom_attrs):
+    """A single validation error.
+
+    Besides the (translated) message ``msg`` an error also keeps the message
+    parameters (``msg_values``) and the untranslated message
+    (``message_source``, see ``pycerberus.i18n.MessageSource``) so the message
+    can be rendered again in a different locale (see ``localized()``).
+    """
+    def __init__(self, key, msg, value, context, is_critical=True,
+                 msg_values=None, message_source=None, **custom_attrs):
         self.key = key
         self.msg = msg
         self.value = value
         self.context = context
         self.is_critical = is_critical
+        self.msg_values = msg_values or {}
+        self.message_source = message_source
         self._custom_attrs = custom_attrs
 
     def __getattr__(self, attr_name):
@@ -129,6 +246,17 @@ class Error(object):
     def message(self):
         return self.msg
 
+    def localized(self, locale):
+        """Return a copy of this error with the message in the given locale.
+        Errors without a ``message_source`` are returned unchanged."""
+        if self.message_source is None:
+            return self
+        context = _context_for_locale(self.context, locale)
+        msg = self.message_source.render(self.msg_values, context)
+        return self.__class__(self.key, msg, self.value, context,
+            is_critical=self.is_critical, msg_values=self.msg_values,
+            message_source=self.message_source, **self._custom_attrs)
+
     def __repr__(self):
         tmpl = 'Error(key=%r, msg=%r, value=%r, context=%r, is_critical=%r%s)'
         custom_attrs = []
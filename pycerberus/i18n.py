@@ -10,17 +10,180 @@ import gettext
 import os
 import sys
 
-if sys.version_info >= (3, 9):
-    # `importlib.resources.files()` is available in Python 3.9+
-    import importlib.resources as importlib_resources
-else:
-    # Python 3.7 and 3.8 have `importlib.resources` but not `files()`,
-    # so we use the backport package `importlib_resources`.
-    import importlib_resources
 import six
 
+from pycerberus.lib.lru_cache import LRUCache
+from pycerberus.lib.message_template import compile_translation
+from pycerberus.lib.mo_catalog import MappedCatalog
 
-__all__ = ['_', 'GettextTranslation']
+
+__all__ = [
+    '_',
+    'available_locales',
+    'GettextTranslation',
+    'load_catalog',
+    'MessageSource',
+    'negotiate_locales',
+    'translate_message',
+]
+
+# The locale usually comes from user input (e.g. the "Accept-Language" header)
+# so the number of cached catalogs must be bounded.
+_catalogs = LRUCache(maxsize=64)
+
+def load_catalog(domain, localedir, locale):
+    """Return a (cached) memory-mapped catalog for the given locale or a
+    ``gettext.NullTranslations`` instance if there is no compiled catalog.
+    ``locale`` can also be a sequence of locales (e.g. as returned by
+    ``negotiate_locales()``). Like ``gettext.translation()`` all catalogs
+    for the locale(s) are chained, e.g. messages missing in "de_AT" are
+    looked up in "de".
+
+    The file system is only searched once per domain/localedir/locale."""
+    if isinstance(locale, six.string_types):
+        languages = [locale]
+    else:
+        locale = tuple(locale)
+        languages = list(locale)
+    cache_key = (domain, localedir, locale)
+    catalog = _catalogs.get(cache_key)
+    if catalog is None:
+        filenames = gettext.find(domain, localedir, languages=languages, all=True)
+        if not filenames:
+            catalog = gettext.NullTranslations()
+        else:
+            catalog = MappedCatalog(filenames[0])
+            for filename in filenames[1:]:
+                catalog.add_fallback(MappedCatalog(filename))
+        _catalogs.set(cache_key, catalog)
+    return catalog
+
+
+# Only a few (domain, localedir) pairs are used. Concurrent misses just
+# compute the same value (setting a dict item is atomic).
+_available_locales = {}
+
+def available_locales(domain='pycerberus', localedir=None):
+    """Return the locales with a compiled catalog for the given domain (in
+    the default localedir if ``localedir`` is None). The result is cached."""
+    if localedir is None:
+        localedir = _find_default_localedir()
+    cache_key = (domain, localedir)
+    locales = _available_locales.get(cache_key)
+    if locales is None:
+        locales = []
+        if os.path.isdir(localedir):
+            for name in sorted(os.listdir(localedir)):
+                mo_filename = os.path.join(localedir, name, 'LC_MESSAGES', domain + '.mo')
+                if os.path.exists(mo_filename):
+                    locales.append(name)
+        locales = tuple(locales)
+        _available_locales[cache_key] = locales
+    return locales
+
+
+# Resolved preferences (e.g. "Accept-Language" headers). Clients send many
+# different headers so the cache must be bounded as well.
+_negotiated_locales = LRUCache(maxsize=256)
+# ignore excessively long headers (only the first items are used)
+_MAX_PREFERENCES = 16
+
+def negotiate_locales(preferences, available=None, default='en'):
+    """Return a tuple of available locales ordered by the user's preferences.
+
+    ``preferences`` is either the value of an HTTP "Accept-Language" header
+    (e.g. ``"de-AT,de;q=0.9,en;q=0.5"``) or a sequence of locale names. A
+    preference like "de-AT" also matches the less specific locale "de".
+    ``available`` defaults to the locales with pycerberus catalogs plus
+    ``default`` (the language of the untranslated messages) which is also
+    returned if no preference matches. As ``default`` does not need a
+    catalog, the result never contains locales after ``default``.
+
+    The result can be put in the context directly
+    (``context['locale'] = negotiate_locales(header)``) and is cached for each
+    distinct input."""
+    if not isinstance(preferences, six.string_types):
+        preferences = tuple(preferences)
+    if available is not None:
+        available = tuple(available)
+    cache_key = (preferences, available, default)
+    locales = _negotiated_locales.get(cache_key)
+    if locales is None:
+        if available is None:
+            available = available_locales() + (default, )
+        locales = _negotiate(_parse_preferences(preferences), available, default)
+        _negotiated_locales.set(cache_key, locales)
+    return locales
+
+def _parse_preferences(preferences):
+    if not isinstance(preferences, six.string_types):
+        locales = [locale.strip() for locale in preferences[:_MAX_PREFERENCES]]
+        return [_normalize_locale(locale) for locale in locales if locale and (locale != '*')]
+    weighted = []
+    for position, item in enumerate(preferences.split(',')[:_MAX_PREFERENCES]):
+        parts = item.split(';')
+        locale = parts[0].strip()
+        quality = 1.0
+        for param in parts[1:]:
+            name, _sep, value = param.strip().partition('=')
+            if name.strip().lower() != 'q':
+                continue
+            try:
+                quality = float(value)
+            except ValueError:
+                quality = 0.0
+        if locale and (locale != '*') and (quality > 0):
+            # sort by quality (descending) but keep the order for equal values
+            weighted.append((-quality, position, _normalize_locale(locale)))
+    return [locale for _, _, locale in sorted(weighted)]
+
+def _normalize_locale(locale):
+    # "de-at" -> "de_AT" (gettext naming)
+    language, _sep, territory = locale.strip().replace('-', '_').partition('_')
+    if not territory:
+        return language.lower()
+    return language.lower() + '_' + territory.upper()
+
+def _negotiate(preferred_locales, available, default):
+    available_by_name = dict((_normalize_locale(locale), locale) for locale in available)
+    locales = []
+    for preferred in preferred_locales:
+        candidates = (preferred, preferred.partition('_')[0])
+        for candidate in candidates:
+            locale = available_by_name.get(candidate)
+            if (locale is not None) and (locale not in locales):
+                locales.append(locale)
+        if default in locales:
+            # messages are always available in the default locale (no catalog
+            # required) so less preferred locales would never be used.
+            break
+    if not locales:
+        locales.append(default)
+    return tuple(locales)
+
+
+_default_localedir = None
+
+def _find_default_localedir():
+    global _default_localedir
+    # computed once, concurrent calls just return the same value.
+    locale_dir = _default_localedir
+    if locale_dir is None:
+        if six.PY2:
+            locale_dir = os.path.join(os.path.dirname(__file__), 'locales')
+        else:
+            if sys.version_info >= (3, 9):
+                # `importlib.resources.files()` is available in Python 3.9+
+                import importlib.resources as importlib_resources
+            else:
+                # Python 3.7 and 3.8 have `importlib.resources` but not `files()`,
+                # so we use the backport package `importlib_resources`.
+                import importlib_resources
+            locale_dir = str(importlib_resources.files(__package__).joinpath('locales'))
+        if not os.path.exists(locale_dir):
+            locale_dir = os.path.normpath('/usr/share/locale')
+        _default_localedir = locale_dir
+    return locale_dir
 
 
 class GettextTranslation(object):
@@ -33,13 +196,7 @@ class GettextTranslation(object):
         return self._gettext_domain
     
     def _default_localedir(self):
-        if six.PY2:
-            locale_dir = os.path.join(os.path.dirname(__file__), 'locales')
-        else:
-            locale_dir = str(importlib_resources.files(__package__).joinpath('locales'))
-        if os.path.exists(locale_dir):
-            return locale_dir
-        return os.path.normpath('/usr/share/locale')
+        return _find_default_localedir()
     
     def _locale(self, context):
         return (context or {}).get('locale', 'en')
@@ -47,11 +204,20 @@ class GettextTranslation(object):
     def _args(self, context):
         args = self._gettext_args.copy()
         args.setdefault('localedir', self._default_localedir())
-        args['languages'] = [self._locale(context)]
+        locale = self._locale(context)
+        if isinstance(locale, six.string_types):
+            args['languages'] = [locale]
+        else:
+            # a chain of locales (e.g. from "negotiate_locales()")
+            args['languages'] = list(locale)
         return args
     
     def translation(self, context):
-        return gettext.translation(self._domain(), fallback=True, **self._args(context))
+        args = self._args(context)
+        if set(args) == set(['localedir', 'languages']):
+            return load_catalog(self._domain(), args['localedir'], args['languages'])
+        # custom arguments for "gettext.translation()" (e.g. "class_")
+        return gettext.translation(self._domain(), fallback=True, **args)
     
     def _context_from_stack(self):
         frame = sys._getframe(2)
@@ -71,6 +237,47 @@ class GettextTranslation(object):
         return getattr(translation, name)
 
 
+def translate_message(native_message, translation_parameters, context):
+    """Return the translation of ``native_message`` for the locale in the
+    context using the translation "provider" from ``translation_parameters``
+    (if present) or gettext (the default translation of validators)."""
+    provider = translation_parameters.get('provider')
+    if provider is not None:
+        domain = translation_parameters.get('domain', 'pycerberus')
+        locale = (context or {}).get('locale', 'en')
+        return provider.gettext(native_message, domain, locale)
+    # pass the context explicitly (no frame inspection)
+    translation = GettextTranslation(**translation_parameters).translation(context)
+    ugettext = getattr(translation, 'ugettext', translation.gettext)
+    return ugettext(native_message)
+
+
+class MessageSource(object):
+    """The untranslated message and the translation parameters of an error.
+
+    Errors keep this (instead of the validator) so their message can be
+    rendered in a different locale later, even after the error was pickled
+    or copied. Messages are translated with gettext or the translation
+    "provider" (custom ``translate_message()`` implementations of a validator
+    are not used)."""
+
+    def __init__(self, native_message, translation_parameters):
+        self.native_message = native_message
+        self.translation_parameters = translation_parameters
+
+    def render(self, msg_values, context):
+        native_message = self.native_message
+        translated_message = translate_message(native_message, self.translation_parameters, context)
+        return compile_translation(native_message, translated_message).render(msg_values)
+
+    def __deepcopy__(self, memo):
+        # immutable (translation providers should not be copied)
+        return self
+
+    def __repr__(self):
+        return 'MessageSource(%r, %r)' % (self.native_message, self.translation_parameters)
+
+
 # If we name that method '_' pygettext will choke on that...
 def some_name_which_is_not_reserved_by_gettext(message):
     return message
@@ -1,3 +1,29 @@
+import sys
 
-from .attribute_dict import *
-from .form_data import *
+from pycerberus.compat import lazy_module_attributes
+
+
+# The helper modules are only imported when one of their attributes is used.
+_module_attributes = {
+    '.attribute_dict': ('AttrDict', ),
+    '.form_data': ('is_result', 'localize_errors', 'FieldData', 'FormData', 'RepeatingFieldData'),
+    '.lru_cache': ('LRUCache', ),
+    '.linear_regex': ('compile_regex', 'LinearPattern', 'UnsupportedPatternError'),
+    '.message_template': ('compile_template', 'compile_translation', 'MessageTemplate'),
+    '.mo_catalog': ('MappedCatalog', ),
+    '.pattern_registry': ('pattern_registry', 'PatternRegistry'),
+    '.vectorized': ('convert_integers', 'is_numpy_available'),
+}
+__all__ = [name for names in _module_attributes.values() for name in names]
+
+if sys.version_info >= (3, 7):
+    __getattr__, __dir__ = lazy_module_attributes(__name__, _module_attributes)
+else:
+    from .attribute_dict import *
+    from .form_data import *
+    from .lru_cache import *
+    from .linear_regex import *
+    from .message_template import *
+    from .mo_catalog import *
+    from .pattern_registry import *
+    from .vectorized import *
@@ -10,7 +10,35 @@ import warnings
 from pycerberus.compat import OrderedDict
 
 
-__all__ = ['is_result', 'FieldData', 'FormData', 'RepeatingFieldData']
+__all__ = ['is_result', 'localize_errors', 'FieldData', 'FormData', 'RepeatingFieldData']
+
+class _ErrorsVersion(object):
+    """Version number of the errors (and structure) of a result tree. All
+    containers in a tree share one instance so "FormData.errors_by_path()"
+    can tell if its cached index is still valid. Changes in unrelated results
+    do not affect it (and no global lock is needed). Just like the result
+    containers themselves a tree must not be modified by several threads
+    concurrently: Schemas which process fields in parallel give every such
+    field its own version and attach the fields to the form's version after
+    all of them are done."""
+    def __init__(self):
+        self.value = 0
+
+
+def _adopt(container, errors_version):
+    "Use the errors version of the new parent for the complete subtree."
+    containers = [container]
+    while containers:
+        container = containers.pop()
+        if not hasattr(container, '_errors_version'):
+            # some other object which provides the result API
+            continue
+        container._errors_version = errors_version
+        if isinstance(container, FormData):
+            containers.extend(container.children.values())
+        elif isinstance(container, RepeatingFieldData):
+            containers.extend(container.items)
+    errors_version.value += 1
 
 def is_result(value):
     return (
@@ -45,16 +73,63 @@ def is_simple_error(e):
     return True
 
 
+def localize_errors(errors, locale):
+    """Return a copy of the (possibly nested) errors with all messages in the
+    given locale. Errors without a ``localized()`` method are kept as they
+    are. The input is not modified so results can be cached and shared."""
+    root = [errors]
+    # (list copy, container, key) - converted back to tuples at the end
+    lists = []
+    stack = [(root, 0)]
+    while stack:
+        container, key = stack.pop()
+        errors = container[key]
+        if errors is None:
+            continue
+        elif is_simple_error(errors) or isinstance(errors, Exception):
+            localized = getattr(errors, 'localized', None)
+            if localized is not None:
+                container[key] = localized(locale)
+            continue
+        elif isinstance(errors, dict):
+            errors_ = errors.__class__(errors)
+            keys = errors_.keys()
+        else:
+            errors_ = list(errors)
+            keys = range(len(errors_))
+            if not isinstance(errors, list):
+                lists.append((errors_, container, key))
+        container[key] = errors_
+        for key_ in keys:
+            stack.append((errors_, key_))
+    # nested lists were added after their parents so the innermost lists are
+    # converted first.
+    for errors_, container, key in reversed(lists):
+        container[key] = tuple(errors_)
+    return root[0]
+
+
 class undefined(object):
     pass
 
 class FieldData(object):
     def __init__(self, value=None, initial_value=None, errors=(), meta=None):
+        self._errors_version = _ErrorsVersion()
         self.value = value
         self.initial_value = initial_value
-        self.errors = errors
+        # no need to use the property (new container, nothing to invalidate)
+        self._errors = errors
         self.meta = meta if (meta is not None) else {}
 
+    @property
+    def errors(self):
+        return self._errors
+
+    @errors.setter
+    def errors(self, errors):
+        self._errors = errors
+        self._errors_version.value += 1
+
     def copy(self, memo=None):
         klass = self.__class__
         value_ = deepcopy(self.value, memo=memo)
@@ -104,6 +179,11 @@ class FieldData(object):
         _errors.append(error)
         self.errors = tuple(_errors)
 
+    def localized_errors(self, locale):
+        """Return the errors (same structure as ``errors``) with messages in
+        the given locale without validating the input again."""
+        return localize_errors(self.errors, locale)
+
     def update(self, value=undefined, initial_value=undefined, errors=undefined, meta=undefined):
         if value is not undefined:
             self.value = value
@@ -130,10 +210,31 @@ class FieldData(object):
 
 class RepeatingFieldData(object):
     def __init__(self, child_creator):
-        self.items = []
+        self._errors_version = _ErrorsVersion()
+        self._items = []
         self.child_creator = child_creator
         self.count = 0
-        self.global_errors = ()
+        self._global_errors = ()
+
+    @property
+    def items(self):
+        return self._items
+
+    @items.setter
+    def items(self, items):
+        for item in items:
+            _adopt(item, self._errors_version)
+        self._items = items
+        self._errors_version.value += 1
+
+    @property
+    def global_errors(self):
+        return self._global_errors
+
+    @global_errors.setter
+    def global_errors(self, errors):
+        self._global_errors = errors
+        self._errors_version.value += 1
 
     def __repr__(self):
         return 'RepeatingFieldData<items=%r>' % (self.items)
@@ -165,16 +266,19 @@ class RepeatingFieldData(object):
     def errors(self):
         if not self.contains_error():
             return None
-        errors_ = []
-        for context in self.items:
-            errors_.append(context.errors or None)
-        has_field_errors = len(tuple(filter(None, errors_))) > 0
+        errors_ = [(context.errors or None) for context in self.items]
+        has_field_errors = any(errors_)
         # this is one of the places where the "global errors" concept shows its
         # ugly side.
         if (not has_field_errors) and self.global_errors:
             errors_ = self.global_errors
         return tuple(errors_)
 
+    def localized_errors(self, locale):
+        """Return the errors (same structure as ``errors``) with messages in
+        the given locale without validating the input again."""
+        return localize_errors(self.errors, locale)
+
     def update(self, value=undefined, initial_value=undefined, errors=undefined, meta=undefined):
         # LATER: meta not implemented
         values = None
@@ -203,6 +307,7 @@ class RepeatingFieldData(object):
     def _create_new_items(self, n):
         for i in range(n):
             context = self.child_creator()
+            _adopt(context, self._errors_version)
             self.items.append(context)
 
     @property
@@ -232,7 +337,8 @@ class FormData(object):
         if child_names and children:
             raise ValueError('You can not specify "children" and "child_names"')
 
-        self.children = OrderedDict()
+        self._errors_version = _ErrorsVersion()
+        self.children = _Children(self)
         if children:
             for name, child in children.items():
                 self.children[name] = child
@@ -240,12 +346,15 @@ class FormData(object):
         self.child_names = child_names or ()
         self._schema_meta = {}
         self.global_errors = ()
+        self._errors_index = None
 
     def __getattr__(self, name):
-        if name not in self.children:
+        # "children" is not set yet while unpickling
+        children = self.__dict__.get('children')
+        if (children is None) or (name not in children):
             klassname = self.__class__.__name__
             raise AttributeError('%s object has no child with name %r' % (klassname, name))
-        return self.children[name]
+        return children[name]
 
     def __repr__(self):
         return 'FormData<children=%r>' % self.children
@@ -298,9 +407,47 @@ class FormData(object):
             errors_[name] = contexts.errors
         return errors_
 
+    def localized_errors(self, locale):
+        """Return the errors (same structure as ``errors``) with messages in
+        the given locale without validating the input again, e.g. to render
+        a cached validation result for users with different languages.
+        Use ``localize_errors(form_data.global_errors, locale)`` for the
+        global errors."""
+        return localize_errors(self.errors, locale)
+
     def _set_global_errors(self, errors):
         self.global_errors = errors
 
+    @property
+    def global_errors(self):
+        return self._global_errors
+
+    @global_errors.setter
+    def global_errors(self, errors):
+        self._global_errors = errors
+        self._errors_version.value += 1
+
+    def errors_by_path(self):
+        """Return an (ordered) dict which maps the path of every field with
+        errors to its errors, e.g. ``{('addresses', 3, 'zip'): (error, )}``.
+        Global errors of nested forms/lists are stored under the path of the
+        form/list itself (global errors of this form use the path ``()``).
+
+        The index is only rebuilt if any errors changed since the last call
+        so repeated calls (e.g. while rendering a form) are cheap.
+
+        Changes are tracked when errors/items/children are assigned (e.g.
+        ``add_error()``, ``set()``, ``children[name] = ...``). In-place
+        modifications of mutable containers (e.g. ``field.errors.append()``
+        if ``errors`` is a list or ``items.append()``) are not detected, the
+        index might be stale afterwards."""
+        errors_version = self._errors_version
+        cached = self._errors_index
+        if (cached is None) or (cached[0] is not errors_version) or (cached[1] != errors_version.value):
+            cached = (errors_version, errors_version.value, _build_errors_index(self))
+            self._errors_index = cached
+        return OrderedDict(cached[2])
+
     def _set_values(self, value, initial_value, errors, meta, clear_missing):
         def value_for(child_name, values, default_value=None):
             if values is undefined:
@@ -411,3 +558,70 @@ class FormData(object):
 
     def get(self, name):
         return self.children.get(name)
+
+
+def _build_errors_index(result):
+    index = []
+    # explicit stack so deeply nested results do not hit the recursion limit
+    stack = [((), result)]
+    while stack:
+        path, result = stack.pop()
+        if isinstance(result, FieldData):
+            if result.errors:
+                index.append((path, tuple(result.errors)))
+            continue
+        if result.global_errors:
+            index.append((path, tuple(result.global_errors)))
+        if isinstance(result, FormData):
+            children = result.children.items()
+        else:
+            children = enumerate(result.items)
+        # reversed so the index contains the fields in their natural order
+        for key, child in reversed(list(children)):
+            stack.append((path + (key,), child))
+    return index
+
+
+class _Children(OrderedDict):
+    "OrderedDict which notifies about structural changes (see 'errors_by_path()')"
+    def __init__(self, form):
+        OrderedDict.__init__(self)
+        self._form = form
+
+    def __setitem__(self, key, value, *args, **kwargs):
+        OrderedDict.__setitem__(self, key, value, *args, **kwargs)
+        _adopt(value, self._form._errors_version)
+
+    def __delitem__(self, key, *args, **kwargs):
+        OrderedDict.__delitem__(self, key, *args, **kwargs)
+        self._form._errors_version.value += 1
+
+    def pop(self, *args):
+        value = OrderedDict.pop(self, *args)
+        self._form._errors_version.value += 1
+        return value
+
+    def popitem(self, *args, **kwargs):
+        item = OrderedDict.popitem(self, *args, **kwargs)
+        self._form._errors_version.value += 1
+        return item
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def clear(self):
+        OrderedDict.clear(self)
+        self._form._errors_version.value += 1
+
+    def __reduce__(self):
+        # the form might not be completely restored yet while unpickling
+        return (_restore_children, (self._form, list(self.items())))
+
+
+def _restore_children(form, items):
+    children = _Children(form)
+    for key, value in items:
+        OrderedDict.__setitem__(children, key, value)
+    return children
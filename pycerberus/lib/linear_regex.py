@@ -0,0 +1,620 @@
+# -*- coding: UTF-8 -*-
+# This file is a part of pycerberus.
+# The source code contained in this file is licensed under the MIT license.
+# See LICENSE.txt in the main project directory, for more information.
+# SPDX-License-Identifier: MIT
+"""
+A small regex engine which runs in linear time (relative to the input length)
+regardless of the pattern. Python's ``re`` module uses backtracking so some
+patterns (e.g. ``(a+)+$``) need exponential time for specific inputs.
+
+The engine compiles the pattern to a program for a "Pike VM" (Thompson NFA
+simulation which also tracks capture groups). All possible matches are
+tracked in parallel and each position of the input is processed only once.
+Priorities are preserved so the resulting match is the same as the one
+returned by ``re``.
+
+Only a subset of the ``re`` syntax is supported: literals, ``.``, character
+classes, the escapes ``\\d \\w \\s \\D \\W \\S \\b \\B \\A \\Z``, anchors
+(``^``, ``$``), capturing/non-capturing/named groups, alternation and all
+greedy/lazy quantifiers. ``compile_regex()`` raises an
+``UnsupportedPatternError`` for everything else (e.g. backreferences,
+lookarounds, inline flags). This includes repetitions of an expression which
+can match the empty string (e.g. ``(?:|a)*`` or ``(a|){2}``): ``re`` stops
+repeating after an empty iteration so the match (or the captured text) would
+differ.
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import six
+
+
+__all__ = ['compile_regex', 'LinearPattern', 'UnsupportedPatternError']
+
+class UnsupportedPatternError(ValueError):
+    pass
+
+
+# maximum number of instructions for a single pattern (counted repetitions
+# are expanded so "a{1000}{1000}" would be huge)
+MAX_PROGRAM_SIZE = 20000
+
+CHAR, ANY, SET, SPLIT, JMP, SAVE, ASSERT, MATCH = range(8)
+
+if six.PY2:
+    # Python 2 uses ASCII semantics for unicode patterns unless re.UNICODE
+    # was specified.
+    _is_digit = lambda ch: ('0' <= ch <= '9')
+    _is_word = lambda ch: ch.isalnum() and (ch < '\x80') or (ch == '_')
+    _is_space = lambda ch: ch in ' \t\n\r\f\v'
+else:
+    _is_digit = lambda ch: ch.isdecimal()
+    _is_word = lambda ch: ch.isalnum() or (ch == '_')
+    _is_space = lambda ch: ch.isspace()
+
+_CLASS_ESCAPES = {
+    'd': (_is_digit, False),
+    'D': (_is_digit, True),
+    'w': (_is_word, False),
+    'W': (_is_word, True),
+    's': (_is_space, False),
+    'S': (_is_space, True),
+}
+_CHAR_ESCAPES = {
+    'a': '\a', 'f': '\f', 'n': '\n', 'r': '\r', 't': '\t', 'v': '\v',
+}
+_HEX_ESCAPES = {'x': 2, 'u': 4, 'U': 8}
+
+
+def compile_regex(pattern, flags=0):
+    """Return a ``LinearPattern`` for the given pattern string."""
+    if flags:
+        raise UnsupportedPatternError('flags are not supported')
+    if not isinstance(pattern, six.text_type):
+        raise UnsupportedPatternError('only unicode patterns are supported')
+    parser = _Parser(pattern)
+    tree = parser.parse()
+    program = _Compiler().compile(tree)
+    return LinearPattern(pattern, program, parser.group_count, parser.group_index)
+
+
+class LinearPattern(object):
+    """Compiled pattern with an API similar to ``re`` pattern objects."""
+
+    flags = 0
+
+    def __init__(self, pattern, program, groups, groupindex):
+        self.pattern = pattern
+        self.groups = groups
+        self.groupindex = groupindex
+        self._program = program
+
+    def __repr__(self):
+        return 'LinearPattern(%r)' % (self.pattern,)
+
+    def match(self, string, pos=0):
+        return self._run(string, pos, search=False, full=False)
+
+    def fullmatch(self, string, pos=0):
+        return self._run(string, pos, search=False, full=True)
+
+    def search(self, string, pos=0):
+        return self._run(string, pos, search=True, full=False)
+
+    def _run(self, string, pos, search, full):
+        program = self._program
+        marks = [-1] * len(program)
+        n = len(string)
+        initial_captures = (None, ) * (2 * (self.groups + 1))
+        matched = None
+        threads = []
+        if not search:
+            self._add_thread(threads, marks, 0, initial_captures, string, pos)
+        for i in range(pos, n + 1):
+            if search and (matched is None):
+                # new thread with lowest priority: match at a later position
+                self._add_thread(threads, marks, 0, initial_captures, string, i)
+            if not threads:
+                if search and (matched is None):
+                    continue
+                break
+            ch = string[i] if (i < n) else None
+            next_threads = []
+            for pc, captures in threads:
+                instruction = program[pc]
+                opcode = instruction[0]
+                if opcode == MATCH:
+                    if full and (i < n):
+                        continue
+                    matched = captures
+                    # all remaining threads have a lower priority
+                    break
+                if ch is None:
+                    continue
+                if opcode == CHAR:
+                    is_match = (ch == instruction[1])
+                elif opcode == ANY:
+                    is_match = (ch != '\n')
+                else:
+                    is_match = instruction[1](ch)
+                if is_match:
+                    self._add_thread(next_threads, marks, pc + 1, captures, string, i + 1)
+            threads = next_threads
+        if matched is None:
+            return None
+        return LinearMatch(self, string, matched)
+
+    def _add_thread(self, threads, marks, pc, captures, string, i):
+        # Follow all "empty" transitions (in priority order) and add the
+        # resulting threads to the list. "marks" ensures that each instruction
+        # is used only once per input position so the work per position is
+        # bounded by the program size.
+        program = self._program
+        stack = [(pc, captures)]
+        while stack:
+            pc, captures = stack.pop()
+            if marks[pc] == i:
+                continue
+            marks[pc] = i
+            instruction = program[pc]
+            opcode = instruction[0]
+            if opcode == JMP:
+                stack.append((instruction[1], captures))
+            elif opcode == SPLIT:
+                # the preferred branch must be processed first
+                stack.append((instruction[2], captures))
+                stack.append((instruction[1], captures))
+            elif opcode == SAVE:
+                slot = instruction[1]
+                captures = captures[:slot] + (i,) + captures[slot+1:]
+                stack.append((pc + 1, captures))
+            elif opcode == ASSERT:
+                if _check_assertion(instruction[1], string, i):
+                    stack.append((pc + 1, captures))
+            else:
+                threads.append((pc, captures))
+
+
+class LinearMatch(object):
+    """Match result with an API similar to ``re`` match objects."""
+
+    def __init__(self, pattern, string, captures):
+        self.re = pattern
+        self.string = string
+        self._captures = captures
+        self.pos = 0
+
+    def __repr__(self):
+        return '<LinearMatch span=%r match=%r>' % (self.span(), self.group())
+
+    def _group_number(self, group):
+        if isinstance(group, six.string_types):
+            if group not in self.re.groupindex:
+                raise IndexError('no such group')
+            return self.re.groupindex[group]
+        if not (0 <= group <= self.re.groups):
+            raise IndexError('no such group')
+        return group
+
+    def span(self, group=0):
+        number = self._group_number(group)
+        start, end = self._captures[2*number:2*number+2]
+        if start is None:
+            return (-1, -1)
+        return (start, end)
+
+    def start(self, group=0):
+        return self.span(group)[0]
+
+    def end(self, group=0):
+        return self.span(group)[1]
+
+    def _group(self, group, default=None):
+        start, end = self.span(group)
+        if start == -1:
+            return default
+        return self.string[start:end]
+
+    def group(self, *groups):
+        if not groups:
+            return self._group(0)
+        if len(groups) == 1:
+            return self._group(groups[0])
+        return tuple(self._group(group) for group in groups)
+    __getitem__ = _group
+
+    def groups(self, default=None):
+        numbers = range(1, self.re.groups + 1)
+        return tuple(self._group(number, default) for number in numbers)
+
+    def groupdict(self, default=None):
+        groupindex = self.re.groupindex
+        return dict((name, self._group(name, default)) for name in groupindex)
+
+
+def _check_assertion(kind, string, i):
+    n = len(string)
+    if kind == '^' or kind == 'A':
+        return (i == 0)
+    elif kind == '$':
+        return (i == n) or ((i == n - 1) and (string[i] == '\n'))
+    elif kind == 'Z':
+        return (i == n)
+    is_boundary = (_is_word_at(string, i - 1) != _is_word_at(string, i))
+    if kind == 'b':
+        return is_boundary
+    return not is_boundary
+
+def _is_word_at(string, i):
+    if (i < 0) or (i >= len(string)):
+        return False
+    return _is_word(string[i])
+
+
+class _CharacterSet(object):
+    def __init__(self, chars, ranges, predicates, negated):
+        self.chars = frozenset(chars)
+        self.ranges = tuple(ranges)
+        self.predicates = tuple(predicates)
+        self.negated = negated
+
+    def __call__(self, ch):
+        is_member = (ch in self.chars)
+        if not is_member:
+            for lower, upper in self.ranges:
+                if lower <= ch <= upper:
+                    is_member = True
+                    break
+        if not is_member:
+            for predicate, negated in self.predicates:
+                if predicate(ch) != negated:
+                    is_member = True
+                    break
+        return is_member != self.negated
+
+
+# ----------------------------------------------------------------------------
+# parser: pattern string -> syntax tree (nested tuples)
+
+class _Parser(object):
+    def __init__(self, pattern):
+        self.pattern = pattern
+        self.pos = 0
+        self.group_count = 0
+        self.group_index = {}
+
+    def parse(self):
+        tree = self._parse_alternation()
+        if self.pos < len(self.pattern):
+            # unbalanced parenthesis, "re" should raise the error
+            self._unsupported('unexpected "%s"' % self.pattern[self.pos])
+        return tree
+
+    def _unsupported(self, reason):
+        raise UnsupportedPatternError('%s at position %d' % (reason, self.pos))
+
+    def _peek(self):
+        if self.pos < len(self.pattern):
+            return self.pattern[self.pos]
+        return None
+
+    def _next(self):
+        ch = self._peek()
+        if ch is None:
+            self._unsupported('unexpected end of pattern')
+        self.pos += 1
+        return ch
+
+    def _startswith(self, prefix):
+        return self.pattern.startswith(prefix, self.pos)
+
+    def _parse_alternation(self):
+        branches = [self._parse_sequence()]
+        while self._peek() == '|':
+            self.pos += 1
+            branches.append(self._parse_sequence())
+        if len(branches) == 1:
+            return branches[0]
+        return ('alt', branches)
+
+    def _parse_sequence(self):
+        items = []
+        while self._peek() not in (None, '|', ')'):
+            atom = self._parse_atom()
+            items.append(self._parse_quantifiers(atom))
+        return ('cat', items)
+
+    def _parse_quantifiers(self, atom):
+        quantifier = self._parse_quantifier()
+        if quantifier is None:
+            return atom
+        if atom[0] in ('assert', 'repeat'):
+            # "re" rejects "a**" and quantified anchors behave special
+            self._unsupported('unsupported repetition')
+        min_, max_ = quantifier
+        if ((max_ is None) or (max_ > 1)) and _can_match_empty(atom):
+            # "re" stops repeating after an empty iteration, the VM does not
+            self._unsupported('repetition of an empty match')
+        greedy = True
+        if self._peek() == '?':
+            self.pos += 1
+            greedy = False
+        elif self._peek() == '+':
+            self._unsupported('possessive quantifiers are not supported')
+        if self._parse_quantifier_lookahead():
+            self._unsupported('multiple repeat')
+        return ('repeat', atom, min_, max_, greedy)
+
+    def _parse_quantifier_lookahead(self):
+        start = self.pos
+        quantifier = self._parse_quantifier()
+        self.pos = start
+        return quantifier is not None
+
+    def _parse_quantifier(self):
+        ch = self._peek()
+        if ch == '*':
+            self.pos += 1
+            return (0, None)
+        elif ch == '+':
+            self.pos += 1
+            return (1, None)
+        elif ch == '?':
+            self.pos += 1
+            return (0, 1)
+        elif ch != '{':
+            return None
+        end = self.pattern.find('}', self.pos)
+        if end == -1:
+            return None
+        body = self.pattern[self.pos+1:end]
+        min_str, comma, max_str = body.partition(',')
+        is_number = lambda s: (s == '') or all(('0' <= c <= '9') for c in s)
+        if not (is_number(min_str) and is_number(max_str)):
+            # "{" is a literal if it does not start a valid quantifier
+            return None
+        elif (not comma) and (not min_str):
+            # "{}" is also a literal
+            return None
+        min_ = int(min_str) if min_str else 0
+        if comma:
+            max_ = int(max_str) if max_str else None
+        else:
+            max_ = min_
+        if (max_ is not None) and (min_ > max_):
+            self._unsupported('min repeat greater than max repeat')
+        self.pos = end + 1
+        return (min_, max_)
+
+    def _parse_atom(self):
+        ch = self._next()
+        if ch == '(':
+            return self._parse_group()
+        elif ch == '[':
+            return ('set', self._parse_character_set())
+        elif ch == '.':
+            return ('any',)
+        elif ch in '^$':
+            return ('assert', ch)
+        elif ch == '\\':
+            return self._parse_escape()
+        elif ch in '*+?':
+            self._unsupported('nothing to repeat')
+        elif ch == '{' and self._parse_quantifier_lookahead_at(self.pos - 1):
+            self._unsupported('nothing to repeat')
+        return ('char', ch)
+
+    def _parse_quantifier_lookahead_at(self, pos):
+        start = self.pos
+        self.pos = pos
+        quantifier = self._parse_quantifier()
+        self.pos = start
+        return quantifier is not None
+
+    def _parse_group(self):
+        name = None
+        capturing = True
+        if self._startswith('?'):
+            if self._startswith('?:'):
+                self.pos += 2
+                capturing = False
+            elif self._startswith('?P<'):
+                end = self.pattern.find('>', self.pos)
+                name = self.pattern[self.pos+3:end]
+                if (end == -1) or not name or not _is_identifier(name) or (name in self.group_index):
+                    self._unsupported('bad group name')
+                self.pos = end + 1
+            else:
+                # lookarounds, backreferences, inline flags, comments, ...
+                self._unsupported('unsupported group extension')
+        group_number = None
+        if capturing:
+            self.group_count += 1
+            group_number = self.group_count
+            if name is not None:
+                self.group_index[name] = group_number
+        tree = self._parse_alternation()
+        if self._peek() != ')':
+            self._unsupported('missing ")"')
+        self.pos += 1
+        return ('group', group_number, tree)
+
+    def _parse_escape(self):
+        ch = self._next()
+        if ch in _CLASS_ESCAPES:
+            predicate, negated = _CLASS_ESCAPES[ch]
+            return ('set', _CharacterSet((), (), ((predicate, negated),), False))
+        elif ch in 'bBAZ':
+            return ('assert', ch)
+        return ('char', self._parse_char_escape(ch))
+
+    def _parse_char_escape(self, ch):
+        if ch in _CHAR_ESCAPES:
+            return _CHAR_ESCAPES[ch]
+        elif ch in _HEX_ESCAPES:
+            length = _HEX_ESCAPES[ch]
+            digits = self.pattern[self.pos:self.pos+length]
+            if (len(digits) != length) or not all(d in '0123456789abcdefABCDEF' for d in digits):
+                self._unsupported('bad escape')
+            self.pos += length
+            return six.unichr(int(digits, 16))
+        elif ch.isalnum():
+            # backreferences, octal escapes and unknown escapes
+            self._unsupported('unsupported escape "\\%s"' % ch)
+        return ch
+
+    def _parse_character_set(self):
+        negated = False
+        if self._peek() == '^':
+            self.pos += 1
+            negated = True
+        chars = []
+        ranges = []
+        predicates = []
+        is_first = True
+        while True:
+            ch = self._next()
+            if (ch == ']') and not is_first:
+                break
+            is_first = False
+            if ch == '[' and self._peek() in (':', '.', '='):
+                self._unsupported('posix character classes are not supported')
+            if ch == '\\':
+                escaped = self._next()
+                if escaped in _CLASS_ESCAPES:
+                    predicates.append(_CLASS_ESCAPES[escaped])
+                    if (self._peek() == '-') and (self.pattern[self.pos+1:self.pos+2] not in (']', '')):
+                        self._unsupported('bad character range')
+                    continue
+                ch = '\b' if (escaped == 'b') else self._parse_char_escape(escaped)
+            if (self._peek() == '-') and (self.pattern[self.pos+1:self.pos+2] not in (']', '')):
+                self.pos += 1
+                upper = self._next()
+                if upper == '\\':
+                    escaped = self._next()
+                    if escaped in _CLASS_ESCAPES:
+                        self._unsupported('bad character range')
+                    upper = '\b' if (escaped == 'b') else self._parse_char_escape(escaped)
+                if upper < ch:
+                    self._unsupported('bad character range')
+                ranges.append((ch, upper))
+            else:
+                chars.append(ch)
+        return _CharacterSet(chars, ranges, predicates, negated)
+
+
+def _can_match_empty(tree):
+    kind = tree[0]
+    if kind in ('char', 'any', 'set'):
+        return False
+    elif kind == 'assert':
+        return True
+    elif kind == 'cat':
+        return all(_can_match_empty(item) for item in tree[1])
+    elif kind == 'alt':
+        return any(_can_match_empty(branch) for branch in tree[1])
+    elif kind == 'group':
+        return _can_match_empty(tree[2])
+    # 'repeat'
+    return (tree[2] == 0) or _can_match_empty(tree[1])
+
+def _is_identifier(name):
+    first = name[0]
+    if not (first.isalpha() or first == '_'):
+        return False
+    return all(_is_word(ch) for ch in name)
+
+
+# ----------------------------------------------------------------------------
+# compiler: syntax tree -> program
+
+class _Compiler(object):
+    def __init__(self):
+        self.program = []
+
+    def compile(self, tree):
+        self._emit((SAVE, 0))
+        self._compile(tree)
+        self._emit((SAVE, 1))
+        self._emit((MATCH,))
+        return tuple(tuple(instruction) for instruction in self.program)
+
+    def _emit(self, instruction):
+        if len(self.program) >= MAX_PROGRAM_SIZE:
+            raise UnsupportedPatternError('pattern too large')
+        self.program.append(list(instruction))
+        return len(self.program) - 1
+
+    def _compile(self, tree):
+        kind = tree[0]
+        if kind == 'char':
+            self._emit((CHAR, tree[1]))
+        elif kind == 'any':
+            self._emit((ANY,))
+        elif kind == 'set':
+            self._emit((SET, tree[1]))
+        elif kind == 'assert':
+            self._emit((ASSERT, tree[1]))
+        elif kind == 'cat':
+            for item in tree[1]:
+                self._compile(item)
+        elif kind == 'alt':
+            self._compile_alternation(tree[1])
+        elif kind == 'group':
+            self._compile_group(tree[1], tree[2])
+        elif kind == 'repeat':
+            self._compile_repeat(*tree[1:])
+
+    def _compile_group(self, group_number, tree):
+        if group_number is None:
+            self._compile(tree)
+            return
+        self._emit((SAVE, 2 * group_number))
+        self._compile(tree)
+        self._emit((SAVE, 2 * group_number + 1))
+
+    def _compile_alternation(self, branches):
+        jumps = []
+        for branch in branches[:-1]:
+            split = self._emit((SPLIT, None, None))
+            self.program[split][1] = len(self.program)
+            self._compile(branch)
+            jumps.append(self._emit((JMP, None)))
+            self.program[split][2] = len(self.program)
+        self._compile(branches[-1])
+        for jump in jumps:
+            self.program[jump][1] = len(self.program)
+
+    def _split(self, preferred, other, greedy):
+        if greedy:
+            return (SPLIT, preferred, other)
+        return (SPLIT, other, preferred)
+
+    def _compile_repeat(self, tree, min_, max_, greedy):
+        if max_ is None:
+            for i in range(max(min_ - 1, 0)):
+                self._compile(tree)
+            if min_ > 0:
+                # "x+": body followed by a split back to the body
+                start = len(self.program)
+                self._compile(tree)
+                split = self._emit((SPLIT, None, None))
+                self.program[split] = list(self._split(start, split + 1, greedy))
+                return
+            # "x*"
+            split = self._emit((SPLIT, None, None))
+            self._compile(tree)
+            self._emit((JMP, split))
+            self.program[split] = list(self._split(split + 1, len(self.program), greedy))
+            return
+
+        for i in range(min_):
+            self._compile(tree)
+        splits = []
+        for i in range(max_ - min_):
+            splits.append(self._emit((SPLIT, None, None)))
+            self._compile(tree)
+        end = len(self.program)
+        for split in splits:
+            self.program[split] = list(self._split(split + 1, end, greedy))
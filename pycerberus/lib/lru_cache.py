@@ -0,0 +1,105 @@
+# -*- coding: UTF-8 -*-
+# This file is a part of pycerberus.
+# The source code contained in this file is licensed under the MIT license.
+# See LICENSE.txt in the main project directory, for more information.
+# SPDX-License-Identifier: MIT
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import threading
+
+from pycerberus.compat import OrderedDict
+
+
+__all__ = ['LRUCache']
+
+
+class LRUCache(object):
+    """A thread-safe mapping which holds at most ``maxsize`` items and evicts
+    the least recently used item when it runs full.
+
+    ``maxsize=None`` disables eviction altogether. The cache also counts hits,
+    misses and evictions (see ``stats()``)."""
+
+    def __init__(self, maxsize=128):
+        if (maxsize is not None) and (maxsize < 0):
+            raise ValueError('maxsize must not be negative (got %r)' % (maxsize,))
+        self.maxsize = maxsize
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self):
+        with self._lock:
+            return len(self._items)
+
+    def __contains__(self, key):
+        with self._lock:
+            return (key in self._items)
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value = self._items.pop(key)
+            except KeyError:
+                self._misses += 1
+                return default
+            # re-insert so the item becomes the "most recently used" one
+            self._items[key] = value
+            self._hits += 1
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            if self.maxsize == 0:
+                return
+            self._items.pop(key, None)
+            self._items[key] = value
+            if self.maxsize is None:
+                return
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+                self._evictions += 1
+
+    def keys(self):
+        "Return a list of all keys (least recently used first)."
+        with self._lock:
+            return list(self._items)
+
+    def pop(self, key, default=None):
+        with self._lock:
+            return self._items.pop(key, default)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def __getstate__(self):
+        # locks can not be pickled/copied (e.g. when a validator is copied
+        # with "copy.deepcopy()")
+        with self._lock:
+            state = self.__dict__.copy()
+            state['_items'] = self._items.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def stats(self):
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'evictions': self._evictions,
+                'size': len(self._items),
+                'maxsize': self.maxsize,
+                'hit_rate': (float(self._hits) / lookups) if lookups else 0.0,
+            }
@@ -0,0 +1,109 @@
+# -*- coding: UTF-8 -*-
+# This file is a part of pycerberus.
+# The source code contained in this file is licensed under the MIT license.
+# See LICENSE.txt in the main project directory, for more information.
+# SPDX-License-Identifier: MIT
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import re
+import warnings
+
+from pycerberus.lib.lru_cache import LRUCache
+
+
+__all__ = ['compile_template', 'compile_translation', 'MessageTemplate']
+
+_specifier_regex = re.compile(
+    r'%(?:\((?P<name>[^)]*)\))?'
+    r'(?P<spec>[#0\- +]*(?:\*|\d+)?(?:\.(?:\*|\d+))?[hlL]?[diouxXeEfFgGcrsa%])'
+)
+
+
+class MessageTemplate(object):
+    """A message template ("%(name)s"-style) which was parsed once into
+    literal segments and named parameter slots.
+
+    ``segments`` is a tuple of ``(literal, name, spec)`` items (``name`` and
+    ``spec`` are None for the trailing literal). Templates without parameters
+    are rendered without any formatting. Templates which can not be parsed
+    (e.g. positional "%s" parameters) are rendered with plain %-formatting
+    and have ``parameters = None``."""
+
+    __slots__ = ('template', 'segments', 'parameters', '_literal')
+
+    def __init__(self, template):
+        self.template = template
+        self.segments = _parse(template)
+        if self.segments is None:
+            self.parameters = None
+            self._literal = None
+        else:
+            self.parameters = frozenset([name for _, name, _ in self.segments if name is not None])
+            self._literal = None if self.parameters else self.segments[0][0]
+
+    def render(self, values):
+        if self._literal is not None:
+            return self._literal
+        # CPython's %-formatting is faster than joining the segments in
+        # Python (the template was validated already).
+        return self.template % values
+
+    def __repr__(self):
+        return 'MessageTemplate(%r)' % (self.template, )
+
+
+def _parse(template):
+    segments = []
+    literal = []
+    position = 0
+    for match in _specifier_regex.finditer(template):
+        chunk = template[position:match.start()]
+        if '%' in chunk:
+            # invalid format specifier
+            return None
+        literal.append(chunk)
+        position = match.end()
+        name, spec = match.group('name'), match.group('spec')
+        if spec == '%':
+            literal.append('%')
+            continue
+        elif (name is None) or ('*' in spec):
+            return None
+        segments.append((''.join(literal), name, '%' + spec))
+        literal = []
+    rest = template[position:]
+    if '%' in rest:
+        # incomplete format specifier
+        return None
+    literal.append(rest)
+    segments.append((''.join(literal), None, None))
+    return tuple(segments)
+
+
+_templates = LRUCache(maxsize=1024)
+
+def compile_template(template):
+    """Return a (cached) ``MessageTemplate`` for the given string."""
+    compiled = _templates.get(template)
+    if compiled is None:
+        compiled = MessageTemplate(template)
+        _templates.set(template, compiled)
+    return compiled
+
+
+def compile_translation(native_template, translated_template):
+    """Return the compiled translated template if it uses only parameters
+    declared by the native (untranslated) template. Otherwise issue a warning
+    and return the compiled native template so broken translations do not
+    cause errors during validation."""
+    native = compile_template(native_template)
+    if translated_template == native_template:
+        return native
+    translated = compile_template(translated_template)
+    if (native.parameters is None) or (translated.parameters is not None and
+                                       translated.parameters <= native.parameters):
+        return translated
+    msg = 'invalid translation %r for message %r (unknown parameters), using untranslated message'
+    warnings.warn(msg % (translated_template, native_template))
+    return native
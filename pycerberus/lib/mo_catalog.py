@@ -0,0 +1,119 @@
+# -*- coding: UTF-8 -*-
+# This file is a part of pycerberus.
+# The source code contained in this file is licensed under the MIT license.
+# See LICENSE.txt in the main project directory, for more information.
+# SPDX-License-Identifier: MIT
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import mmap
+import re
+import struct
+
+import six
+
+
+__all__ = ['MappedCatalog']
+
+_MO_MAGIC = 0x950412de
+_charset_regex = re.compile(br'^content-type:.*charset=([^\s;]+)', re.IGNORECASE | re.MULTILINE)
+
+
+class MappedCatalog(object):
+    """Read-only gettext catalog which memory-maps a compiled message catalog
+    (``.mo`` file) instead of parsing all messages into a dict.
+
+    Every lookup does a binary search on the (sorted) table of original
+    strings in the mapped file and only decodes the matching translation.
+    Catalogs compiled by GNU ``msgfmt`` and Babel contain sorted tables.
+
+    The class implements the subset of the ``gettext.GNUTranslations`` API
+    used by pycerberus (``gettext()``/``ugettext()``, ``add_fallback()``).
+    Plural forms and message contexts are not supported."""
+
+    def __init__(self, filename):
+        self.filename = filename
+        with open(filename, 'rb') as fp:
+            # mmap keeps its own reference to the file so we can close "fp"
+            self._data = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        self._fallback = None
+        self._parse_header()
+
+    def _parse_header(self):
+        data = self._data
+        if len(data) < 20:
+            raise ValueError('%s: file too short for a message catalog' % self.filename)
+        for byte_order in ('<', '>'):
+            if struct.unpack_from(byte_order + 'I', data, 0)[0] == _MO_MAGIC:
+                break
+        else:
+            raise ValueError('%s: bad magic number' % self.filename)
+        revision, count, originals_offset, translations_offset = \
+            struct.unpack_from(byte_order + '4I', data, 4)
+        if (revision >> 16) not in (0, 1):
+            raise ValueError('%s: unsupported revision %d' % (self.filename, revision >> 16))
+        table_end = max(originals_offset, translations_offset) + 8 * count
+        if table_end > len(data):
+            raise ValueError('%s: truncated message catalog' % self.filename)
+        self._count = count
+        self._originals_offset = originals_offset
+        self._translations_offset = translations_offset
+        # (length, offset) pair for each string
+        self._entry = struct.Struct(byte_order + 'II')
+        self._charset = self._header_charset()
+
+    def _header_charset(self):
+        index = self._find(b'')
+        if index is None:
+            return 'utf-8'
+        match = _charset_regex.search(self._string(self._translations_offset, index))
+        if match is None:
+            return 'utf-8'
+        return match.group(1).decode('ascii')
+
+    def __len__(self):
+        return self._count
+
+    def _string(self, table_offset, index):
+        length, offset = self._entry.unpack_from(self._data, table_offset + 8 * index)
+        return self._data[offset:offset+length]
+
+    def _find(self, key):
+        """Return the index of ``key`` (bytes) in the originals table or None."""
+        low = 0
+        high = self._count - 1
+        originals_offset = self._originals_offset
+        while low <= high:
+            middle = (low + high) // 2
+            original = self._string(originals_offset, middle)
+            if original < key:
+                low = middle + 1
+            elif original > key:
+                high = middle - 1
+            else:
+                return middle
+        return None
+
+    def gettext(self, message):
+        if isinstance(message, six.text_type):
+            key = message.encode(self._charset)
+        else:
+            key = message
+        index = self._find(key)
+        if index is None:
+            if self._fallback is not None:
+                return self._fallback.gettext(message)
+            return message
+        return self._string(self._translations_offset, index).decode(self._charset)
+    ugettext = gettext
+
+    def add_fallback(self, fallback):
+        """Look up messages without translation in ``fallback`` (like
+        ``gettext.NullTranslations.add_fallback()``)."""
+        if self._fallback is not None:
+            self._fallback.add_fallback(fallback)
+        else:
+            self._fallback = fallback
+
+    def close(self):
+        self._data.close()
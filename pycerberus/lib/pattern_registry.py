@@ -0,0 +1,46 @@
+# -*- coding: UTF-8 -*-
+# This file is a part of pycerberus.
+# The source code contained in this file is licensed under the MIT license.
+# See LICENSE.txt in the main project directory, for more information.
+# SPDX-License-Identifier: MIT
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import re
+
+from .lru_cache import LRUCache
+
+
+__all__ = ['pattern_registry', 'PatternRegistry']
+
+
+class PatternRegistry(object):
+    """Process-wide cache for compiled regex patterns.
+
+    ``re`` caches compiled patterns internally as well but that cache is
+    small and shared with all other code in the process so our patterns get
+    evicted frequently. The registry keeps (at most ``maxsize``) compiled
+    patterns per compile function so each pattern is usually compiled only
+    once."""
+
+    def __init__(self, maxsize=512):
+        self._cache = LRUCache(maxsize=maxsize)
+
+    def compile(self, pattern, compile_=re.compile):
+        """Return the compiled ``pattern`` (compiled by ``compile_`` if it is
+        not in the registry yet)."""
+        key = (compile_, pattern)
+        compiled = self._cache.get(key)
+        if compiled is None:
+            compiled = compile_(pattern)
+            self._cache.set(key, compiled)
+        return compiled
+
+    def stats(self):
+        return self._cache.stats()
+
+    def clear(self):
+        self._cache.clear()
+
+
+pattern_registry = PatternRegistry()
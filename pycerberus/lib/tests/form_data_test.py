@@ -9,7 +9,7 @@ from pythonic_testcase import *
 
 from pycerberus.errors import InvalidDataError
 from pycerberus.lib import AttrDict
-from ..form_data import FieldData, FormData
+from ..form_data import FieldData, FormData, RepeatingFieldData
 
 
 @pytest.fixture
@@ -272,6 +272,105 @@ class FormDataTest(PythonicTestCase):
         expected_meta = {'foo': {}, 'bar': {'quox': 'baz'}, '_schema_meta': {'quox': 21}}
         assert_equals(expected_meta, self.context.meta)
 
+    # --- errors_by_path ------------------------------------------------------
+
+    def test_can_return_errors_by_path(self):
+        foo_error = self.error('bad foo')
+        global_error = self.error('global')
+        self.context.set(errors={'foo': (foo_error, )})
+        self.context.add_errors((global_error, ))
+        zip_error = self.error('bad zip')
+        address = FormData(children={'zip': FieldData(errors=(zip_error, ))})
+        addresses = RepeatingFieldData(child_creator=FormData)
+        addresses.items = [FormData(children={'zip': FieldData()}), address]
+        self.context.children['addresses'] = addresses
+
+        expected = [
+            ((), (global_error, )),
+            (('foo', ), (foo_error, )),
+            (('addresses', 1, 'zip'), (zip_error, )),
+        ]
+        errors = self.context.errors_by_path()
+        assert_equals(expected, list(errors.items()))
+        assert_equals((zip_error, ), errors[('addresses', 1, 'zip')])
+
+    def test_updates_errors_by_path_after_changes(self):
+        assert_equals({}, self.context.errors_by_path())
+
+        error = self.error()
+        self.context.children['bar'].add_error(error)
+        assert_equals({('bar', ): (error, )}, self.context.errors_by_path())
+
+        self.context.children['baz'] = FieldData(errors=(error, ))
+        assert_equals(2, len(self.context.errors_by_path()))
+        self.context.set(errors=None)
+        assert_equals({}, self.context.errors_by_path())
+
+    def test_updates_errors_by_path_after_changes_in_nested_results(self):
+        addresses = RepeatingFieldData(child_creator=lambda: FormData(children={'zip': FieldData()}))
+        self.context.children['addresses'] = addresses
+        addresses.set(value=[{'zip': '1'}, {'zip': '2'}])
+        assert_equals({}, self.context.errors_by_path())
+
+        error = self.error()
+        addresses.items[1].children['zip'].add_error(error)
+        assert_equals({('addresses', 1, 'zip'): (error, )}, self.context.errors_by_path())
+
+    def test_does_not_detect_in_place_changes_of_errors(self):
+        # documented limitation: only assignments are tracked
+        error = self.error()
+        self.context.children['bar'].errors = [error]
+        assert_equals({('bar', ): (error, )}, self.context.errors_by_path())
+
+        self.context.children['bar'].errors.append(self.error())
+        assert_length(1, self.context.errors_by_path()[('bar', )])
+        self.context.children['bar'].errors = list(self.context.children['bar'].errors)
+        assert_length(2, self.context.errors_by_path()[('bar', )])
+
+    def test_changes_in_other_results_do_not_invalidate_errors_by_path(self):
+        self.context.children['bar'].add_error(self.error())
+        self.context.errors_by_path()
+        cached_index = self.context._errors_index
+
+        other = FormData(children={'foo': FieldData()})
+        other.children['foo'].add_error(self.error())
+        other.children['bar'] = FieldData()
+        self.context.errors_by_path()
+        assert_is(cached_index, self.context._errors_index)
+
+    # --- localized_errors ----------------------------------------------------
+
+    def test_can_return_localized_errors(self):
+        class LocalizedError(object):
+            key = 'bad'
+            value = None
+            def __init__(self, msg, locale=None):
+                self.message = msg
+                self.msg = msg
+                self.locale = locale
+                self.context = {'locale': locale}
+            def localized(self, locale):
+                return LocalizedError(self.msg, locale=locale)
+        foo_error = LocalizedError('bad foo')
+        plain_error = self.error('plain')
+        zip_error = LocalizedError('bad zip')
+        addresses = RepeatingFieldData(child_creator=FormData)
+        addresses.items = [FormData(children={'zip': FieldData()}),
+                           FormData(children={'zip': FieldData(errors=(zip_error, ))})]
+        self.context.children['addresses'] = addresses
+        self.context.children['foo'].errors = (foo_error, plain_error)
+
+        errors = self.context.localized_errors('de')
+        assert_equals(['addresses', 'foo'], sorted(errors))
+        localized_foo, same_error = errors['foo']
+        assert_equals(('bad foo', 'de'), (localized_foo.msg, localized_foo.locale))
+        assert_equals(plain_error, same_error)
+        assert_none(errors['addresses'][0])
+        localized_zip, = errors['addresses'][1]['zip']
+        assert_equals(('bad zip', 'de'), (localized_zip.msg, localized_zip.locale))
+        assert_equals(None, foo_error.locale)
+        assert_equals(None, zip_error.locale)
+
     # --- helpers -------------------------------------------------------------
 
     def error(self, message='bad input', value=None):
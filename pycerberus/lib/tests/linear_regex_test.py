@@ -0,0 +1,89 @@
+# -*- coding: UTF-8 -*-
+# This file is a part of pycerberus.
+# The source code contained in this file is licensed under the MIT license.
+# See LICENSE.txt in the main project directory, for more information.
+# SPDX-License-Identifier: MIT
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import re
+
+from pythonic_testcase import *
+
+from ..linear_regex import compile_regex, UnsupportedPatternError
+
+
+PATTERNS = (
+    r'^\d+$',
+    r'(a|ab)(c|bcd)(d*)',
+    r'(a*?)(a*)',
+    r'a{2,3}?',
+    r'x{,2}',
+    r'a{}',
+    r'(?P<first>\w+)\s(?P<last>\w+)',
+    r'(?:ab|a)(?:b|)c?',
+    r'[^abc]+',
+    r'[]a-c]+',
+    r'\bfoo\b',
+    r'\Bo',
+    r'(.*)$',
+    r'a|b|',
+    r'((a)|b)+',
+    r'(a|b)*?c',
+    r'\x41\s*[\d\W]',
+    r'\A\w+\Z',
+)
+STRINGS = (
+    '', 'a', 'aaaa', 'ab', 'abcd', 'abbc', 'abd', 'cab', 'x{}', 'a{}', 'foo bar',
+    'John Smith', 'A é', 'A 1', 'line\n', 'ba\nb', '42', '42\n',
+)
+
+
+class LinearRegexTest(PythonicTestCase):
+    def test_returns_same_matches_as_re(self):
+        for pattern in PATTERNS:
+            linear_pattern = compile_regex(pattern)
+            re_pattern = re.compile(pattern)
+            for string in STRINGS:
+                for method in ('match', 'search', 'fullmatch'):
+                    expected = self._match_info(getattr(re_pattern, method)(string))
+                    actual = self._match_info(getattr(linear_pattern, method)(string))
+                    message = '%s(%r, %r)' % (method, pattern, string)
+                    assert_equals(expected, actual, message=message)
+
+    def _match_info(self, match):
+        if match is None:
+            return None
+        return (match.span(), match.group(), match.groups(), match.groupdict())
+
+    def test_provides_named_groups(self):
+        match = compile_regex(r'(?P<key>\w+)=(?P<value>\w*)').match('foo=')
+        assert_equals('foo', match.group('key'))
+        assert_equals('', match['value'])
+        assert_equals(('foo', ''), match.group(1, 2))
+        assert_equals((4, 4), match.span('value'))
+
+    def test_matches_in_linear_time(self):
+        pattern = compile_regex(r'^(a+)+$')
+        # "re" needs exponential time here
+        assert_none(pattern.match('a' * 5000 + 'b'))
+        assert_not_none(pattern.match('a' * 5000))
+
+    def test_rejects_unsupported_patterns(self):
+        unsupported = (r'(a)\1', r'(?=a)', r'(?i)a', r'a**', r'*a', r'[\d-z]',
+                       r'(', r'a)', r'[a', r'a{3,2}', r'a{2}+')
+        for pattern in unsupported:
+            with assert_raises(UnsupportedPatternError, message=pattern):
+                compile_regex(pattern)
+
+    def test_rejects_repetitions_of_empty_matches(self):
+        # "re" stops repeating after an empty iteration, e.g. "(?:|a)*"
+        # matches only the empty string in "aa".
+        unsupported = (r'(?:|a)*', r'(a|)+', r'(?:a*)*', r'(a??){0,3}', r'(\b)+',
+                       r'(?:(?:a|)(?:b|))*')
+        for pattern in unsupported:
+            with assert_raises(UnsupportedPatternError, message=pattern):
+                compile_regex(pattern)
+        # a single optional iteration matches the same text as "re"
+        for pattern in (r'(?:|a)?', r'(a*){1}', r'(a|)b*'):
+            assert_not_none(compile_regex(pattern), message=pattern)
@@ -0,0 +1,75 @@
+# -*- coding: UTF-8 -*-
+# This file is a part of pycerberus.
+# The source code contained in this file is licensed under the MIT license.
+# See LICENSE.txt in the main project directory, for more information.
+# SPDX-License-Identifier: MIT
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import copy
+
+from pythonic_testcase import *
+
+from ..lru_cache import LRUCache
+
+
+class LRUCacheTest(PythonicTestCase):
+    def test_can_store_and_retrieve_items(self):
+        cache = LRUCache(maxsize=2)
+        cache.set('foo', 21)
+        assert_equals(21, cache.get('foo'))
+        assert_none(cache.get('bar'))
+        assert_equals(42, cache.get('bar', 42))
+
+    def test_evicts_least_recently_used_item(self):
+        cache = LRUCache(maxsize=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+
+        assert_contains('a', cache)
+        assert_not_contains('b', cache)
+        assert_contains('c', cache)
+        assert_length(2, cache)
+
+    def test_can_disable_eviction(self):
+        cache = LRUCache(maxsize=None)
+        for i in range(100):
+            cache.set(i, i)
+        assert_length(100, cache)
+
+    def test_tracks_statistics(self):
+        cache = LRUCache(maxsize=1)
+        cache.set('a', 1)
+        cache.get('a')
+        cache.get('b')
+        cache.set('b', 2)
+
+        stats = cache.stats()
+        assert_equals(1, stats['hits'])
+        assert_equals(1, stats['misses'])
+        assert_equals(1, stats['evictions'])
+        assert_equals(1, stats['size'])
+        assert_equals(0.5, stats['hit_rate'])
+
+        cache.clear()
+        assert_equals(0, cache.stats()['hits'])
+        assert_length(0, cache)
+
+    def test_can_be_copied(self):
+        cache = LRUCache(maxsize=2)
+        cache.set('a', [1])
+
+        clone = copy.deepcopy(cache)
+        clone.set('b', 2)
+        assert_equals([1], clone.get('a'))
+        assert_is_not(cache.get('a'), clone.get('a'))
+        assert_not_contains('b', cache)
+
+    def test_can_return_keys(self):
+        cache = LRUCache(maxsize=3)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        assert_equals(['b', 'a'], cache.keys())
@@ -0,0 +1,71 @@
+# -*- coding: UTF-8 -*-
+# This file is a part of pycerberus.
+# The source code contained in this file is licensed under the MIT license.
+# See LICENSE.txt in the main project directory, for more information.
+# SPDX-License-Identifier: MIT
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import warnings
+
+from pythonic_testcase import *
+
+from ..message_template import compile_template, compile_translation, MessageTemplate
+
+
+class MessageTemplateTest(PythonicTestCase):
+    def test_parses_template_into_literals_and_parameter_slots(self):
+        template = MessageTemplate('Number must be %(min)d or %(what)s.')
+        expected = (
+            ('Number must be ', 'min', '%d'),
+            (' or ', 'what', '%s'),
+            ('.', None, None),
+        )
+        assert_equals(expected, template.segments)
+        assert_equals(set(['min', 'what']), template.parameters)
+        assert_equals('Number must be 5 or more.', template.render({'min': 5, 'what': 'more'}))
+
+    def test_renders_templates_without_parameters_without_formatting(self):
+        template = MessageTemplate('100%% sure')
+        assert_equals(set(), template.parameters)
+        assert_equals('100% sure', template.render({}))
+        assert_equals('100% sure', template.render({'unused': 42}))
+
+    def test_falls_back_to_plain_formatting_for_unsupported_templates(self):
+        for template_str in ('Value "%s"', 'bad %z %(foo)s', 'width %(foo)*d', 'end %'):
+            template = MessageTemplate(template_str)
+            assert_none(template.segments, message=template_str)
+            assert_none(template.parameters, message=template_str)
+        assert_equals('Value "x"', MessageTemplate('Value "%s"').render('x'))
+
+    def test_raises_key_error_for_missing_parameters(self):
+        template = MessageTemplate('Number must be %(min)d or greater.')
+        with assert_raises(KeyError):
+            template.render({})
+
+    def test_caches_compiled_templates(self):
+        template = compile_template('%(foo)s %(bar)s')
+        assert_equals(template, compile_template('%(foo)s %(bar)s'))
+
+
+class CompileTranslationTest(PythonicTestCase):
+    def test_accepts_translations_with_declared_parameters(self):
+        native = 'Number must be %(min)d or greater.'
+        template = compile_translation(native, 'Die Zahl muss größer oder gleich %(min)d sein.')
+        assert_equals('Die Zahl muss größer oder gleich 3 sein.', template.render({'min': 3}))
+        template = compile_translation(native, 'Zahl zu klein.')
+        assert_equals('Zahl zu klein.', template.render({'min': 3}))
+
+    def test_uses_native_template_if_translation_uses_unknown_parameters(self):
+        native = 'Number must be %(min)d or greater.'
+        with warnings.catch_warnings(record=True) as caught_warnings:
+            warnings.simplefilter('always')
+            template = compile_translation(native, 'Die Zahl muss größer als %(max)d sein.')
+        assert_length(1, caught_warnings)
+        assert_equals('Number must be 3 or greater.', template.render({'min': 3}))
+
+        with warnings.catch_warnings(record=True) as caught_warnings:
+            warnings.simplefilter('always')
+            template = compile_translation(native, 'Die Zahl muss größer als %d sein.')
+        assert_length(1, caught_warnings)
+        assert_equals(native, template.template)
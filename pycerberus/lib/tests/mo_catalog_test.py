@@ -0,0 +1,79 @@
+# -*- coding: UTF-8 -*-
+# This file is a part of pycerberus.
+# The source code contained in this file is licensed under the MIT license.
+# See LICENSE.txt in the main project directory, for more information.
+# SPDX-License-Identifier: MIT
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import gettext
+import os
+import shutil
+import struct
+import tempfile
+
+from pythonic_testcase import *
+
+from ..mo_catalog import MappedCatalog
+
+
+class MappedCatalogTest(PythonicTestCase):
+    def setUp(self):
+        try:
+            from babel.messages.catalog import Catalog
+            from babel.messages.mofile import write_mo
+        except ImportError:
+            self.skipTest('Babel not installed')
+        self.tempdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tempdir)
+        catalog = Catalog(locale='de')
+        catalog.add('Value must not be empty.', 'Wert darf nicht leer sein.')
+        catalog.add('Invalid email address.', 'Ungültige E-Mail-Adresse.')
+        catalog.add('Ä', 'Umlaut')
+        for i in range(100):
+            catalog.add('message %d' % i, 'Nachricht %d' % i)
+        self.filename = os.path.join(self.tempdir, 'messages.mo')
+        with open(self.filename, 'wb') as fp:
+            write_mo(fp, catalog)
+
+    def _catalog(self):
+        catalog = MappedCatalog(self.filename)
+        self.addCleanup(catalog.close)
+        return catalog
+
+    def test_can_lookup_translations(self):
+        catalog = self._catalog()
+        assert_equals('Wert darf nicht leer sein.', catalog.gettext('Value must not be empty.'))
+        assert_equals('Ungültige E-Mail-Adresse.', catalog.ugettext('Invalid email address.'))
+        assert_equals('Umlaut', catalog.gettext('Ä'))
+        assert_equals('Nachricht 42', catalog.gettext('message 42'))
+
+    def test_returns_message_if_no_translation_exists(self):
+        catalog = self._catalog()
+        assert_equals('foo', catalog.gettext('foo'))
+        assert_equals('message 100', catalog.gettext('message 100'))
+        assert_equals('zzz', catalog.gettext('zzz'))
+
+    def test_returns_same_translations_as_gettext(self):
+        with open(self.filename, 'rb') as fp:
+            gnu_translations = gettext.GNUTranslations(fp)
+        catalog = self._catalog()
+        messages = list(gnu_translations._catalog)
+        assert_true(len(messages) > 100)
+        assert_equals(len(messages), len(catalog))
+        for message in messages + ['unknown', 'Value must not be empty']:
+            assert_equals(gnu_translations.gettext(message), catalog.gettext(message))
+
+    def test_can_add_fallback(self):
+        catalog = self._catalog()
+        fallback = gettext.NullTranslations()
+        fallback.gettext = lambda message: message.upper()
+        catalog.add_fallback(fallback)
+        assert_equals('Nachricht 42', catalog.gettext('message 42'))
+        assert_equals('UNKNOWN', catalog.gettext('unknown'))
+
+    def test_rejects_invalid_files(self):
+        with open(self.filename, 'wb') as fp:
+            fp.write(struct.pack('<5I', 0x12345678, 0, 0, 28, 28))
+        with assert_raises(ValueError):
+            MappedCatalog(self.filename)
@@ -0,0 +1,47 @@
+# -*- coding: UTF-8 -*-
+# This file is a part of pycerberus.
+# The source code contained in this file is licensed under the MIT license.
+# See LICENSE.txt in the main project directory, for more information.
+# SPDX-License-Identifier: MIT
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import re
+
+from pythonic_testcase import *
+
+from ..pattern_registry import PatternRegistry
+
+
+class PatternRegistryTest(PythonicTestCase):
+    def test_compiles_each_pattern_only_once(self):
+        compiled_patterns = []
+        def compile_(pattern):
+            compiled_patterns.append(pattern)
+            return re.compile(pattern)
+        registry = PatternRegistry()
+
+        first = registry.compile(r'\d+', compile_)
+        assert_not_none(first.match('42'))
+        assert_equals(first, registry.compile(r'\d+', compile_))
+        assert_equals([r'\d+'], compiled_patterns)
+        stats = registry.stats()
+        assert_equals(1, stats['hits'])
+        assert_equals(1, stats['misses'])
+
+    def test_separates_patterns_by_compile_function(self):
+        registry = PatternRegistry()
+        compiled = registry.compile('a+')
+        other = registry.compile('a+', lambda pattern: re.compile(pattern, re.IGNORECASE))
+
+        assert_not_equals(compiled, other)
+        assert_not_none(other.match('A'))
+
+    def test_evicts_patterns_if_registry_is_full(self):
+        registry = PatternRegistry(maxsize=1)
+        registry.compile('a')
+        registry.compile('b')
+
+        stats = registry.stats()
+        assert_equals(1, stats['size'])
+        assert_equals(1, stats['evictions'])
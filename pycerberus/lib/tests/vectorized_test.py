@@ -0,0 +1,42 @@
+# -*- coding: UTF-8 -*-
+# This file is a part of pycerberus.
+# The source code contained in this file is licensed under the MIT license.
+# See LICENSE.txt in the main project directory, for more information.
+# SPDX-License-Identifier: MIT
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+from pythonic_testcase import *
+
+from ..vectorized import convert_integers, is_numpy_available
+
+
+class ConvertIntegersTest(PythonicTestCase):
+    def setUp(self):
+        super(ConvertIntegersTest, self).setUp()
+        if not is_numpy_available():
+            self.skipTest('NumPy not installed')
+
+    def test_converts_integers_and_digit_strings(self):
+        initial_values, converted = convert_integers([1, '42', '007'])
+        assert_equals([1, '42', '007'], initial_values)
+        assert_equals([1, 42, 7], converted)
+
+    def test_leaves_strings_without_plain_digits_to_python(self):
+        values = ['1', '-5', ' 4', '', 'abc', '٣', '12345678901234567890']
+        initial_values, converted = convert_integers(values)
+        assert_equals([1, None, None, None, None, None, None], converted)
+
+    def test_checks_min_and_max(self):
+        initial_values, converted = convert_integers(['5', 10, '20'], min_value=6, max_value=15)
+        assert_equals([None, 10, None], converted)
+
+    def test_can_convert_numpy_arrays(self):
+        import numpy
+        initial_values, converted = convert_integers(numpy.arange(3))
+        assert_equals([0, 1, 2], initial_values)
+        assert_equals([0, 1, 2], converted)
+
+    def test_returns_none_for_unsupported_columns(self):
+        assert_none(convert_integers([1, None]))
+        assert_none(convert_integers([1.5, 2.5]))
@@ -0,0 +1,105 @@
+# -*- coding: UTF-8 -*-
+# This file is a part of pycerberus.
+# The source code contained in this file is licensed under the MIT license.
+# See LICENSE.txt in the main project directory, for more information.
+# SPDX-License-Identifier: MIT
+"""
+Bulk conversion of numeric columns with NumPy (optional dependency).
+
+NumPy is only imported when a column is actually converted so pycerberus does
+not pay the (significant) import costs otherwise.
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+
+__all__ = ['convert_integers', 'is_numpy_available']
+
+# strings with up to 18 decimal digits always fit into an int64
+_MAX_DIGITS = 18
+
+_numpy = False
+
+def _import_numpy():
+    global _numpy
+    if _numpy is False:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        _numpy = numpy
+    return _numpy
+
+def is_numpy_available():
+    return (_import_numpy() is not None)
+
+
+def convert_integers(values, min_value=None, max_value=None):
+    """Convert all items in ``values`` (a list of ints/strings or a 1-d NumPy
+    array) to Python ints and check the (optional) ``min_value``/``max_value``
+    with array operations.
+
+    Returns ``(initial_values, converted)`` where ``initial_values`` is a list
+    of the input items (as Python objects) and ``converted`` is a list which
+    contains either the valid int or ``None`` for each item which
+    requires closer inspection (invalid items or items which can not be
+    converted safely in bulk, e.g. strings with signs/whitespace).
+
+    Returns None if NumPy is not available or the column can not be converted
+    in bulk at all (e.g. mixed types)."""
+    numpy = _import_numpy()
+    if numpy is None:
+        return None
+    if isinstance(values, numpy.ndarray):
+        if values.ndim != 1:
+            return None
+        array = values
+        initial_values = values.tolist()
+    else:
+        initial_values = list(values)
+        try:
+            array = numpy.asarray(initial_values)
+        except (TypeError, ValueError, OverflowError):
+            return None
+    if array.ndim != 1:
+        return None
+
+    kind = array.dtype.kind
+    if kind in 'iu':
+        ints = array
+        is_valid = numpy.ones(len(array), dtype=bool)
+    elif kind == 'U':
+        ints, is_valid = _parse_decimal_strings(numpy, array)
+    else:
+        return None
+    try:
+        if min_value is not None:
+            is_valid &= (ints >= min_value)
+        if max_value is not None:
+            is_valid &= (ints <= max_value)
+    except (TypeError, OverflowError):
+        return None
+
+    converted = ints.tolist()
+    for index in numpy.flatnonzero(~is_valid).tolist():
+        converted[index] = None
+    return initial_values, converted
+
+
+def _parse_decimal_strings(numpy, array):
+    """Parse strings which only contain ASCII digits. NumPy's own parsing is
+    not used as it does not match Python's int() exactly."""
+    nr_items = len(array)
+    array = numpy.ascontiguousarray(array)
+    # one row per string, one column per code point (right padded with zeros)
+    width = array.dtype.itemsize // 4
+    codes = array.view(numpy.uint32).reshape(nr_items, width)
+    is_digit = (codes >= 0x30) & (codes <= 0x39)
+    lengths = numpy.char.str_len(array)
+    is_valid = (is_digit.sum(axis=1) == lengths) & (lengths > 0) & (lengths <= _MAX_DIGITS)
+
+    ints = numpy.zeros(nr_items, dtype=numpy.int64)
+    for column in range(min(width, _MAX_DIGITS)):
+        digits = codes[:, column].astype(numpy.int64) - 0x30
+        ints = numpy.where(is_digit[:, column], ints * 10 + digits, ints)
+    return ints, is_valid
@@ -13,9 +13,9 @@ import six
 from pycerberus.api import BaseValidator, EarlyBindForMethods, Validator
 from pycerberus.compat import OrderedDict
 from pycerberus.errors import Error, InvalidArgumentsError, InvalidDataError
-from pycerberus.error_conversion import exception_from_errors, exception_to_errors
+from pycerberus.error_conversion import exception_from_result, exception_to_errors
 from pycerberus.i18n import _
-from pycerberus.lib.form_data import is_result, FieldData, FormData
+from pycerberus.lib.form_data import _adopt, _ErrorsVersion, is_result, FieldData, FormData
 
 
 __all__ = ['SchemaValidator']
@@ -98,10 +98,21 @@ class SchemaMeta(EarlyBindForMethods):
 
 @six.add_metaclass(SchemaMeta)
 class SchemaValidator(Validator):
+    """Validate a dict of fields.
+
+    If you pass an ``executor`` (e.g. a ``concurrent.futures.ThreadPoolExecutor``
+    which is owned by the caller) all fields with ``blocking`` and
+    ``parallel_safe`` validators are processed in the executor while the
+    other fields are processed in the calling thread. Each parallel field gets
+    a shallow copy of the context. The results are always stored in the
+    field order so the result does not depend on the execution order.
+    Fields are processed sequentially if the context contains a
+    ``ValidationBudget`` (budgets are not thread-safe)."""
     def __init__(self, allow_additional_parameters=None, 
             filter_unvalidated_parameters=None, *args, **kwargs):
         self._fields = OrderedDict()
         self._formvalidators = []
+        self._executor = kwargs.pop('executor', None)
         if not hasattr(self, 'exception_if_invalid'):
             kwargs.setdefault('exception_if_invalid', True)
 
@@ -147,6 +158,17 @@ class SchemaValidator(Validator):
     def add_formvalidator(self, formvalidator):
         self._formvalidators.append(self._init_validator(formvalidator))
     
+    def copy(self):
+        clone = super(SchemaValidator, self).copy()
+        # fields/formvalidators can be added to the copy without modifying
+        # this schema (the validators themselves are shared).
+        was_frozen = clone.is_internal_state_frozen()
+        clone.set_internal_state_freeze(False)
+        clone._fields = self._fields.copy()
+        clone._formvalidators = list(self._formvalidators)
+        clone.set_internal_state_freeze(was_frozen)
+        return clone
+    
     def fieldvalidators(self):
         return self._fields.copy()
     
@@ -257,8 +279,20 @@ class SchemaValidator(Validator):
         assert id (processed_value) == id(result)
 
     def _process_field_validators(self, fields, result, context):
-        for key, validator in self.fieldvalidators().items():
-            self._process_field(key, validator, fields, context, result)
+        pending = self._submit_parallel_fields(fields, result, context)
+        try:
+            for key, validator in self.fieldvalidators().items():
+                if key in pending:
+                    continue
+                self._process_field(key, validator, fields, context, result)
+        finally:
+            # parallel fields must not modify the result after we returned
+            for future in pending.values():
+                future.exception()
+            self._attach_parallel_fields(pending, result)
+        for future in pending.values():
+            # re-raise unexpected exceptions (in field order)
+            future.result()
 
         additional_items = set(fields).difference(set(self.fieldvalidators()))
         if (not self.allow_additional_parameters) and additional_items:
@@ -278,6 +312,29 @@ class SchemaValidator(Validator):
         if result.contains_errors() and self._exception_if_invalid:
             self._raise_exception(result, context)
 
+    def _submit_parallel_fields(self, fields, result, context):
+        pending = OrderedDict()
+        if (self._executor is None) or (context.get('budget') is not None):
+            return pending
+        for key, validator in self._fields.items():
+            if not (getattr(validator, 'blocking', False) and getattr(validator, 'parallel_safe', False)):
+                continue
+            field_context = dict(context)
+            # The errors version of a result tree must not be modified by
+            # several threads so every parallel field gets its own version
+            # until all fields are done.
+            _adopt(result.children[key], _ErrorsVersion())
+            pending[key] = self._executor.submit(
+                self._process_field, key, validator, fields, field_context, result)
+        return pending
+
+    def _attach_parallel_fields(self, pending, result):
+        errors_version = getattr(result, '_errors_version', None)
+        if errors_version is None:
+            return
+        for key in pending:
+            _adopt(result.children[key], errors_version)
+
     def _process_form_validators(self, result, context):
         if result.contains_errors():
             return
@@ -303,7 +360,7 @@ class SchemaValidator(Validator):
 
     def _raise_exception(self, result, context):
         # PositionalParametersParsingSchema overrides this (and needs 'context')
-        raise exception_from_errors(result.errors)
+        raise exception_from_result(result)
 
     def set_allow_additional_parameters(self, value):
         self.allow_additional_parameters = value
@@ -6,9 +6,11 @@
 
 from __future__ import absolute_import, print_function, unicode_literals
 
-import re
+import six
 
+from pycerberus.errors import InvalidDataError
 from pycerberus.i18n import _
+from pycerberus.lib.pattern_registry import pattern_registry
 from pycerberus.schema import SchemaValidator
 
 __all__ = ['PositionalArgumentsParsingSchema']
@@ -28,17 +30,22 @@ class PositionalArgumentsParsingSchema(SchemaValidator):
             parameter_order = (first_key, second_key)
     
     By default the items are separated by comma though you can override in the
-    method ``separator_pattern()``. If there are more items than keys specified,
-    this schema will behave like any other schema (depending if you set the
-    class-level attribute ``allow_additional_parameters``).
+    method ``separator_pattern()`` (which may also return a compiled pattern).
+    If there are more items than keys specified, this schema will behave like
+    any other schema (depending if you set the class-level attribute
+    ``allow_additional_parameters``).
+
+    Use ``process_lines()`` to parse many lines (e.g. a configuration file)
+    in one go.
     """
     
     def __init__(self, *args, **kwargs):
         super(PositionalArgumentsParsingSchema, self).__init__(*args, **kwargs)
-        self.set_internal_state_freeze(False)
         self.set_allow_additional_parameters(False)
         self.set_parameter_order(getattr(self.__class__, 'parameter_order', ()))
-        self.set_internal_state_freeze(True)
+        self._separator = self._separator_regex()
+        aggregate_values = six.get_unbound_function(self.__class__.aggregate_values)
+        self._aggregates_values = (aggregate_values is not _noop_aggregate_values)
     
     def messages(self):
         return {'additional_item': _('Unknown parameter "%(additional_item)s"')}
@@ -49,12 +56,19 @@ class PositionalArgumentsParsingSchema(SchemaValidator):
     def split_parameters(self, value, context):
         arguments = []
         if len(value) > 0:
-            num_declared_fields = len(self.fieldvalidators())
-            arguments = re.split(self.separator_pattern(), value.strip(), maxsplit=num_declared_fields)
+            num_declared_fields = len(self._fields)
+            arguments = self._separator.split(value.strip(), maxsplit=num_declared_fields)
         return arguments
+
+    def _separator_regex(self):
+        pattern = self.separator_pattern()
+        if not isinstance(pattern, six.string_types):
+            # already compiled
+            return pattern
+        return pattern_registry.compile(pattern)
     
     def _parameter_names(self):
-        return list(self._parameter_order)
+        return self._parameter_order
     
     def aggregate_values(self, parameter_names, arguments, context):
         """This method can manipulate or aggregate parsed arguments. In this 
@@ -63,18 +77,21 @@ class PositionalArgumentsParsingSchema(SchemaValidator):
         return parameter_names, arguments
     
     def _map_arguments_to_named_fields(self, value, context):
+        # called for every line so avoid copying the parameter names
         parameter_names = self._parameter_names()
         arguments = self.split_parameters(value, context)
         
-        parameter_names, arguments = self.aggregate_values(parameter_names, arguments, context)
-        nr_missing_parameters = max(len(parameter_names) - len(arguments), 0)
-        arguments.extend([None] * nr_missing_parameters)
-        if len(parameter_names) < len(arguments):
-            parameter_names.append('_extra')
+        if self._aggregates_values:
+            parameter_names, arguments = self.aggregate_values(list(parameter_names), arguments, context)
+        nr_missing_parameters = len(parameter_names) - len(arguments)
+        if nr_missing_parameters > 0:
+            arguments.extend([None] * nr_missing_parameters)
+        elif nr_missing_parameters < 0:
+            parameter_names = tuple(parameter_names) + ('_extra', )
         return dict(zip(parameter_names, arguments))
     
     def set_parameter_order(self, parameter_names):
-        self._parameter_order = parameter_names
+        self._parameter_order = tuple(parameter_names)
     
     def process(self, value, context=None):
         if value is None:
@@ -82,6 +99,35 @@ class PositionalArgumentsParsingSchema(SchemaValidator):
         fields = self._map_arguments_to_named_fields(value, context or {})
         return super(PositionalArgumentsParsingSchema, self).process(fields, context=context)
 
+    def process_lines(self, lines, context=None):
+        """Parse and validate each item of ``lines`` (any iterable of strings,
+        e.g. an open file) and yield ``(line_no, value)`` tuples. Line numbers
+        start at 1, trailing line breaks are removed.
+
+        Every line is passed to ``process()`` so ``value`` is whatever it
+        returns for the line. However if the schema raises an
+        ``InvalidDataError`` for a line, that exception is yielded instead so
+        a single invalid line does not stop the processing of all remaining
+        lines. Lines are processed lazily so memory usage does not depend on
+        the number of lines.
+
+        This is a convenience for streaming input, it is not faster than
+        calling ``process()`` for each line yourself.
+
+        Each line gets a shallow copy of ``context``: A ``ValidationBudget`` in
+        the context is shared and limits the work for all lines together."""
+        process = self.process
+        for line_no, line in enumerate(lines, 1):
+            line = line.rstrip('\r\n')
+            # "process()" stores intermediate state in the context so every
+            # line needs its own copy.
+            line_context = dict(context) if context else {}
+            try:
+                value = process(line, context=line_context)
+            except InvalidDataError as e:
+                value = e
+            yield line_no, value
+
     def _raise_exception(self, result, context):
         if '_extra' in result.children:
             extra_child = result.children['_extra']
@@ -95,3 +141,5 @@ class PositionalArgumentsParsingSchema(SchemaValidator):
             extra_child.set(errors=(new_error,))
         super(PositionalArgumentsParsingSchema, self)._raise_exception(result, context)
 
+
+_noop_aggregate_values = six.get_unbound_function(PositionalArgumentsParsingSchema.aggregate_values)
@@ -0,0 +1,177 @@
+# -*- coding: UTF-8 -*-
+# This file is a part of pycerberus.
+# The source code contained in this file is licensed under the MIT license.
+# See LICENSE.txt in the main project directory, for more information.
+# SPDX-License-Identifier: MIT
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import six
+
+from pycerberus.budget import _monotonic
+from pycerberus.i18n import _find_default_localedir, load_catalog
+from pycerberus.lib.lru_cache import LRUCache
+
+
+__all__ = ['CachedTranslationProvider', 'GettextProvider', 'TranslationProvider']
+
+
+class TranslationProvider(object):
+    """Source of translated messages (e.g. gettext catalogs or a database).
+
+    Validators use a provider if their ``translation_parameters()`` contain
+    it (key ``provider``). Subclasses must implement ``translate()``,
+    ``messages()`` and ``version()`` are optional but allow bulk loading and
+    invalidation in a ``CachedTranslationProvider``."""
+
+    def translate(self, message, domain, locale):
+        """Return the translation of ``message`` or None if there is none."""
+        raise NotImplementedError('translate() must be implemented by subclasses')
+
+    def messages(self, domain, locale):
+        """Return all translations for the domain/locale as a dict (message ->
+        translation) or None if bulk loading is not supported."""
+        return None
+
+    def version(self, domain, locale):
+        """Return a value which changes whenever the translations for the
+        domain/locale change (e.g. a counter in the database). None means the
+        translations never change."""
+        return None
+
+    def gettext(self, message, domain, locale):
+        """Return the translated message (or the message itself). ``locale``
+        can also be a sequence of locales (see ``negotiate_locales()``), the
+        first available translation is used."""
+        if isinstance(locale, six.string_types):
+            locales = (locale, )
+        else:
+            locales = locale
+        for locale_ in locales:
+            translation = self.translate(message, domain, locale_)
+            if translation is not None:
+                return translation
+        return message
+
+
+class GettextProvider(TranslationProvider):
+    """Translations from compiled gettext catalogs (.mo files) in
+    ``localedir`` (default: the catalogs shipped with pycerberus)."""
+
+    def __init__(self, localedir=None):
+        self.localedir = localedir
+
+    def translate(self, message, domain, locale):
+        localedir = self.localedir or _find_default_localedir()
+        catalog = load_catalog(domain, localedir, locale)
+        translate = getattr(catalog, 'ugettext', catalog.gettext)
+        translation = translate(message)
+        if translation == message:
+            return None
+        return translation
+
+
+class _CachedTranslations(object):
+    def __init__(self, version, translations, is_complete, checked_at):
+        self.version = version
+        # message -> translation (None: no translation)
+        self.translations = translations
+        # True if all translations were loaded in bulk
+        self.is_complete = is_complete
+        self.checked_at = checked_at
+
+
+class CachedTranslationProvider(TranslationProvider):
+    """Read-through cache for a slow ``TranslationProvider`` (e.g. one which
+    queries a database).
+
+    The first lookup for a domain/locale loads all translations in bulk if the
+    provider supports it (``messages()``), otherwise each message is fetched
+    once. Translations (and missing translations) are cached until the
+    ``version()`` of the wrapped provider changes. The version is checked at
+    most every ``check_interval`` seconds. ``maxsize`` limits the number of
+    cached domain/locale pairs."""
+
+    def __init__(self, provider, maxsize=128, check_interval=60, clock=_monotonic):
+        self.provider = provider
+        self.check_interval = check_interval
+        self.clock = clock
+        self._cache = LRUCache(maxsize=maxsize)
+
+    def __getstate__(self):
+        # errors keep the provider (see "MessageSource") and can be pickled,
+        # the cached translations are loaded again after unpickling.
+        state = self.__dict__.copy()
+        state['_cache'] = state['_cache'].maxsize
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._cache = LRUCache(maxsize=state['_cache'])
+
+    def translate(self, message, domain, locale):
+        cached = self._cached_translations(domain, locale)
+        translations = cached.translations
+        if message in translations:
+            return translations[message]
+        elif cached.is_complete:
+            return None
+        translation = self.provider.translate(message, domain, locale)
+        translations[message] = translation
+        return translation
+
+    def messages(self, domain, locale):
+        return self.provider.messages(domain, locale)
+
+    def version(self, domain, locale):
+        return self.provider.version(domain, locale)
+
+    def preload(self, domain, locales):
+        """Load the translations for all given locales immediately (e.g.
+        during application startup)."""
+        for locale in locales:
+            self._load(domain, locale)
+
+    def invalidate(self, domain=None, locale=None):
+        """Drop the cached translations for the given domain and/or locale
+        (e.g. all locales of a domain if only ``domain`` is given). All
+        cached translations are dropped if neither is given."""
+        if (domain is None) and (locale is None):
+            self._cache.clear()
+            return
+        for cache_key in self._cache.keys():
+            cached_domain, cached_locale = cache_key
+            if (domain is not None) and (cached_domain != domain):
+                continue
+            elif (locale is not None) and (cached_locale != locale):
+                continue
+            self._cache.pop(cache_key)
+
+    def cache_stats(self):
+        return self._cache.stats()
+
+    def _cached_translations(self, domain, locale):
+        cached = self._cache.get((domain, locale))
+        if cached is None:
+            return self._load(domain, locale)
+        now = self.clock()
+        if (now - cached.checked_at) < self.check_interval:
+            return cached
+        version = self.provider.version(domain, locale)
+        if version != cached.version:
+            return self._load(domain, locale, version=version)
+        cached.checked_at = now
+        return cached
+
+    def _load(self, domain, locale, version=None):
+        if version is None:
+            version = self.provider.version(domain, locale)
+        messages = self.provider.messages(domain, locale)
+        cached = _CachedTranslations(
+            version      = version,
+            translations = dict(messages or ()),
+            is_complete  = (messages is not None),
+            checked_at   = self.clock(),
+        )
+        self._cache.set((domain, locale), cached)
+        return cached
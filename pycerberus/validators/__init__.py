@@ -1,11 +1,34 @@
+import sys
 
-from pycerberus.validators.basic_numbers import *
-from pycerberus.validators.checkbox import *
-from pycerberus.validators.domain import *
-from pycerberus.validators.foreach import *
-from pycerberus.validators.email import *
-from pycerberus.validators.matching_fields import *
-from pycerberus.validators.oneof import *
-from .regex import *
-from pycerberus.validators.string import *
+from pycerberus.compat import lazy_module_attributes
 
+
+# The validator modules are only imported when one of their validators is
+# used so importing a single validator is cheap.
+_module_attributes = {
+    '.basic_numbers': ('IntegerValidator', ),
+    '.cached': ('Cached', ),
+    '.checkbox': ('AgreeToConditionsCheckbox', 'BooleanCheckbox'),
+    '.domain': ('DomainNameValidator', ),
+    '.foreach': ('ForEach', ),
+    '.email': ('EmailAddressValidator', ),
+    '.matching_fields': ('MatchingFields', ),
+    '.oneof': ('OneOf', ),
+    '.regex': ('RegexValidator', ),
+    '.string': ('StringValidator', ),
+}
+__all__ = [name for names in _module_attributes.values() for name in names]
+
+if sys.version_info >= (3, 7):
+    __getattr__, __dir__ = lazy_module_attributes(__name__, _module_attributes)
+else:
+    from pycerberus.validators.basic_numbers import *
+    from pycerberus.validators.cached import *
+    from pycerberus.validators.checkbox import *
+    from pycerberus.validators.domain import *
+    from pycerberus.validators.foreach import *
+    from pycerberus.validators.email import *
+    from pycerberus.validators.matching_fields import *
+    from pycerberus.validators.oneof import *
+    from .regex import *
+    from pycerberus.validators.string import *
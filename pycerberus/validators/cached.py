@@ -0,0 +1,184 @@
+# -*- coding: UTF-8 -*-
+# This file is a part of pycerberus.
+# The source code contained in this file is licensed under the MIT license.
+# See LICENSE.txt in the main project directory, for more information.
+# SPDX-License-Identifier: MIT
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import copy
+
+import six
+
+from pycerberus.api import BaseValidator, NoValueSet
+from pycerberus.errors import _detail_fields, Error, InvalidDataError
+from pycerberus.lib.form_data import is_result, FieldData
+from pycerberus.lib.lru_cache import LRUCache
+
+
+__all__ = ['Cached']
+
+_IMMUTABLE_TYPES = frozenset(
+    (type(None), bool, int, float, complex, bytes, six.text_type, frozenset) +
+    six.integer_types
+)
+
+def _fresh(value):
+    if type(value) in _IMMUTABLE_TYPES:
+        return value
+    return copy.deepcopy(value)
+
+
+class _Outcome(object):
+    """Everything a (pure) validator did for a specific input: the return
+    value (or the raised exception) and the changes to the result container.
+    Errors are stored as plain tuples so every cache hit can build new
+    ``Error``/``InvalidDataError`` instances."""
+    def __init__(self, returns_result, value, initial_value, errors, exception):
+        self.returns_result = returns_result
+        self.value = value
+        self.initial_value = initial_value
+        self.errors = errors
+        self.exception = exception
+
+
+class Cached(BaseValidator):
+    """Memoize the outcome of a pure validator so repeated inputs (e.g.
+    country codes, enum strings) do not run ``convert()``/``validate()`` again.
+
+    The cache key is the (hashable) input value and the locale in the context.
+    Therefore the wrapped validator must not depend on any other information
+    from the context. Unhashable values, validators with compound results
+    (schemas, ``ForEach``) and calls with a ``ValidationBudget`` in the
+    context bypass the cache (the outcome depends on the remaining budget).
+
+    The cache evicts the least recently used items once it holds ``maxsize``
+    items (``maxsize=None``: no limit). Every call returns fresh objects
+    (converted values, errors and exceptions) so callers can modify them
+    safely."""
+
+    def __init__(self, validator, maxsize=1024, **kwargs):
+        if isinstance(validator, type):
+            validator = validator()
+        self._validator = validator
+        self._is_cacheable = isinstance(validator.new_result(None), FieldData)
+        self._cache = LRUCache(maxsize=maxsize)
+        # the cache is thread-safe so schemas can run the wrapped validator in
+        # parallel (if it supports that).
+        self.blocking = validator.blocking
+        self.parallel_safe = validator.parallel_safe
+        kwargs.setdefault('id', validator.id)
+        super(Cached, self).__init__(**kwargs)
+
+    def messages(self):
+        return self._validator.messages()
+
+    def cache_stats(self):
+        """Return a dict with the number of cache hits/misses/evictions, the
+        current size and the hit rate."""
+        return self._cache.stats()
+
+    def clear_cache(self):
+        self._cache.clear()
+
+    # --------------------------------------------------------------------------
+    # delegated to the wrapped validator
+
+    def new_result(self, initial_value):
+        return self._validator.new_result(initial_value)
+
+    def empty_value(self, context):
+        return self._validator.empty_value(context)
+
+    def revert_conversion(self, value, context=None):
+        return self._validator.revert_conversion(value, context=context)
+
+    # --------------------------------------------------------------------------
+    # validation
+
+    def process(self, value, context=None):
+        if context is None:
+            context = {}
+        cache_key = self._cache_key(value, context)
+        if cache_key is None:
+            return self._validator.process(value, context)
+        outcome = self._cache.get(cache_key)
+        if outcome is None:
+            outcome = self._run_validator(value, context)
+            if outcome is None:
+                # outcome can not be cached, validator must run again
+                return self._validator.process(value, context)
+            self._cache.set(cache_key, outcome)
+        return self._apply_outcome(outcome, value, context)
+
+    def _cache_key(self, value, context):
+        if (not self._is_cacheable) or (context.get('budget') is not None):
+            return None
+        cache_key = (type(value), value, context.get('locale'))
+        try:
+            hash(cache_key)
+        except TypeError:
+            return None
+        return cache_key
+
+    def _run_validator(self, value, context):
+        marker = NoValueSet
+        scratch_result = FieldData(value=marker, initial_value=marker)
+        old_result = context.get('result', NoValueSet)
+        context['result'] = scratch_result
+        exception = None
+        try:
+            validator_result = self._validator.process(value, context)
+        except InvalidDataError as e:
+            if e.error_dict() or e._error_list:
+                return None
+            key, msg, error_value, _context, msg_values, message_source = _detail_fields(e.details())
+            exception = (e.__class__, key, msg, error_value, msg_values, message_source)
+            validator_result = None
+        finally:
+            context.pop('result', None)
+            if old_result is not NoValueSet:
+                context['result'] = old_result
+
+        returns_result = is_result(validator_result)
+        if returns_result and (validator_result is not scratch_result):
+            return None
+        if returns_result or (exception is not None):
+            converted_value = scratch_result.value
+        else:
+            converted_value = validator_result
+        errors = []
+        for error in (scratch_result.errors or ()):
+            if not isinstance(error, Error):
+                return None
+            errors.append((error.key, error.msg, error.value, error.is_critical,
+                           error.msg_values, error.message_source))
+        return _Outcome(
+            returns_result = returns_result,
+            value          = converted_value,
+            initial_value  = scratch_result.initial_value,
+            errors         = tuple(errors),
+            exception      = exception,
+        )
+
+    def _apply_outcome(self, outcome, value, context):
+        result = context.get('result')
+        if result is None:
+            result = self._validator.new_result(value)
+        if outcome.initial_value is not NoValueSet:
+            result.set(initial_value=_fresh(outcome.initial_value))
+        for key, msg, error_value, is_critical, msg_values, message_source in outcome.errors:
+            error = Error(key, msg, _fresh(error_value), context, is_critical=is_critical,
+                          msg_values=msg_values, message_source=message_source)
+            result.add_error(error)
+        if outcome.exception is not None:
+            errorclass, key, msg, error_value, msg_values, message_source = outcome.exception
+            raise errorclass(msg, _fresh(error_value), key=key, context=context,
+                             msg_values=msg_values, message_source=message_source)
+        if outcome.returns_result:
+            if outcome.value is not NoValueSet:
+                result.set(value=_fresh(outcome.value))
+            return result
+        if outcome.value is NoValueSet:
+            return None
+        return _fresh(outcome.value)
@@ -6,9 +6,10 @@
 
 from __future__ import absolute_import, print_function, unicode_literals
 
-from pycerberus.errors import InvalidDataError
+import six
+
+from pycerberus.api import NoValueSet
 from pycerberus.i18n import _
-from pycerberus.lib import FieldData
 from pycerberus.validators.string import StringValidator
 
 
@@ -26,57 +27,75 @@ class BooleanCheckbox(StringValidator):
         kwargs.setdefault('strip', True)
         self.trueish = kwargs.pop('trueish', self.__class__.trueish)
         self.falsish = kwargs.pop('falsish', self.__class__.falsish)
+        self._tokens = _BoolTokens(self.trueish, self.falsish)
         super(BooleanCheckbox, self).__init__(**kwargs)
 
     def messages(self):
         return {
-            'unknown_bool': _(u'Value should be "%s" or "%s".') % (self.trueish[0], self.falsish[0])
+            'unknown_bool': _(u'Value should be "%(trueish)s" or "%(falsish)s".'),
         }
     
     def convert(self, value, context):
-        # support arbitrary data types which might be configured explicitely
-        if self._contains(value, self.trueish):
-            return True
-        elif self._contains(value, self.falsish):
-            return False
+        bool_value = self._tokens.lookup(value)
+        if bool_value is not NoValueSet:
+            return bool_value
 
         if isinstance(value, bool):
             return value
         string_value = super(BooleanCheckbox, self).convert(value, context)
         if string_value is None:
             return False
-        if string_value.lower() in self.trueish:
-            return True
-        elif string_value.lower() in self.falsish:
-            return False
-        self.new_error('unknown_bool', value, context)
-
-    def _contains(self, value, values):
-        for v in values:
-            if value is v:
-                return True
-        return False
+        msg_values = {'trueish': self.trueish[0], 'falsish': self.falsish[0]}
+        self.new_error('unknown_bool', value, context, msg_values)
 
     def empty_value(self, context):
         return False
     
     def revert_conversion(self, value, context=None):
         "Returns True for all trueish values, otherwise False."
-        old_result = None
-        if context and ('result' in context):
-            old_result = context['result']
-        if not context:
-            context = {}
-        context['result'] = FieldData()
-
+        bool_value = self._tokens.lookup(value)
+        if bool_value is NoValueSet:
+            return (value is True)
+        return bool_value
+
+
+class _BoolTokens(object):
+    """Maps all trueish/falsish values to True/False. Strings are compared
+    case-insensitively, other values must be of the same type (so 0/1 can be
+    used as trueish/falsish values without affecting True/False). Unhashable
+    values are compared by identity."""
+
+    def __init__(self, trueish, falsish):
+        self.strings = {}
+        self.others = {}
+        self.unhashable = []
+        # trueish values take precedence if a value is listed in both
+        for bool_value, tokens in ((True, trueish), (False, falsish)):
+            for token in tokens:
+                self._add(token, bool_value)
+
+    def _add(self, token, bool_value):
+        if isinstance(token, six.string_types):
+            self.strings.setdefault(token.lower(), bool_value)
+            return
+        try:
+            self.others.setdefault((type(token), token), bool_value)
+        except TypeError:
+            self.unhashable.append((token, bool_value))
+
+    def lookup(self, value):
+        """Return True/False for trueish/falsish values and NoValueSet for
+        all other values."""
+        if isinstance(value, six.string_types):
+            return self.strings.get(value.lower(), NoValueSet)
         try:
-            _valid_value = self.convert(value, context=context)
-        except InvalidDataError:
-            _valid_value = False
-        _result = context.pop('result')
-        if old_result:
-            context['result'] = old_result
-        return _valid_value if not _result.contains_error() else False
+            return self.others.get((type(value), value), NoValueSet)
+        except TypeError:
+            pass
+        for token, bool_value in self.unhashable:
+            if value is token:
+                return bool_value
+        return NoValueSet
 
 
 class AgreeToConditionsCheckbox(BooleanCheckbox):
@@ -13,6 +13,13 @@ from pycerberus.validators.string import StringValidator
 
 __all__ = ['DomainNameValidator']
 
+# a domain name consists of labels (letters, digits, dashes) separated by
+# single dots. Any domain matching this pattern is valid so we only need to
+# look for the exact error if this pattern does not match.
+_DOMAIN_LABELS = r'[a-zA-Z0-9\-]+(?:\.[a-zA-Z0-9\-]+)*'
+_VALID_DOMAIN_NAME = re.compile(r'(?:%s)?\Z' % _DOMAIN_LABELS)
+_INVALID_DOMAIN_CHARACTER = re.compile(r'[^a-zA-Z0-9\.\-]')
+
 
 class DomainNameValidator(StringValidator):
     """A validator to check if an domain name is syntactically correct."""
@@ -27,16 +34,21 @@ class DomainNameValidator(StringValidator):
     
     def validate(self, value, context):
         super(DomainNameValidator, self).validate(value, context)
+        self._validate_domain_name(value, context)
+
+    def _validate_domain_name(self, value, context):
+        if _VALID_DOMAIN_NAME.match(value) is not None:
+            return
+        domain_values = dict(domain=str(value))
         if value.startswith('.'):
-            self.raise_error('leading_dot', value, context, domain=str(value))
+            self.new_error('leading_dot', value, context, domain_values, is_critical=False)
         if value.endswith('.'):
-            self.raise_error('trailing_dot', value, context, domain=str(value))
+            self.new_error('trailing_dot', value, context, domain_values, is_critical=False)
         if '..' in value:
-            self.raise_error('double_dot', value, context, domain=str(value))
+            self.new_error('double_dot', value, context, domain_values, is_critical=False)
         
-        match = re.search(r'([^a-zA-Z0-9\.\-])', value)
+        match = _INVALID_DOMAIN_CHARACTER.search(value)
         if match is not None:
-            self.raise_error('invalid_domain_character', value, context, invalid_character=str(match.group(1)), domain=str(value))
-
-
+            msg_values = dict(invalid_character=str(match.group(0)), domain=str(value))
+            self.new_error('invalid_domain_character', value, context, msg_values, is_critical=False)
 
@@ -9,10 +9,15 @@ from __future__ import absolute_import, print_function, unicode_literals
 import re
 
 from pycerberus.i18n import _
-from pycerberus.validators.domain import DomainNameValidator
+from pycerberus.validators.domain import _DOMAIN_LABELS, DomainNameValidator
 
 __all__ = ['EmailAddressValidator']
 
+# Matches all valid email addresses (the second group contains the domain).
+# Invalid addresses are checked again in more detail to find the right error.
+_VALID_EMAIL_ADDRESS = re.compile(r'([a-zA-Z0-9\.\_\-\+]*)@(%s)\Z' % _DOMAIN_LABELS)
+_INVALID_LOCALPART_CHARACTER = re.compile(r'[^a-zA-Z0-9\.\_\-\+]')
+
 
 class EmailAddressValidator(DomainNameValidator):
     """A validator to check if an email address is syntactically correct.
@@ -45,9 +50,16 @@ class EmailAddressValidator(DomainNameValidator):
         }
     
     def validate(self, emailaddress, context):
+        match = _VALID_EMAIL_ADDRESS.match(emailaddress)
+        if match is not None:
+            # only the length checks of the StringValidator are left
+            domain = match.group(2)
+            super(DomainNameValidator, self).validate(domain, context)
+            return
         parts = emailaddress.split('@')
         if len(parts) != 2:
-            self.raise_error('single_at', emailaddress, context)
+            self.new_error('single_at', emailaddress, context, is_critical=False)
+            return
         localpart, domain = parts
         super(EmailAddressValidator, self).validate(domain, context)
         self._validate_localpart(localpart, emailaddress, context)
@@ -57,12 +69,11 @@ class EmailAddressValidator(DomainNameValidator):
     # private helpers
     
     def _validate_localpart(self, localpart, emailaddress, context):
-        match = re.search(r'([^a-zA-Z0-9\.\_\-\+])', localpart)
+        match = _INVALID_LOCALPART_CHARACTER.search(localpart)
         if match is not None:
-            values = dict(invalid_character=str(match.group(1)), emailaddress=str(emailaddress))
-            self.raise_error('invalid_email_character', localpart, context, **values)
+            values = dict(invalid_character=str(match.group(0)), emailaddress=str(emailaddress))
+            self.new_error('invalid_email_character', localpart, context, values, is_critical=False)
 
     def _validate_domain(self, domain, emailaddress, context):
         if len(domain) == 0:
-            self.raise_error('missing_domain', emailaddress, context, emailaddress=emailaddress)
-
+            self.new_error('missing_domain', emailaddress, context, dict(emailaddress=emailaddress), is_critical=False)
@@ -6,21 +6,39 @@
 
 from __future__ import absolute_import, print_function, unicode_literals
 
+import six
+
 from pycerberus.api import NoValueSet, Validator
-from pycerberus.errors import Error, InvalidArgumentsError, InvalidDataError
+from pycerberus.errors import BudgetExceededError, Error, InvalidArgumentsError, InvalidDataError
 from pycerberus.error_conversion import exception_from_errors, exception_to_errors
 from pycerberus.i18n import _
 from pycerberus.lib.form_data import is_iterable, is_result, FieldData, RepeatingFieldData
+from pycerberus.lib.vectorized import convert_integers
+from pycerberus.validators.basic_numbers import IntegerValidator
 
 
 __all__ = ['ForEach']
 
+# NumPy's overhead is only worth it for larger lists
+_MIN_VECTORIZED_ITEMS = 64
+# item types accepted by "IntegerValidator.convert()"
+_INTEGER_ITEM_TYPES = (int, ) + six.string_types
+
 class ForEach(Validator):
     """Apply a validator to every item of an iterable (like map). Also you
-    can specify the allowed min/max number of items in that iterable."""
+    can specify the allowed min/max number of items in that iterable.
+
+    If NumPy is installed, ``ForEach(IntegerValidator(...))`` converts larger
+    lists (and NumPy string arrays) in bulk. Only invalid items are processed
+    one by one (to build the errors). Items are accepted/rejected exactly
+    like with item-by-item validation (e.g. NumPy integers are not accepted
+    by the IntegerValidator). Set ``vectorize=False`` to disable that."""
     
-    def __init__(self, validator, min_length=0, max_length=NoValueSet, **kwargs):
+    def __init__(self, validator, min_length=0, max_length=NoValueSet, vectorize=True, **kwargs):
         self._validator = self._init_validator(validator)
+        # subclasses might change the conversion so only plain
+        # IntegerValidators can use the vectorized conversion.
+        self._vectorize = vectorize and (type(self._validator) is IntegerValidator)
         self._min_length = min_length
         self._max_length = max_length
         if (self._min_length is not None) and (self._max_length is not NoValueSet):
@@ -56,15 +74,56 @@ class ForEach(Validator):
             self.new_error('too_long', values, context, msg_values={'max': self._max_length})
             values = values[:self._max_length]
 
-        field_results = []
-        for i, value in enumerate(values):
-            field_result = self._process_field(value, context)
-            field_results.append(field_result)
+        bulk_values = self._convert_in_bulk(values, context)
+        if bulk_values is not None:
+            values, converted_values = bulk_values
+            field_results = self._process_fields_with_converted_values(values, converted_values, context)
+        else:
+            field_results = self._process_fields(values, context)
         result.items = field_results
         if self._exception_if_invalid and result.contains_errors():
             raise exception_from_errors(result.errors)
         return result.value
 
+    def _process_fields(self, values, context):
+        field_results = []
+        budget = context.get('budget')
+        for value in values:
+            if (budget is not None) and budget.is_exceeded():
+                # do not process the remaining items one by one (each of them
+                # would just report the same error)
+                if self._exception_if_invalid:
+                    self.raise_error('budget_exceeded', values, context, errorclass=BudgetExceededError)
+                self.new_error('budget_exceeded', values, context)
+                break
+            field_result = self._process_field(value, context)
+            field_results.append(field_result)
+        return field_results
+
+    def _convert_in_bulk(self, values, context):
+        if (not self._vectorize) or (len(values) < _MIN_VECTORIZED_ITEMS):
+            return None
+        if context.get('budget') is not None:
+            # the budget is charged for every single item
+            return None
+        if not _has_integer_item_types(values):
+            # the IntegerValidator rejects these items (e.g. NumPy integers),
+            # the regular processing reports the errors.
+            return None
+        validator = self._validator
+        return convert_integers(values, min_value=validator.min, max_value=validator.max)
+
+    def _process_fields_with_converted_values(self, values, converted_values, context):
+        field_results = []
+        for value, converted_value in zip(values, converted_values):
+            if converted_value is None:
+                field_result = self._process_field(value, context)
+            else:
+                field_result = FieldData(initial_value=value)
+                field_result.set(value=converted_value)
+            field_results.append(field_result)
+        return field_results
+
     def _process_field(self, initial_value, context):
         field_result = self._validator.new_result(initial_value)
         list_result = context.pop('result')
@@ -103,7 +162,9 @@ class ForEach(Validator):
             if (item_errors is None) or (len(item_errors) == 0):
                 continue
             error = item_errors[0]
-            raise InvalidDataError(error.msg, error.value, error.key, context)
+            raise InvalidDataError(error.msg, error.value, error.key, context,
+                msg_values=getattr(error, 'msg_values', None),
+                message_source=getattr(error, 'message_source', None))
         return result.value
 
     # overridden from Validator
@@ -115,3 +176,15 @@ class ForEach(Validator):
             validator = validator()
         return validator
 
+
+def _has_integer_item_types(values):
+    dtype = getattr(values, 'dtype', None)
+    if dtype is not None:
+        # NumPy array
+        item_types = (dtype.type, )
+    else:
+        item_types = set(map(type, values))
+    for item_type in item_types:
+        if not issubclass(item_type, _INTEGER_ITEM_TYPES):
+            return False
+    return True
@@ -13,11 +13,12 @@ from pycerberus.i18n import _
 __all__ = ['MatchingFields']
 
 class MatchingFields(Validator):
-    exception_if_invalid = True
 
     def __init__(self, first_field, second_field, *args, **kwargs):
         self.first_field = first_field
         self.second_field = second_field
+        if not hasattr(self, 'exception_if_invalid'):
+            kwargs.setdefault('exception_if_invalid', True)
         super(MatchingFields, self).__init__(*args, **kwargs)
 
     def messages(self):
@@ -26,7 +27,20 @@ class MatchingFields(Validator):
     def validate(self, values, context):
         first = values[self.first_field]
         second = values[self.second_field]
-        if first != second:
+        if first == second:
+            return
+        if self._exception_if_invalid:
             error = self.exception('mismatch', second, context)
             error_dict = {self.second_field: error}
             self.raise_error('mismatch', values, context, error_dict=error_dict)
+
+        # The validator is usually used as a formvalidator so the error should
+        # be attached to the second field (if the result contains fields).
+        result = context['result']
+        field_result = getattr(result, 'children', {}).get(self.second_field)
+        if field_result is None:
+            self.new_error('mismatch', values, context, is_critical=False)
+            return
+        error = self._error('mismatch', second, context, is_critical=False)
+        field_result.add_error(error)
+
@@ -6,28 +6,189 @@
 
 from __future__ import absolute_import, print_function, unicode_literals
 
-from pycerberus.api import Validator
+import threading
+
+import six
+
+from pycerberus.api import NoValueSet, Validator
+from pycerberus.budget import _monotonic
+from pycerberus.errors import InvalidArgumentsError
 from pycerberus.i18n import _
 
 
 __all__ = ['OneOf']
 
+def _lower_case(value):
+    if isinstance(value, six.string_types):
+        return value.lower()
+    return value
+
 
 class OneOf(Validator):
-    exception_if_invalid = True
+    """Ensure that the input is one of the ``allowed_values``.
+
+    The allowed values are indexed once (if they are hashable) so lookups do
+    not depend on the number of allowed values. Changes to ``allowed_values``
+    after initialization are not visible to the validator.
+
+    If ``ignore_case`` is True, strings are compared case-insensitively. More
+    generally you can pass a ``normalize`` callable which is applied to the
+    input and to all allowed values before comparing them. In both cases the
+    validator returns the matching item from ``allowed_values``.
+
+    Instead of static ``allowed_values`` you can also pass a ``loader``
+    (callable without arguments which returns the allowed values, e.g. from a
+    database). The loader is called on first use. If you specify ``ttl``
+    (seconds), the values are reloaded in a background thread after they
+    expired. Meanwhile the validator uses the old values so only one thread
+    calls the loader at any given time. If the reload fails, the validator
+    keeps the old values until the next ``ttl`` passed."""
 
-    def __init__(self, allowed_values, **kwargs):
+    def __init__(self, allowed_values=None, ignore_case=False, normalize=None,
+                 loader=None, ttl=None, **kwargs):
+        if (allowed_values is None) == (loader is None):
+            raise InvalidArgumentsError('Please specify either "allowed_values" or "loader".')
+        if ignore_case and (normalize is not None):
+            raise InvalidArgumentsError('Please specify either "ignore_case" or "normalize".')
+        if ignore_case:
+            normalize = _lower_case
+        self._normalize = normalize
         self._allowed_values = allowed_values
+        self._index = None
+        self._loaded_values = None
+        if loader is None:
+            self._index = self._build_index(allowed_values)
+        else:
+            self._loaded_values = _LoadedValues(loader, ttl, build_index=self._build_index)
+        if not hasattr(self, 'exception_if_invalid'):
+            kwargs.setdefault('exception_if_invalid', True)
         super(OneOf, self).__init__(**kwargs)
-    
+
     def messages(self):
         return {
             'value_not_allowed': _(u'This value is not allowed.'),
         }
-    
+
+    def convert(self, value, context):
+        if self._normalize is None:
+            return value
+        allowed_value = self._lookup(value)
+        if allowed_value is NoValueSet:
+            return value
+        return allowed_value
+
     def validate(self, value, context):
-        if value in self._allowed_values:
+        if self._lookup(value) is not NoValueSet:
             return
-        self.raise_error('value_not_allowed', value, context)
+        self.new_error('value_not_allowed', value, context, is_critical=False)
+
+    def refresh(self):
+        """Reload the allowed values immediately (only if a ``loader`` was
+        specified)."""
+        if self._loaded_values is not None:
+            self._loaded_values.load()
+
+    # --------------------------------------------------------------------------
+    # private helpers
+
+    def _current_values(self):
+        if self._loaded_values is None:
+            return (self._allowed_values, self._index)
+        return self._loaded_values.get()
+
+    def _build_index(self, allowed_values):
+        """Return a dict which maps the (normalized) allowed values to the
+        original values or None if some values are not hashable."""
+        index = {}
+        try:
+            for allowed_value in allowed_values:
+                index.setdefault(self._key(allowed_value), allowed_value)
+        except TypeError:
+            return None
+        return index
+
+    def _key(self, value):
+        if self._normalize is None:
+            return value
+        return self._normalize(value)
+
+    def _lookup(self, value):
+        """Return the allowed value matching the input (or NoValueSet)."""
+        key = self._key(value)
+        allowed_values, index = self._current_values()
+        if index is not None:
+            try:
+                return index.get(key, NoValueSet)
+            except TypeError:
+                # unhashable input, use the slow path below
+                pass
+        for allowed_value in allowed_values:
+            if self._key(allowed_value) == key:
+                return allowed_value
+        return NoValueSet
+
+
+class _LoadedValues(object):
+    """Allowed values (plus index) returned by a loader with an optional
+    expiration time. As OneOf instances must not be modified after their
+    initialization all mutable state lives here."""
+
+    def __init__(self, loader, ttl, build_index, clock=_monotonic):
+        self.loader = loader
+        self.ttl = ttl
+        self.build_index = build_index
+        self.clock = clock
+        # (allowed_values, index, expiration time) - replaced atomically
+        self._data = None
+        self._load_lock = threading.Lock()
+        self._state_lock = threading.Lock()
+        self._refresh_thread = None
+
+    def get(self):
+        data = self._data
+        if data is None:
+            with self._load_lock:
+                # another thread might have loaded the values while we were
+                # waiting for the lock
+                if self._data is None:
+                    self._load()
+            data = self._data
+        allowed_values, index, expires_at = data
+        if (expires_at is not None) and (self.clock() >= expires_at):
+            self._start_background_refresh()
+        return (allowed_values, index)
+
+    def load(self):
+        with self._load_lock:
+            self._load()
+
+    def _load(self):
+        allowed_values = tuple(self.loader())
+        index = self.build_index(allowed_values)
+        self._data = (allowed_values, index, self._expiration_time())
+
+    def _expiration_time(self):
+        if self.ttl is None:
+            return None
+        return self.clock() + self.ttl
 
+    def _start_background_refresh(self):
+        with self._state_lock:
+            if self._refresh_thread is not None:
+                return
+            thread = threading.Thread(target=self._refresh)
+            thread.daemon = True
+            self._refresh_thread = thread
+        thread.start()
 
+    def _refresh(self):
+        try:
+            self.load()
+        except Exception:
+            # keep using the old values (there is nobody we could report the
+            # error to) and try again later.
+            allowed_values, index, expires_at = self._data
+            self._data = (allowed_values, index, self._expiration_time())
+        finally:
+            with self._state_lock:
+                self._refresh_thread = None
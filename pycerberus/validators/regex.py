@@ -6,31 +6,85 @@
 
 from __future__ import absolute_import, print_function, unicode_literals
 
+import inspect
 import re
 
 import six
 
+from ..api import NoValueSet
+from ..errors import InvalidArgumentsError
 from ..i18n import _
+from ..lib.linear_regex import compile_regex, UnsupportedPatternError
+from ..lib.pattern_registry import pattern_registry
 from .string import StringValidator
 
 
 __all__ = ['RegexValidator']
 
+def _compile_linear(pattern):
+    try:
+        return compile_regex(pattern)
+    except UnsupportedPatternError:
+        return re.compile(pattern)
+
+REGEX_ENGINES = {
+    're': re.compile,
+    'linear': _compile_linear,
+}
+
 class RegexValidator(StringValidator):
+    """Check that the input matches a regular expression (string pattern or
+    compiled pattern object).
+
+    String patterns are compiled by the ``regex_engine``: Either the name of
+    a registered engine (``'re'`` - the default - or ``'linear'``) or a
+    callable which compiles a pattern. The ``'linear'`` engine needs linear
+    time regardless of the input so you should use it for patterns which are
+    prone to catastrophic backtracking (ReDoS). It supports only a subset of
+    the ``re`` syntax, other patterns are compiled with ``re``.
+
+    You can pass ``regex_engine`` for a single validator or select the engine
+    globally (``RegexValidator.regex_engine = 'linear'``). Errors raised by a
+    custom callable are not caught, e.g. ``compile_regex`` (from
+    ``pycerberus.lib.linear_regex``) rejects unsupported patterns instead of
+    falling back to ``re``."""
     exception_if_invalid = False
+    regex_engine = 're'
 
     def __init__(self, regex=None, use_match_for_conversion=False, *args, **kwargs):
+        regex_engine = kwargs.pop('regex_engine', NoValueSet)
+        if regex_engine is NoValueSet:
+            regex_engine = self._class_regex_engine()
         if isinstance(regex, six.string_types):
             pattern = regex
             if not pattern.startswith('^'):
                 pattern = '^'+pattern
             if not pattern.endswith('$'):
                 pattern += '$'
-            regex = re.compile(pattern)
+            regex = self._compile(pattern, regex_engine)
         self.regex = regex
         self.use_match_for_conversion = use_match_for_conversion
         super(RegexValidator, self).__init__(*args, **kwargs)
 
+    def _class_regex_engine(self):
+        # "self.regex_engine" would turn a plain function into a bound method
+        for klass in inspect.getmro(self.__class__):
+            if 'regex_engine' in klass.__dict__:
+                regex_engine = klass.__dict__['regex_engine']
+                if isinstance(regex_engine, staticmethod):
+                    regex_engine = regex_engine.__func__
+                return regex_engine
+        return None
+
+    def _compile(self, pattern, regex_engine):
+        if callable(regex_engine):
+            compile_ = regex_engine
+        elif regex_engine in REGEX_ENGINES:
+            compile_ = REGEX_ENGINES[regex_engine]
+        else:
+            raise InvalidArgumentsError('unknown regex engine %r' % (regex_engine,))
+        return pattern_registry.compile(pattern, compile_)
+
     def messages(self):
         return {
             'bad_pattern': _(u'Input "%(input_)s" does not match the expected pattern.'),
@@ -6,8 +6,40 @@
 
 from __future__ import absolute_import, print_function, unicode_literals
 
+import glob
+import os
+
 import setuptools
+from setuptools.command.build_py import build_py
 
-if __name__ == '__main__':
-    setuptools.setup()
 
+def compile_catalogs(locales_dir, domain='pycerberus'):
+    """Compile all gettext catalogs (.po) in "locales_dir" to .mo files (same
+    as "i18n-compile-catalog.sh") and return the file names."""
+    from babel.messages.mofile import write_mo
+    from babel.messages.pofile import read_po
+
+    mo_filenames = []
+    po_pattern = os.path.join(locales_dir, '*', 'LC_MESSAGES', domain + '.po')
+    for po_filename in sorted(glob.glob(po_pattern)):
+        locale = po_filename.split(os.sep)[-3]
+        with open(po_filename, 'rb') as po_fp:
+            catalog = read_po(po_fp, locale=locale, domain=domain)
+        mo_filename = po_filename[:-len('.po')] + '.mo'
+        with open(mo_filename, 'wb') as mo_fp:
+            write_mo(mo_fp, catalog)
+        mo_filenames.append(mo_filename)
+    return mo_filenames
+
+
+class BuildWithCatalogs(build_py):
+    """Compile the message catalogs before copying the package data so
+    wheels/installations always ship the .mo files."""
+    def run(self):
+        this_dir = os.path.dirname(os.path.abspath(__file__))
+        compile_catalogs(os.path.join(this_dir, 'pycerberus', 'locales'))
+        build_py.run(self)
+
+
+if __name__ == '__main__':
+    setuptools.setup(cmdclass={'build_py': BuildWithCatalogs})
@@ -24,6 +24,28 @@ class BaseValidatorTest(PythonicTestCase):
         assert_contains(4, a.acceptable_values)
         assert_not_contains(4, b.acceptable_values)
 
+    def test_copy_uses_current_class_attributes(self):
+        class MutableValidator(BaseValidator):
+            acceptable_values = [1, 2, 3]
+        class SubValidator(MutableValidator):
+            pass
+        validator = SubValidator()
+        validator.copy()
+
+        MutableValidator.lookup = {'foo': 'bar'}
+        clone = validator.copy()
+        assert_equals({'foo': 'bar'}, clone.lookup)
+        assert_is_not(MutableValidator.lookup, clone.lookup)
+
+    def test_copy_keeps_instance_attributes(self):
+        class MutableValidator(BaseValidator):
+            acceptable_values = [1, 2, 3]
+        validator = MutableValidator()
+        validator.acceptable_values = [4]
+
+        clone = validator.copy()
+        assert_equals([4], clone.acceptable_values)
+
     def test_can_set_validator_id_via_constructor(self):
         validator = BaseValidator(id='foo')
         assert_equals('foo', validator.id)
@@ -0,0 +1,120 @@
+# -*- coding: UTF-8 -*-
+# This file is a part of pycerberus.
+# The source code contained in this file is licensed under the MIT license.
+# See LICENSE.txt in the main project directory, for more information.
+# SPDX-License-Identifier: MIT
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+from pythonic_testcase import *
+
+from pycerberus.api import Validator
+from pycerberus.budget import ValidationBudget
+from pycerberus.errors import BudgetExceededError, InvalidDataError
+from pycerberus.schema import SchemaValidator
+from pycerberus.test_util import error_keys, ValidationTest
+from pycerberus.validators import Cached, ForEach, IntegerValidator
+
+
+class CountingValidator(Validator):
+    exception_if_invalid = False
+
+    def __init__(self, calls, **kwargs):
+        self.calls = calls
+        super(CountingValidator, self).__init__(**kwargs)
+
+    def messages(self):
+        return {'negative': 'Number must not be negative.'}
+
+    def convert(self, value, context):
+        self.calls.append(value)
+        return [int(value)]
+
+    def validate(self, value, context):
+        if value[0] < 0:
+            self.new_error('negative', value, context, is_critical=False)
+
+
+class CachedTest(ValidationTest):
+
+    def setUp(self):
+        super(CachedTest, self).setUp()
+        self.calls = []
+        self.init_validator(Cached(CountingValidator(self.calls), maxsize=2))
+
+    def test_runs_wrapped_validator_only_once_per_input(self):
+        assert_equals([42], self.assert_is_valid('42').value)
+        assert_equals([42], self.assert_is_valid('42').value)
+        assert_equals(['42'], self.calls)
+
+        stats = self.validator().cache_stats()
+        assert_equals(1, stats['hits'])
+        assert_equals(1, stats['misses'])
+        assert_equals(0.5, stats['hit_rate'])
+
+    def test_returns_fresh_values_and_errors(self):
+        first = self.assert_is_valid('42').value
+        first.append(21)
+        assert_equals([42], self.assert_is_valid('42').value)
+
+        error1, = self.assert_error('-1').errors
+        error2, = self.assert_error('-1').errors
+        assert_not_equals(id(error1), id(error2))
+        assert_equals('negative', error2.key)
+        assert_equals('Number must not be negative.', error2.msg)
+        assert_false(error2.is_critical)
+        assert_equals(['42', '-1'], self.calls)
+
+    def test_evicts_least_recently_used_items(self):
+        self.process('1')
+        self.process('2')
+        self.process('1')
+        self.process('3')
+        self.process('1')
+        self.process('2')
+        assert_equals(['1', '2', '3', '2'], self.calls)
+        assert_equals(2, self.validator().cache_stats()['evictions'])
+
+    def test_uses_locale_as_part_of_cache_key(self):
+        validator = Cached(IntegerValidator())
+        e_en = assert_raises(InvalidDataError, lambda: validator.process('foo', {'locale': 'en'}))
+        e_de = assert_raises(InvalidDataError, lambda: validator.process('foo', {'locale': 'de'}))
+        assert_equals('Please enter a number.', e_en.details().msg())
+        assert_equals('Bitte geben Sie eine Zahl ein.', e_de.details().msg())
+
+        e_de2 = assert_raises(InvalidDataError, lambda: validator.process('foo', {'locale': 'de'}))
+        assert_not_equals(id(e_de), id(e_de2))
+        assert_equals('invalid_number', e_de2.details().key())
+        assert_equals(1, validator.cache_stats()['hits'])
+
+    def test_does_not_cache_unhashable_values(self):
+        self.init_validator(Cached(ForEach(IntegerValidator)))
+        self.assert_is_valid(['1', '2'], expected=(1, 2))
+        assert_equals(0, self.validator().cache_stats()['misses'])
+
+    def test_does_not_cache_results_if_budget_is_present(self):
+        result = self.assert_error('42', context={'budget': ValidationBudget(max_steps=0)})
+        assert_equals(('budget_exceeded',), error_keys(result.errors))
+        assert_equals([42], self.assert_is_valid('42').value)
+        assert_equals([42], self.assert_is_valid('42', context={'budget': ValidationBudget()}).value)
+        assert_equals(['42', '42'], self.calls)
+
+        validator = Cached(IntegerValidator())
+        with assert_raises(BudgetExceededError):
+            validator.process('5', {'budget': ValidationBudget(max_steps=0)})
+        assert_equals(5, validator.process('5'))
+        assert_equals(5, validator.process('5'))
+        stats = validator.cache_stats()
+        assert_equals((1, 1), (stats['misses'], stats['hits']))
+
+    def test_can_be_used_in_schemas(self):
+        class Schema(SchemaValidator):
+            number = Cached(IntegerValidator(exception_if_invalid=False))
+        self.init_validator(Schema(exception_if_invalid=False))
+
+        self.assert_is_valid({'number': '42'}, expected={'number': 42})
+        result = self.assert_error({'number': 'foo'})
+        assert_equals(('invalid_number',), error_keys(result.errors['number']))
+        result = self.assert_error({'number': 'foo'})
+        assert_equals(('invalid_number',), error_keys(result.errors['number']))
+        assert_equals('foo', result.children['number'].initial_value)
@@ -50,6 +50,18 @@ class BooleanCheckboxTest(ValidationTest):
         self.assert_is_valid(0, expected=True)
         self.assert_is_valid(1, expected=False)
 
+    def test_compares_custom_string_values_case_insensitively(self):
+        self.init_validator(trueish=('Yes',), falsish=('No',))
+        self.assert_is_valid('yes', expected=True)
+        self.assert_is_valid('YES', expected=True)
+        self.assert_is_valid('no', expected=False)
+
+    def test_compares_unhashable_values_by_identity(self):
+        marker = []
+        self.init_validator(trueish=('on', marker))
+        self.assert_is_valid(marker, expected=True)
+        self.assert_error([])
+
     def test_strips_by_default(self):
         self.assert_is_valid('  true  ', expected=True)
 
@@ -63,6 +75,11 @@ class BooleanCheckboxTest(ValidationTest):
     def test_rejects_values_which_are_neither_true_nor_false(self):
         self.assert_error_with_key('unknown_bool', 'maybe')
 
+    def test_error_message_is_translated(self):
+        self.init_validator(trueish=('yes', ), falsish=('no', ))
+        error = self.assert_error('maybe', context={'locale': 'de'})
+        assert_equals('Der Wert sollte "yes" oder "no" sein.', error.msg())
+
     def test_treat_missing_value_in_schema_as_false(self):
         # regression test!
         class CheckboxSchema(SchemaValidator):
@@ -82,6 +99,13 @@ class BooleanCheckboxTest(ValidationTest):
         assert_false(self.revert_conversion([]))
         assert_false(self.revert_conversion('invalid'))
     
+    def test_can_revert_conversion_for_custom_values(self):
+        self.init_validator(trueish=(0,), falsish=(1,))
+        assert_true(self.revert_conversion(0))
+        assert_false(self.revert_conversion(1))
+        assert_true(self.revert_conversion(True))
+        assert_false(self.revert_conversion('true'))
+
     def test_can_revert_conversion_for_trueish_values(self):
         assert_true(self.revert_conversion(True))
         assert_true(self.revert_conversion('true'))
@@ -0,0 +1,45 @@
+# -*- coding: UTF-8 -*-
+# This file is a part of pycerberus.
+# The source code contained in this file is licensed under the MIT license.
+# See LICENSE.txt in the main project directory, for more information.
+# SPDX-License-Identifier: MIT
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import threading
+
+from pycerberus.schema import SchemaValidator
+from pycerberus.validators import Cached, ForEach, IntegerValidator, OneOf
+
+
+def _summary(result):
+    errors = sorted((path, tuple((e.key, e.msg) for e in errors))
+                    for path, errors in result.errors_by_path().items())
+    return (result.value, errors)
+
+
+def test_same_schema_can_be_used_from_multiple_threads():
+    item = SchemaValidator(exception_if_invalid=False)
+    item.add('number', IntegerValidator(min=10, exception_if_invalid=False))
+    item.add('code', Cached(OneOf(['a', 'b'], exception_if_invalid=False)))
+    schema = SchemaValidator(exception_if_invalid=False)
+    schema.add('items', ForEach(item))
+
+    inputs = []
+    for i in range(20):
+        items = [{'number': str(i), 'code': 'abc'[i % 3]}] * (i % 3)
+        inputs.append(({'items': items}, ('de', 'en')[i % 2]))
+    expected = [_summary(schema.process(data, {'locale': locale})) for data, locale in inputs]
+
+    failures = []
+    def worker():
+        for _ in range(10):
+            for (data, locale), expected_summary in zip(inputs, expected):
+                if _summary(schema.process(data, {'locale': locale})) != expected_summary:
+                    failures.append((data, locale))
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert failures == []
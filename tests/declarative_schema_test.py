@@ -59,6 +59,17 @@ class DeclarativeSchemaTest(ValidationTest):
             else:
                 raise AssertionError('schema has unexpected attribute "%s"' % fieldname)
 
+    def test_can_add_fields_to_copy(self):
+        schema = self.schema()
+        clone = schema.copy()
+        clone.set_internal_state_freeze(False)
+        clone.add('name', StringValidator(exception_if_invalid=False))
+        clone.set_internal_state_freeze(True)
+
+        assert_equals(set(['id', 'amount', 'name']), set(clone.fieldvalidators()))
+        assert_equals(set(['id', 'amount']), set(schema.fieldvalidators()))
+        assert_true(clone.is_internal_state_frozen())
+
     def test_can_have_formvalidators(self):
         assert_callable(self.schema().formvalidators)
         assert_length(1, self.schema().formvalidators())
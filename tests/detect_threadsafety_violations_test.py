@@ -35,3 +35,23 @@ class DetectThreadSafetyViolationInValidatorTest(ValidationTest):
         self.assert_is_valid(42, expected=42)
 
 
+
+    def test_freezes_instance_after_subclass_initialization(self):
+        class ValidatorWithSettings(self.validator_class):
+            def __init__(self, *args, **kwargs):
+                super(ValidatorWithSettings, self).__init__(*args, **kwargs)
+                self.setting = 42
+        validator = ValidatorWithSettings()
+        assert_equals(42, validator.setting)
+        assert_true(validator.is_internal_state_frozen())
+        with assert_raises(ThreadSafetyError):
+            validator.setting = 21
+
+    def test_respects_freeze_state_set_during_initialization(self):
+        class ValidatorWithFreezeState(self.validator_class):
+            def __init__(self, *args, **kwargs):
+                super(ValidatorWithFreezeState, self).__init__(*args, **kwargs)
+                self.set_internal_state_freeze(False)
+        validator = ValidatorWithFreezeState()
+        assert_false(validator.is_internal_state_frozen())
+        validator.setting = 42
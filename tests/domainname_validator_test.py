@@ -8,7 +8,7 @@ from __future__ import absolute_import, print_function, unicode_literals
 
 from pythonic_testcase import *
 
-from pycerberus.test_util import ValidationTest
+from pycerberus.test_util import error_keys, ValidationTest
 from pycerberus.validators import DomainNameValidator
 
 
@@ -39,3 +39,15 @@ class DomainNameValidatorTest(ValidationTest):
         msg = self.assert_error('foo_bar.example').msg()
         assert_equals('Invalid character "_" in domain "foo_bar.example".', msg)
 
+
+    def test_can_return_errors_without_raising_exceptions(self):
+        self.init_validator(DomainNameValidator(exception_if_invalid=False))
+        error = self.assert_error_with_key('double_dot', 'example..com', _return_error=True)
+        assert_false(error.is_critical)
+
+        result = self.assert_error('.foo_bar.example.')
+        expected_keys = ('leading_dot', 'trailing_dot', 'invalid_domain_character')
+        assert_equals(expected_keys, error_keys(result.errors))
+
+    def test_reject_trailing_newline(self):
+        self.assert_error_with_key('invalid_domain_character', 'example.com\n')
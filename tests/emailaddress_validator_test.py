@@ -8,7 +8,7 @@ from __future__ import absolute_import, print_function, unicode_literals
 
 from pythonic_testcase import *
 
-from pycerberus.test_util import ValidationTest
+from pycerberus.test_util import error_keys, ValidationTest
 from pycerberus.validators import EmailAddressValidator
 
 
@@ -48,3 +48,21 @@ class EmailAddressValidatorTest(ValidationTest):
         e = self.get_error('foobar@')
         assert_equals('Missing domain in email address "foobar@".', e.msg())
 
+
+    def test_can_return_errors_without_raising_exceptions(self):
+        self.init_validator(EmailAddressValidator(exception_if_invalid=False))
+        error = self.assert_error_with_key('single_at', 'foo@bar@example.com', _return_error=True)
+        assert_false(error.is_critical)
+
+        result = self.assert_error('foo bar@ex ample.com')
+        expected_keys = ('invalid_domain_character', 'invalid_email_character')
+        assert_equals(expected_keys, error_keys(result.errors))
+
+    def test_reject_trailing_newline(self):
+        e = self.get_error('foo@example.com\n')
+        assert_equals('invalid_domain_character', e.details().key())
+
+    def test_applies_length_restrictions_to_domain(self):
+        self.init_validator(EmailAddressValidator(max_length=7))
+        self.assert_is_valid('foobar@foo.com', expected='foobar@foo.com')
+        self.assert_error_with_key('too_long', 'foo@example.com')
@@ -6,10 +6,14 @@
 
 from __future__ import absolute_import, print_function, unicode_literals
 
+import sys
+
 from pythonic_testcase import *
 
-from pycerberus.errors import Error, InvalidDataError
-from pycerberus.error_conversion import exception_from_errors, exception_to_errors
+from pycerberus.errors import Error, ErrorDetails, InvalidDataError
+from pycerberus.error_conversion import (exception_from_errors,
+    exception_from_result, exception_to_errors, LazyInvalidDataError)
+from pycerberus.lib.form_data import FieldData, FormData
 from pycerberus.lib.form_data import is_simple_error
 
 
@@ -24,6 +28,42 @@ class ExceptionToErrorsTest(PythonicTestCase):
         assert_isinstance(error, Error)
         assert_equals('error in list', error.message)
 
+    def test_can_convert_exception_with_custom_details(self):
+        class CustomDetails(object):
+            def key(self):
+                return 'custom'
+            def msg(self):
+                return 'custom message'
+            def value(self):
+                return 21
+            def context(self):
+                return {}
+
+        class CustomError(InvalidDataError):
+            def details(self):
+                return CustomDetails()
+
+        error = exception_to_errors(CustomError('custom message', 21))
+        assert_equals(('custom', 'custom message', 21), (error.key, error.msg, error.value))
+        assert_equals({}, error.msg_values)
+        assert_none(error.message_source)
+
+    def test_uses_accessors_of_error_details_subclasses(self):
+        class UppercaseDetails(ErrorDetails):
+            __slots__ = ()
+            def msg(self):
+                return super(UppercaseDetails, self).msg().upper()
+
+        class CustomError(InvalidDataError):
+            def details(self):
+                d = super(CustomError, self).details()
+                return UppercaseDetails(d.key(), d.msg(), d.value(), d.context(),
+                                        msg_values={'min': 1})
+
+        error = exception_to_errors(CustomError('custom message', 21, key='custom'))
+        assert_equals(('custom', 'CUSTOM MESSAGE', 21), (error.key, error.msg, error.value))
+        assert_equals({'min': 1}, error.msg_values)
+
     def _exception(self, message='a message', value=42, error_dict=None, error_list=None):
         return InvalidDataError(message, value, error_dict=error_dict, error_list=error_list)
 
@@ -157,3 +197,79 @@ class ErrorsToExceptionTest(PythonicTestCase):
 
     def _error(self, key='foo', message='a message', value=42):
         return Error(key=key, msg=message, value=value, context=None, is_critical=True)
+
+
+class DeeplyNestedErrorsTest(PythonicTestCase):
+    def _nested_errors(self, depth):
+        # alternating dicts (schemas) and lists (ForEach)
+        errors = (Error(key='empty', msg='dummy', value=None, context=None),)
+        for level in range(depth):
+            if level % 2:
+                errors = [None, errors]
+            else:
+                errors = {'child': errors}
+        return errors
+
+    def test_can_convert_errors_nested_deeper_than_recursion_limit(self):
+        depth = sys.getrecursionlimit() + 1000
+        errors = self._nested_errors(depth)
+
+        exc = exception_from_errors(errors)
+        assert_equals('empty', exc.details().key())
+        converted = exception_to_errors(exc)
+        unpacked = exc.unpack_errors()
+        for level in range(depth - 1, -1, -1):
+            if level % 2:
+                assert_none(converted[0])
+                assert_none(unpacked[0])
+                converted, unpacked = converted[1], unpacked[1]
+            else:
+                converted, unpacked = converted['child'], unpacked['child']
+        assert_equals('empty', converted.key)
+        assert_equals('empty', unpacked.details().key())
+
+
+class ExceptionFromResultTest(PythonicTestCase):
+    def _error(self, key):
+        return Error(key=key, msg='message for %s' % key, value=None, context=None)
+
+    def _result(self):
+        address = FormData(children={'zip': FieldData(errors=(self._error('too_short'),))})
+        return FormData(children={
+            'name': FieldData(),
+            'address': address,
+            'email': FieldData(errors=(self._error('invalid_email'),)),
+        })
+
+    def test_returns_details_of_first_error(self):
+        result = self._result()
+        exc = exception_from_result(result)
+
+        assert_isinstance(exc, LazyInvalidDataError)
+        assert_equals('too_short', exc.details().key())
+        assert_equals('message for too_short', exc.details().msg())
+        assert_equals(result, exc.result)
+
+    def test_builds_same_nested_exceptions_as_eager_conversion(self):
+        result = self._result()
+        exc = exception_from_result(result)
+        eager_exc = exception_from_errors(result.errors)
+
+        assert_equals(set(['address', 'email']), set(exc.error_dict()))
+        address_exc = exc.error_for('address')
+        assert_equals(('zip', ), tuple(address_exc.error_dict()))
+        assert_equals('too_short', address_exc.error_for('zip').details().key())
+        assert_equals('invalid_email', exc.error_for('email').details().key())
+        assert_length(2, exc.errors())
+
+        unpacked = exc.unpack_errors()
+        assert_equals(set(['address', 'email']), set(unpacked))
+        assert_equals('too_short', unpacked['address']['zip'].details().key())
+        assert_equals(
+            self._keys(exception_to_errors(eager_exc)),
+            self._keys(exception_to_errors(exc))
+        )
+
+    def _keys(self, errors):
+        return dict((field, getattr(error, 'key', None) or self._keys(error))
+                    for field, error in errors.items())
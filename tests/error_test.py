@@ -15,6 +15,15 @@ from pycerberus.errors import Error, InvalidArgumentsError, InvalidDataError
 
 class InvalidDataErrorTest(PythonicTestCase):
     
+    def test_can_return_details_for_first_error(self):
+        context = {'locale': 'de'}
+        e = InvalidDataError('a message', 42, key='foo', context=context)
+        details = e.details()
+        assert_equals('foo', details.key())
+        assert_equals('a message', details.msg())
+        assert_equals(42, details.value())
+        assert_equals(context, details.context())
+
     def test_can_return_list_of_errors(self):
         e = InvalidDataError('a message', 42, error_list=['foo'])
         assert_equals(('foo', ), e.errors())
@@ -86,3 +95,8 @@ class ErrorTest(PythonicTestCase):
         error.quox = 12
         assert_equals(12, error.quox)
         assert_equals(repr_tmpl % 12, _u_repr(error))
+
+    def test_can_not_localize_error_without_message_source(self):
+        error = Error(key='foo', msg='bar', value='baz', context={})
+        assert_equals({}, error.msg_values)
+        assert_equals(error, error.localized('de'))
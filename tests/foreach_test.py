@@ -6,9 +6,11 @@
 
 from __future__ import absolute_import, print_function, unicode_literals
 
+import pytest
 from pythonic_testcase import *
 
 from pycerberus.errors import InvalidArgumentsError, InvalidDataError
+from pycerberus.lib.vectorized import is_numpy_available
 from pycerberus.schema import SchemaValidator
 from pycerberus.test_util import error_keys, ValidationTest
 from pycerberus.validators import ForEach, IntegerValidator
@@ -167,3 +169,62 @@ class ForEachTest(ValidationTest):
         assert_length(1, result.errors)
         assert_length(1, result.global_errors) # seems to be duplicated?
         assert_equals(('empty', ), error_keys(result.errors))
+
+
+class ForEachVectorizedIntegersTest(PythonicTestCase):
+    def setUp(self):
+        super(ForEachVectorizedIntegersTest, self).setUp()
+        if not is_numpy_available():
+            self.skipTest('NumPy not installed')
+
+    def _error_keys(self, result):
+        return [error_keys(item.errors or ()) for item in result.items]
+
+    def _process(self, values, **kwargs):
+        validator = ForEach(IntegerValidator(min=0, max=100), exception_if_invalid=False, **kwargs)
+        return validator.process(values)
+
+    def test_returns_same_results_as_item_by_item_validation(self):
+        values = [str(i) for i in range(100)] + [' 7', '-1', '101', 'foo', 42, True]
+        result = self._process(values)
+        expected = self._process(values, vectorize=False)
+
+        assert_equals(expected.value, result.value)
+        assert_equals(expected.initial_value, result.initial_value)
+        assert_equals(self._error_keys(expected), self._error_keys(result))
+        assert_equals(tuple(range(100)) + (7, None, None, None, 42, 1), result.value)
+
+    def test_can_process_numpy_string_arrays(self):
+        import numpy
+        result = self._process(numpy.array([str(i) for i in range(200)]))
+
+        assert_equals(tuple(range(101)), result.value[:101])
+        assert_equals(('too_big', ), error_keys(result.items[101].errors))
+
+    def test_raises_exception_for_invalid_items(self):
+        validator = ForEach(IntegerValidator(max=10), exception_if_invalid=True)
+        with assert_raises(InvalidDataError):
+            validator.process(['1'] * 100 + ['11'])
+
+
+def _numpy_items(name, size):
+    import numpy
+    return {
+        'int_array': lambda: numpy.arange(size),
+        'int64_list': lambda: [numpy.int64(1)] * size,
+        'string_array': lambda: numpy.array([str(i) for i in range(size)]),
+        'mixed_list': lambda: [str(i) for i in range(size - 2)] + [numpy.int64(1), 2.5],
+    }[name]()
+
+@pytest.mark.parametrize('size', [10, 100])
+@pytest.mark.parametrize('items', ['int_array', 'int64_list', 'string_array', 'mixed_list'])
+def test_vectorized_conversion_accepts_same_items_as_item_by_item_validation(items, size):
+    if not is_numpy_available():
+        pytest.skip('NumPy not installed')
+    values = _numpy_items(items, size)
+    def process(**kwargs):
+        validator = ForEach(IntegerValidator(), exception_if_invalid=False, **kwargs)
+        result = validator.process(values)
+        return (result.value, [error_keys(item.errors or ()) for item in result.items])
+
+    assert process(vectorize=True) == process(vectorize=False)
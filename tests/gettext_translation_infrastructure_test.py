@@ -6,11 +6,15 @@
 
 from __future__ import absolute_import, print_function, unicode_literals
 
+import gettext
 import os
+import shutil
+import tempfile
 
 from pythonic_testcase import *
 
-from pycerberus.i18n import GettextTranslation
+from pycerberus.i18n import GettextTranslation, load_catalog
+from pycerberus.lib.mo_catalog import MappedCatalog
 
 
 class GettextTranslationInfrastructureTest(PythonicTestCase):
@@ -39,3 +43,43 @@ class GettextTranslationInfrastructureTest(PythonicTestCase):
         assert_equals('fr', translation._locale({'locale': 'fr'}))
 
 
+
+    def test_uses_cached_memory_mapped_catalog(self):
+        translation = GettextTranslation(domain='pycerberus')
+        catalog = translation.translation({'locale': 'de'})
+        assert_isinstance(catalog, MappedCatalog)
+        assert_equals(catalog, translation.translation({'locale': 'de'}))
+        assert_equals('Bitte geben Sie einen Wert ein.',
+            catalog.gettext('Value must not be empty.'))
+
+    def test_falls_back_to_untranslated_messages_for_unknown_locales(self):
+        catalog = GettextTranslation(domain='pycerberus').translation({'locale': 'xx'})
+        assert_isinstance(catalog, gettext.NullTranslations)
+        assert_equals('Value must not be empty.', catalog.gettext('Value must not be empty.'))
+
+    def test_chains_catalogs_like_gettext(self):
+        try:
+            from babel.messages.catalog import Catalog
+            from babel.messages.mofile import write_mo
+        except ImportError:
+            self.skipTest('Babel not installed')
+        localedir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, localedir)
+        translations = {
+            'de_AT': {'a': 'A-de_AT'},
+            'de': {'a': 'A-de', 'b': 'B-de'},
+        }
+        for locale, messages in translations.items():
+            catalog = Catalog(locale=locale)
+            for message, translation in messages.items():
+                catalog.add(message, translation)
+            os.makedirs(os.path.join(localedir, locale, 'LC_MESSAGES'))
+            with open(os.path.join(localedir, locale, 'LC_MESSAGES', 'app.mo'), 'wb') as fp:
+                write_mo(fp, catalog)
+
+        gnu_translation = gettext.translation('app', localedir, languages=['de_AT'])
+        for locale in ('de_AT', ('fr', 'de_AT')):
+            catalog = load_catalog('app', localedir, locale)
+            for message in ('a', 'b', 'c'):
+                assert_equals(gnu_translation.gettext(message), catalog.gettext(message))
+        assert_equals('B-de', load_catalog('app', localedir, 'de_AT').gettext('b'))
@@ -32,3 +32,50 @@ class MessagesFromBuiltInValidatorsAreTranslatedTest(ValidationTest):
         assert_equals('Please enter a number.', error_en.msg())
 
 
+
+
+class MessageTemplateCacheTest(PythonicTestCase):
+
+    def test_caches_translated_templates_per_key_and_locale(self):
+        validator = IntegerValidator(min=10, exception_if_invalid=False)
+        template_de = validator.message_template('too_low', {'locale': 'de'})
+        assert_equals(template_de, validator.message_template('too_low', {'locale': 'de'}))
+        assert_equals(set(['min']), template_de.parameters)
+        assert_equals('Die Zahl muss größer oder gleich 10 sein.', template_de.render({'min': 10}))
+
+        template_en = validator.message_template('too_low', {'locale': 'en'})
+        assert_equals('Number must be 10 or greater.', template_en.render({'min': 10}))
+        assert_equals(2, validator._message_templates.stats()['size'])
+
+    def test_does_not_cache_custom_translations(self):
+        translations = []
+        class CustomTranslation(IntegerValidator):
+            def translate_message(self, key, native_message, translation_parameters, context):
+                translations.append(context['locale'])
+                return native_message.upper()
+        validator = CustomTranslation(exception_if_invalid=False)
+        for i in range(2):
+            assert_equals('PLEASE ENTER A NUMBER.', validator.message('invalid_number', {'locale': 'de'}))
+        assert_equals(['de', 'de'], translations)
+
+    def test_does_not_cache_custom_message_for_key(self):
+        class TenantValidator(IntegerValidator):
+            def message_for_key(self, key, context):
+                return 'bad for %s' % context['tenant']
+        validator = TenantValidator(exception_if_invalid=False)
+        assert_equals('bad for A', validator.message('invalid_number', {'tenant': 'A'}))
+        assert_equals('bad for B', validator.message('invalid_number', {'tenant': 'B'}))
+        assert_equals(0, validator._message_templates.stats()['size'])
+
+    def test_caches_templates_with_messages_passed_at_instantiation(self):
+        validator = IntegerValidator(messages={'invalid_number': 'No number!'}, exception_if_invalid=False)
+        assert_equals('No number!', validator.message('invalid_number', {}))
+        assert_equals('Value must not be empty.', validator.message('empty', {}))
+        assert_equals(2, validator._message_templates.stats()['size'])
+
+        class TenantValidator(IntegerValidator):
+            def message_for_key(self, key, context):
+                return 'bad for %s' % context['tenant']
+        validator = TenantValidator(messages={'empty': 'empty!'}, exception_if_invalid=False)
+        assert_equals('bad for A', validator.message('invalid_number', {'tenant': 'A'}))
+        assert_equals('bad for B', validator.message('invalid_number', {'tenant': 'B'}))
@@ -0,0 +1,83 @@
+# -*- coding: UTF-8 -*-
+# This file is a part of pycerberus.
+# The source code contained in this file is licensed under the MIT license.
+# See LICENSE.txt in the main project directory, for more information.
+# SPDX-License-Identifier: MIT
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import importlib
+import os
+import subprocess
+import sys
+
+import pytest
+
+import pycerberus
+import pycerberus.lib
+import pycerberus.validators
+
+
+_project_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def _run_python(*args):
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join([_project_dir, env.get('PYTHONPATH', '')])
+    process = subprocess.run(
+        (sys.executable, ) + args,
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=env, check=True,
+        universal_newlines=True,
+    )
+    return process
+
+
+@pytest.mark.parametrize('package', [pycerberus, pycerberus.lib, pycerberus.validators])
+def test_exports_all_public_names_of_submodules(package):
+    exported_names = set()
+    for module_name in package._module_attributes:
+        module = importlib.import_module(module_name, package.__name__)
+        exported_names.update(module.__all__)
+    assert set(package.__all__) == exported_names
+    for name in package.__all__:
+        assert getattr(package, name) is not None
+        assert name in dir(package)
+
+
+def test_raises_attribute_error_for_unknown_names():
+    with pytest.raises(AttributeError):
+        pycerberus.validators.DoesNotExist
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason='modules are imported eagerly')
+def test_imports_only_required_modules():
+    code = (
+        'import sys; '
+        'from pycerberus.validators import IntegerValidator; '
+        'print(sorted(m for m in sys.modules if m.startswith("pycerberus")))'
+    )
+    output = _run_python('-c', code).stdout
+    assert 'pycerberus.validators.basic_numbers' in output
+    assert 'pycerberus.validators.email' not in output
+    assert 'pycerberus.lib.linear_regex' not in output
+
+
+def _imported_modules(code):
+    code += '; import sys; print(" ".join(sorted(m for m in sys.modules if m.startswith("pycerberus"))))'
+    return _run_python('-c', code).stdout.split()
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason='modules are imported eagerly')
+def test_plain_import_does_not_import_submodules():
+    assert _imported_modules('import pycerberus') == ['pycerberus', 'pycerberus.compat']
+
+
+def test_can_access_submodules_as_attributes():
+    code = (
+        'import pycerberus; '
+        'assert pycerberus.api.Validator is pycerberus.Validator; '
+        'assert pycerberus.validators.string.StringValidator is pycerberus.validators.StringValidator; '
+        'assert pycerberus.lib.form_data.FormData is pycerberus.lib.FormData'
+    )
+    assert 'pycerberus.api' in _imported_modules(code)
+    with pytest.raises(AttributeError):
+        pycerberus.does_not_exist
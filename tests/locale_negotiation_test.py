@@ -0,0 +1,79 @@
+# -*- coding: UTF-8 -*-
+# This file is a part of pycerberus.
+# The source code contained in this file is licensed under the MIT license.
+# See LICENSE.txt in the main project directory, for more information.
+# SPDX-License-Identifier: MIT
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import pytest
+
+from pycerberus import i18n
+from pycerberus.i18n import _, available_locales, negotiate_locales
+from pycerberus.translation import CachedTranslationProvider, GettextProvider
+from pycerberus.validators import IntegerValidator
+
+
+@pytest.mark.parametrize('preferences, expected', [
+    ('de', ('de', )),
+    ('de-AT,de;q=0.9,en;q=0.5', ('de', 'en')),
+    ('fr,de;q=0.1', ('de', )),
+    ('en-US,de', ('en', )),
+    ('de;q=0,fr', ('en', )),
+    ('DE-ch', ('de', )),
+    ('*', ('en', )),
+    ('', ('en', )),
+    ('de;q=invalid,fr', ('en', )),
+    (['fr_FR', 'de_DE'], ('de', )),
+    (['', '*', ' de-AT '], ('de', )),
+    (['*'], ('en', )),
+])
+def test_can_negotiate_locales(preferences, expected):
+    assert negotiate_locales(preferences, available=('de', 'en')) == expected
+
+
+def test_uses_locales_with_catalogs_by_default():
+    assert 'de' in available_locales()
+    assert negotiate_locales('de-DE, en') == ('de', 'en')
+    assert negotiate_locales('xx') == ('en', )
+    assert negotiate_locales('xx', default='de') == ('de', )
+
+
+def test_caches_negotiated_locales():
+    header = 'de-CH,de;q=0.8,en;q=0.3'
+    stats_before = i18n._negotiated_locales.stats()
+    assert negotiate_locales(header) == ('de', 'en')
+    assert negotiate_locales(header) == ('de', 'en')
+    stats = i18n._negotiated_locales.stats()
+    assert stats['hits'] == stats_before['hits'] + 1
+    assert stats['maxsize'] is not None
+
+
+def test_validators_use_first_locale_with_catalog():
+    validator = IntegerValidator(exception_if_invalid=False)
+    context = {'locale': negotiate_locales('fr, de;q=0.5', available=('fr', 'de', 'en'))}
+    assert context['locale'] == ('fr', 'de')
+
+    error, = validator.process('foo', context).errors
+    assert error.msg == 'Bitte geben Sie eine Zahl ein.'
+
+
+@pytest.mark.parametrize('provider', [
+    GettextProvider(),
+    CachedTranslationProvider(GettextProvider()),
+])
+def test_translation_providers_use_first_locale_with_translation(provider):
+    class ProviderValidator(IntegerValidator):
+        def messages(self):
+            return {'invalid_number': _('Please enter a number.')}
+
+        def translation_parameters(self, context):
+            return {'domain': 'pycerberus', 'provider': provider}
+
+    validator = ProviderValidator(exception_if_invalid=False)
+    context = {'locale': negotiate_locales(['', '*', 'fr', 'de'], available=('fr', 'de', 'en'))}
+    assert context['locale'] == ('fr', 'de')
+
+    error, = validator.process('foo', context).errors
+    assert error.msg == 'Bitte geben Sie eine Zahl ein.'
+    assert error.localized(negotiate_locales('fr, en')).msg == 'Please enter a number.'
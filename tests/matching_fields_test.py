@@ -8,8 +8,9 @@ from __future__ import absolute_import, print_function, unicode_literals
 
 from pythonic_testcase import *
 
-from pycerberus.test_util import ValidationTest
-from pycerberus.validators import MatchingFields
+from pycerberus.schema import SchemaValidator
+from pycerberus.test_util import error_keys, ValidationTest
+from pycerberus.validators import MatchingFields, StringValidator
 
 
 class MatchingFieldsTest(ValidationTest):
@@ -34,3 +35,20 @@ class MatchingFieldsTest(ValidationTest):
         assert_not_none(errors['bar'])
         bar_error = errors['bar'].details()
         assert_equals('mismatch', bar_error.key())
+
+    def test_can_return_errors_without_raising_exceptions(self):
+        self.init_validator(MatchingFields('foo', 'bar', exception_if_invalid=False))
+        self.assert_is_valid(dict(foo='value', bar='value'))
+        self.assert_error_with_key('mismatch', dict(foo='first', bar='second'))
+
+    def test_attaches_error_to_second_field_in_schema_results(self):
+        class PasswordSchema(SchemaValidator):
+            foo = StringValidator(exception_if_invalid=False)
+            bar = StringValidator(exception_if_invalid=False)
+            formvalidators = (MatchingFields('foo', 'bar', exception_if_invalid=False), )
+        schema = PasswordSchema(exception_if_invalid=False)
+
+        result = schema.process(dict(foo='first', bar='second'))
+        assert_equals(('bar',), tuple(result.errors))
+        assert_equals(('mismatch',), error_keys(result.errors['bar']))
+        assert_length(0, result.global_errors)
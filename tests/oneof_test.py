@@ -6,8 +6,12 @@
 
 from __future__ import absolute_import, print_function, unicode_literals
 
+import threading
+import time
+
 from pythonic_testcase import *
 
+from pycerberus.errors import InvalidArgumentsError
 from pycerberus.test_util import ValidationTest
 from pycerberus.validators import OneOf
 
@@ -27,6 +31,133 @@ class OneOfTest(ValidationTest):
         self.assert_error('foobar')
         self.assert_error(None)
     
+    def test_can_return_errors_without_raising_exceptions(self):
+        self.init_validator(OneOf(['foo', 'bar'], exception_if_invalid=False))
+        self.assert_is_valid('foo', expected='foo')
+        error = self.assert_error_with_key('value_not_allowed', 'baz', _return_error=True)
+        assert_false(error.is_critical)
+
+    def test_can_use_unhashable_allowed_values(self):
+        self.init_validator(OneOf([['foo'], {'bar': 1}]))
+        self.assert_is_valid(['foo'], expected=['foo'])
+        self.assert_is_valid({'bar': 1}, expected={'bar': 1})
+        self.assert_error(['bar'])
+
+    def test_can_handle_unhashable_input(self):
+        self.assert_error(['foo'])
+
+    def test_can_ignore_case(self):
+        self.init_validator(OneOf(['DE', 'at', 42], ignore_case=True))
+        self.assert_is_valid('de', expected='DE')
+        self.assert_is_valid('AT', expected='at')
+        self.assert_is_valid(42, expected=42)
+        self.assert_error('ch')
+
+    def test_can_normalize_values(self):
+        normalize = lambda value: value.replace(' ', '')
+        self.init_validator(OneOf(['DE 123', 'AT 456'], normalize=normalize))
+        self.assert_is_valid('DE123', expected='DE 123')
+        self.assert_is_valid(' AT 456', expected='AT 456')
+        self.assert_error('CH 789')
+
+    def test_rejects_ignore_case_and_normalize_at_the_same_time(self):
+        with assert_raises(InvalidArgumentsError):
+            OneOf(['foo'], ignore_case=True, normalize=lambda value: value)
+
+    def test_requires_either_allowed_values_or_loader(self):
+        with assert_raises(InvalidArgumentsError):
+            OneOf()
+        with assert_raises(InvalidArgumentsError):
+            OneOf(['foo'], loader=lambda: ['foo'])
+
     def assert_raises_error_with_key(self, value, error_key):
         assert_equals(error_key, self.assert_error(value).details().key())
 
+
+
+class OneOfWithLoaderTest(ValidationTest):
+
+    def setUp(self):
+        super(OneOfWithLoaderTest, self).setUp()
+        self.now = 1000
+        self.loaded = []
+        self.allowed_values = ['foo']
+
+    def loader(self):
+        self.loaded.append(tuple(self.allowed_values))
+        return self.allowed_values
+
+    def _init_validator(self, **kwargs):
+        validator = self.init_validator(OneOf(loader=self.loader, **kwargs))
+        validator._loaded_values.clock = lambda: self.now
+        return validator
+
+    def _wait_for_refresh(self):
+        thread = self.validator()._loaded_values._refresh_thread
+        if thread is not None:
+            thread.join()
+
+    def test_loads_allowed_values_on_first_use(self):
+        self._init_validator()
+        assert_equals([], self.loaded)
+
+        self.assert_is_valid('foo', expected='foo')
+        self.assert_error('bar')
+        assert_equals([('foo',)], self.loaded)
+
+    def test_can_reload_values_after_ttl(self):
+        self._init_validator(ttl=60)
+        self.assert_is_valid('foo')
+        self.allowed_values = ['bar']
+
+        self.now += 59
+        self.assert_is_valid('foo')
+        assert_length(1, self.loaded)
+
+        self.now += 1
+        # old values are used until the new values were loaded
+        self.assert_is_valid('foo')
+        self._wait_for_refresh()
+        assert_length(2, self.loaded)
+        self.assert_is_valid('bar')
+        self.assert_error('foo')
+
+    def test_measures_ttl_with_monotonic_clock_if_available(self):
+        validator = self.init_validator(OneOf(loader=self.loader, ttl=60))
+        assert_equals(getattr(time, 'monotonic', time.time), validator._loaded_values.clock)
+
+    def test_keeps_old_values_if_reload_fails(self):
+        self._init_validator(ttl=60)
+        self.assert_is_valid('foo')
+        self.allowed_values = None
+
+        self.now += 60
+        self.assert_is_valid('foo')
+        self._wait_for_refresh()
+        self.assert_is_valid('foo')
+
+    def test_calls_loader_only_once_for_concurrent_requests(self):
+        loader_started = threading.Event()
+        continue_loading = threading.Event()
+        def slow_loader():
+            loader_started.set()
+            continue_loading.wait()
+            return self.loader()
+        validator = self.init_validator(OneOf(loader=slow_loader))
+
+        threads = [threading.Thread(target=validator.process, args=('foo',)) for i in range(5)]
+        for thread in threads:
+            thread.start()
+        loader_started.wait()
+        continue_loading.set()
+        for thread in threads:
+            thread.join()
+        assert_equals([('foo',)], self.loaded)
+
+    def test_can_refresh_values_explicitely(self):
+        self._init_validator()
+        self.assert_is_valid('foo')
+        self.allowed_values = ['bar']
+
+        self.validator().refresh()
+        self.assert_is_valid('bar')
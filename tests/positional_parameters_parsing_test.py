@@ -6,8 +6,12 @@
 
 from __future__ import absolute_import, print_function, unicode_literals
 
+import re
+
 from pythonic_testcase import *
 
+from pycerberus.budget import ValidationBudget
+from pycerberus.errors import InvalidDataError
 from pycerberus.schemas import PositionalArgumentsParsingSchema
 from pycerberus.test_util import ValidationTest
 from pycerberus.validators import IntegerValidator, StringValidator
@@ -80,3 +84,99 @@ class TestProgrammaticSchemaConstructionForPositionalArguments(ValidationTest):
         self.assert_error('foo, bar')
         
 
+
+
+class TestPositionalArgumentsWithCustomSeparator(ValidationTest):
+
+    class SemicolonSchema(PositionalArgumentsParsingSchema):
+        foo = StringValidator()
+        bar = IntegerValidator()
+        parameter_order = ('foo', 'bar')
+
+        def separator_pattern(self):
+            return re.compile(r'\s*;\s*')
+    validator_class = SemicolonSchema
+
+    def test_accepts_precompiled_separator_pattern(self):
+        self.init_validator(self.schema())
+        self.assert_is_valid('fnord ; 42', expected={'foo': 'fnord', 'bar': 42})
+
+
+class TestPositionalArgumentsWithAggregatedValues(ValidationTest):
+
+    class CommandSchema(PositionalArgumentsParsingSchema):
+        command = StringValidator()
+        args = StringValidator(required=False)
+        parameter_order = ('command', )
+
+        def aggregate_values(self, parameter_names, arguments, context):
+            parameter_names.append('args')
+            return parameter_names, arguments[:1] + [' '.join(arguments[1:])]
+    validator_class = CommandSchema
+
+    def test_can_aggregate_values(self):
+        self.init_validator(self.schema())
+        self.assert_is_valid('ls, -l, /tmp', expected={'command': 'ls', 'args': '-l /tmp'})
+        assert_equals(('command', ), self.validator()._parameter_names())
+
+
+class TestPositionalArgumentsProcessLines(PythonicTestCase):
+
+    class EntrySchema(PositionalArgumentsParsingSchema):
+        name = StringValidator()
+        port = IntegerValidator()
+        parameter_order = ('name', 'port')
+
+    def test_yields_line_numbers_and_values(self):
+        lines = ['foo, 42\n', 'bar, 21\r\n']
+        results = list(self.EntrySchema().process_lines(lines))
+        assert_equals([
+                (1, {'name': 'foo', 'port': 42}),
+                (2, {'name': 'bar', 'port': 21}),
+            ],
+            results
+        )
+
+    def test_yields_exception_for_invalid_lines(self):
+        lines = iter(['foo, 42', 'bar, baz', 'qux, 21'])
+        results = list(self.EntrySchema().process_lines(lines))
+
+        assert_length(3, results)
+        line_no, error = results[1]
+        assert_equals(2, line_no)
+        assert_isinstance(error, InvalidDataError)
+        assert_equals(('port', ), tuple(error.error_dict()))
+        assert_equals((3, {'name': 'qux', 'port': 21}), results[2])
+
+    def test_returns_results_if_exception_if_invalid_is_false(self):
+        schema = self.EntrySchema(exception_if_invalid=False)
+        (line_no, result), = list(schema.process_lines(['foo, bar']))
+
+        assert_equals(1, line_no)
+        assert_true(result.contains_errors())
+        assert_equals(('port', ), tuple(result.errors))
+
+    def test_does_not_modify_passed_context(self):
+        context = {}
+        list(self.EntrySchema().process_lines(['foo, 42'], context=context))
+        assert_equals({}, context)
+
+    def test_passes_each_line_to_process(self):
+        class LowercaseSchema(self.EntrySchema):
+            def process(self, value, context=None):
+                return super(LowercaseSchema, self).process(value.lower(), context=context)
+
+        results = list(LowercaseSchema().process_lines(['FOO, 42']))
+        assert_equals([(1, {'name': 'foo', 'port': 42})], results)
+
+    def test_stops_processing_lines_if_budget_is_exceeded(self):
+        # each line needs three steps (schema and two fields)
+        context = {'budget': ValidationBudget(max_steps=4)}
+        results = list(self.EntrySchema().process_lines(['foo, 42', 'bar, 21'], context=context))
+
+        assert_equals((1, {'name': 'foo', 'port': 42}), results[0])
+        line_no, error = results[1]
+        assert_equals(2, line_no)
+        assert_isinstance(error, InvalidDataError)
+        assert_equals({'name', 'port'}, set(error.error_dict()))
+        assert_equals('budget_exceeded', error.error_dict()['port'].details().key())
@@ -6,8 +6,12 @@
 
 from __future__ import absolute_import, print_function, unicode_literals
 
+import re
+
 from pythonic_testcase import *
 
+from pycerberus.errors import InvalidArgumentsError
+from pycerberus.lib.linear_regex import compile_regex, LinearPattern, UnsupportedPatternError
 from pycerberus.test_util import assert_no_critical_errors, error_keys, ValidationTest
 from pycerberus.validators import RegexValidator
 
@@ -89,3 +93,68 @@ class RegexTest(ValidationTest):
             error.message
         )
 
+
+    # --- regex engines --------------------------------------------------------
+    def test_can_use_linear_regex_engine(self):
+        self.init_validator(regex=r'(\d+)-(?P<suffix>[a-z]+)', regex_engine='linear',
+            use_match_for_conversion=True)
+        validator = self.validator()
+        assert_isinstance(validator.regex, LinearPattern)
+
+        match = self.assert_is_valid('42-abc').value
+        assert_equals('42-abc', match.group())
+        assert_equals(('42', 'abc'), match.groups())
+        assert_equals('abc', match.group('suffix'))
+        self.assert_error_with_key('bad_pattern', '42-')
+
+    def test_linear_regex_engine_prevents_catastrophic_backtracking(self):
+        self.init_validator(regex=r'(a+)+', regex_engine='linear')
+        self.assert_is_valid('a' * 20, expected='a' * 20)
+        # "re" would need several minutes to reject this input
+        self.assert_error_with_key('bad_pattern', 'a' * 40 + 'b')
+
+    def test_falls_back_to_re_for_unsupported_patterns(self):
+        self.init_validator(regex=r'(a)\1', regex_engine='linear')
+        assert_isinstance(self.validator().regex, re.compile('').__class__)
+        self.assert_is_valid('aa', expected='aa')
+
+    def test_falls_back_to_re_for_repetitions_of_empty_matches(self):
+        self.init_validator(regex=r'(?:|a)*', regex_engine='linear')
+        assert_isinstance(self.validator().regex, re.compile('').__class__)
+        self.assert_is_valid('aa', expected='aa')
+        self.assert_error_with_key('bad_pattern', 'ab')
+
+    def test_can_select_regex_engine_on_class_level(self):
+        class LinearRegexValidator(RegexValidator):
+            regex_engine = 'linear'
+        validator = LinearRegexValidator(regex=r'\d+')
+        assert_isinstance(validator.regex, LinearPattern)
+
+    def test_can_select_callable_regex_engine_globally(self):
+        RegexValidator.regex_engine = compile_regex
+        try:
+            validator = RegexValidator(regex=r'(a+)+')
+        finally:
+            RegexValidator.regex_engine = 're'
+        assert_isinstance(validator.regex, LinearPattern)
+        assert_equals(r'^(a+)+$', validator.regex.pattern)
+
+        class StaticEngineValidator(RegexValidator):
+            regex_engine = staticmethod(compile_regex)
+        assert_isinstance(StaticEngineValidator(regex=r'\d+').regex, LinearPattern)
+
+    def test_does_not_hide_errors_of_callable_regex_engine(self):
+        with assert_raises(UnsupportedPatternError):
+            RegexValidator(regex=r'(a)\1', regex_engine=compile_regex)
+
+    def test_can_use_custom_regex_engine(self):
+        patterns = []
+        def compile_(pattern):
+            patterns.append(pattern)
+            return re.compile(pattern)
+        self.init_validator(regex=r'\d+', regex_engine=compile_)
+        assert_equals([r'^\d+$'], patterns)
+
+    def test_rejects_unknown_regex_engine(self):
+        with assert_raises(InvalidArgumentsError):
+            RegexValidator(regex=r'\d+', regex_engine='invalid')
@@ -6,9 +6,16 @@
 
 from __future__ import absolute_import, print_function, unicode_literals
 
+import copy
+import pickle
+import threading
+import time
+
+import pytest
 from pythonic_testcase import *
 
 from pycerberus.api import Error, Validator
+from pycerberus.budget import ValidationBudget
 from pycerberus.compat import OrderedDict
 from pycerberus.errors import InvalidArgumentsError, InvalidDataError
 from pycerberus.lib import AttrDict
@@ -159,6 +166,14 @@ class SchemaTest(ValidationTest):
         assert_equals({}, key_error.value())
         assert_equals('invalid_type', key_error.key())
 
+    def test_exception_provides_access_to_result(self):
+        schema = self._schema(('id', 'key'), exception_if_invalid=True)
+        with assert_raises(InvalidDataError) as c:
+            schema.process({'id': 'invalid', 'key': '21'})
+        result = c.caught_exception.result
+        assert_equals('21', result.children['key'].value)
+        assert_equals(('invalid_number', ), error_keys(result.children['id'].errors))
+
     # -------------------------------------------------------------------------
     # results instead of raising exceptions
 
@@ -552,3 +567,176 @@ def test_formvalidator_in_schema_with_repeatable_field_can_set_global_error():
     assert not result.errors
     form_error, = result.global_errors
     assert form_error.key == 'bad_number'
+
+
+def test_can_return_errors_by_path_for_nested_results():
+    address_schema = SchemaValidator(exception_if_invalid=False)
+    address_schema.add('zip', IntegerValidator(exception_if_invalid=False))
+    schema = SchemaValidator(exception_if_invalid=False)
+    schema.add('name', StringValidator(exception_if_invalid=False))
+    schema.add('addresses', ForEach(address_schema))
+
+    result = schema.process({'name': 'foo', 'addresses': [{'zip': '1'}, {'zip': 'bad'}]})
+
+    errors = result.errors_by_path()
+    assert tuple(errors) == (('addresses', 1, 'zip'),)
+    assert error_keys(errors[('addresses', 1, 'zip')]) == ('invalid_number',)
+
+
+def test_can_render_errors_in_different_locale_without_revalidation():
+    address_schema = SchemaValidator(exception_if_invalid=False)
+    address_schema.add('zip', IntegerValidator(min=1000, exception_if_invalid=False))
+    schema = SchemaValidator(exception_if_invalid=False)
+    schema.add('name', StringValidator(exception_if_invalid=False))
+    schema.add('addresses', ForEach(address_schema))
+
+    result = schema.process({'name': None, 'addresses': [{'zip': '1'}, {'zip': '2000'}]},
+                            {'locale': 'en'})
+
+    errors = result.localized_errors('de')
+    name_error, = errors['name']
+    assert name_error.msg == 'Bitte geben Sie einen Wert ein.'
+    assert errors['addresses'][1] is None
+    zip_error, = errors['addresses'][0]['zip']
+    assert zip_error.key == 'too_low'
+    assert zip_error.msg == 'Die Zahl muss größer oder gleich 1000 sein.'
+    assert zip_error.msg_values == {'min': 1000}
+    assert zip_error.context['locale'] == 'de'
+    # the cached result is not modified
+    assert result.errors['name'][0].msg == 'Value must not be empty.'
+    addresses = result.children['addresses']
+    assert addresses.localized_errors('de')[0]['zip'][0].msg == zip_error.msg
+    assert addresses.localized_errors('en')[0]['zip'][0].msg == 'Number must be 1000 or greater.'
+
+
+def test_can_render_exception_in_different_locale():
+    schema = SchemaValidator()
+    schema.add('number', IntegerValidator(exception_if_invalid=True))
+    schema.add('numbers', ForEach(IntegerValidator(exception_if_invalid=True)))
+
+    data = {'number': 'abc', 'numbers': ['1', 'x']}
+    e = assert_raises(InvalidDataError, lambda: schema.process(data, {'locale': 'de'}))
+    assert e.details().msg() == 'Bitte geben Sie eine Zahl ein.'
+    assert e.localized('en').details().msg() == 'Please enter a number.'
+    assert e.localized('en').details().key() == 'invalid_number'
+
+    errors = e.localized_errors('en')
+    assert errors['number'].details().msg() == 'Please enter a number.'
+    assert errors['numbers'][0] is None
+    assert errors['numbers'][1][0].details().msg() == 'Please enter a number.'
+    # the original exception still uses the locale from the validation
+    assert e.unpack_errors()['number'].details().msg() == 'Bitte geben Sie eine Zahl ein.'
+
+
+def test_can_localize_unpickled_errors():
+    schema = SchemaValidator(exception_if_invalid=False)
+    schema.add('n', IntegerValidator(min=1000, exception_if_invalid=False))
+    result = schema.process({'n': '1'}, {'locale': 'en'})
+
+    error, = pickle.loads(pickle.dumps(result.errors['n']))
+    assert error.msg == 'Number must be 1000 or greater.'
+    assert error.localized('de').msg == 'Die Zahl muss größer oder gleich 1000 sein.'
+    unpickled_result = pickle.loads(pickle.dumps(result))
+    zip_error, = unpickled_result.localized_errors('de')['n']
+    assert zip_error.msg == 'Die Zahl muss größer oder gleich 1000 sein.'
+
+
+def test_can_copy_results_with_errors():
+    schema = SchemaValidator(exception_if_invalid=False)
+    schema.add('n', IntegerValidator(exception_if_invalid=False))
+    result = schema.process({'n': 'abc'}, {'locale': 'de'})
+
+    clone = result.copy()
+    error, = clone.errors['n']
+    assert error.key == 'invalid_number'
+    assert error.localized('en').msg == 'Please enter a number.'
+    # validators (and their message template cache) can be copied as well
+    validator = copy.deepcopy(schema.validator_for('n'))
+    assert validator.process('abc').errors[0].key == 'invalid_number'
+
+
+class BlockingValidator(IntegerValidator):
+    blocking = True
+    parallel_safe = True
+    exception_if_invalid = False
+
+    def __init__(self, delay=0.0, **kwargs):
+        self.delay = delay
+        self.threads = []
+        super(BlockingValidator, self).__init__(**kwargs)
+
+    def convert(self, value, context):
+        self.threads.append(threading.current_thread().name)
+        time.sleep(self.delay)
+        return super(BlockingValidator, self).convert(value, context)
+
+
+def _schema_with_blocking_fields(executor, **kwargs):
+    schema = SchemaValidator(executor=executor, **kwargs)
+    # later fields finish first
+    for i in range(4):
+        schema.add('slow%d' % i, BlockingValidator(delay=0.01 * (4 - i)))
+    schema.add('number', IntegerValidator(exception_if_invalid=False))
+    return schema
+
+
+def test_can_process_blocking_fields_in_executor():
+    futures = pytest.importorskip('concurrent.futures')
+    data = {'slow0': '1', 'slow1': 'x', 'slow2': '3', 'slow3': 'y', 'number': 'z'}
+    sequential_result = _schema_with_blocking_fields(None, exception_if_invalid=False).process(data)
+
+    with futures.ThreadPoolExecutor(max_workers=4) as executor:
+        schema = _schema_with_blocking_fields(executor, exception_if_invalid=False)
+        result = schema.process(data)
+
+    assert result.value == sequential_result.value
+    assert list(result.errors_by_path()) == [('slow1', ), ('slow3', ), ('number', )]
+    assert error_keys(result.errors['slow1']) == ('invalid_number', )
+    main_thread = threading.current_thread().name
+    for i in range(4):
+        threads = schema.validator_for('slow%d' % i).threads
+        assert len(threads) == 1
+        assert threads[0] != main_thread
+
+
+def test_parallel_fields_do_not_share_errors_version_while_running():
+    futures = pytest.importorskip('concurrent.futures')
+    versions = {}
+    class VersionRecorder(BlockingValidator):
+        def convert(self, value, context):
+            versions[value] = context['result']._errors_version
+            return super(VersionRecorder, self).convert(value, context)
+
+    with futures.ThreadPoolExecutor(max_workers=2) as executor:
+        schema = SchemaValidator(executor=executor, exception_if_invalid=False)
+        schema.add('a', VersionRecorder())
+        schema.add('b', VersionRecorder())
+        result = schema.process({'a': '1', 'b': 'x'})
+
+    form_version = result._errors_version
+    assert versions['1'] is not versions['x']
+    assert form_version not in (versions['1'], versions['x'])
+    for child in result.children.values():
+        assert child._errors_version is form_version
+    assert list(result.errors_by_path()) == [('b', )]
+
+
+def test_raises_exception_for_first_invalid_field_with_executor():
+    futures = pytest.importorskip('concurrent.futures')
+    data = {'slow0': '1', 'slow1': 'x', 'slow2': '3', 'slow3': 'y', 'number': '4'}
+    with futures.ThreadPoolExecutor(max_workers=4) as executor:
+        schema = _schema_with_blocking_fields(executor, exception_if_invalid=True)
+        with pytest.raises(InvalidDataError) as exc_info:
+            schema.process(data)
+    e = exc_info.value
+    assert set(e.error_dict()) == set(['slow1', 'slow3'])
+    assert e.details().key() == 'invalid_number'
+
+
+def test_processes_fields_sequentially_with_budget():
+    futures = pytest.importorskip('concurrent.futures')
+    with futures.ThreadPoolExecutor(max_workers=2) as executor:
+        schema = _schema_with_blocking_fields(executor, exception_if_invalid=False)
+        schema.process({'slow0': '1'}, {'budget': ValidationBudget(max_steps=100)})
+    main_thread = threading.current_thread().name
+    assert schema.validator_for('slow0').threads == [main_thread]
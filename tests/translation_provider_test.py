@@ -0,0 +1,194 @@
+# -*- coding: UTF-8 -*-
+# This file is a part of pycerberus.
+# The source code contained in this file is licensed under the MIT license.
+# See LICENSE.txt in the main project directory, for more information.
+# SPDX-License-Identifier: MIT
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import pickle
+import sqlite3
+import time
+
+from pythonic_testcase import *
+
+from pycerberus.i18n import _
+from pycerberus.translation import (CachedTranslationProvider, GettextProvider,
+    TranslationProvider)
+from pycerberus.validators import IntegerValidator
+
+
+class SQLiteTranslations(TranslationProvider):
+    "stand-in for a database which stores user-editable translations"
+    def __init__(self):
+        self.db = sqlite3.connect(':memory:')
+        self.db.execute('CREATE TABLE translations (domain, locale, message, translation)')
+        self.db.execute('CREATE TABLE versions (domain, locale, version)')
+        self.queries = []
+
+    def add(self, domain, locale, message, translation):
+        self.db.execute('INSERT INTO translations VALUES (?, ?, ?, ?)',
+                        (domain, locale, message, translation))
+        cursor = self.db.execute('UPDATE versions SET version = version + 1 '
+                                 'WHERE domain = ? AND locale = ?', (domain, locale))
+        if cursor.rowcount == 0:
+            self.db.execute('INSERT INTO versions VALUES (?, ?, 1)', (domain, locale))
+
+    def _query(self, sql, params):
+        # name of the first selected column
+        self.queries.append(sql.split()[1].rstrip(','))
+        return self.db.execute(sql, params).fetchall()
+
+    def translate(self, message, domain, locale):
+        rows = self._query('SELECT translation FROM translations '
+            'WHERE domain = ? AND locale = ? AND message = ?', (domain, locale, message))
+        return rows[0][0] if rows else None
+
+    def messages(self, domain, locale):
+        rows = self._query('SELECT message, translation FROM translations '
+            'WHERE domain = ? AND locale = ?', (domain, locale))
+        return dict(rows)
+
+    def version(self, domain, locale):
+        rows = self._query('SELECT version FROM versions '
+            'WHERE domain = ? AND locale = ?', (domain, locale))
+        return rows[0][0] if rows else 0
+
+
+class SQLiteWithoutBulkLoading(SQLiteTranslations):
+    def messages(self, domain, locale):
+        return None
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 1000
+    def __call__(self):
+        return self.now
+
+
+class CachedTranslationProviderTest(PythonicTestCase):
+    def setUp(self):
+        self.db = SQLiteTranslations()
+        self.db.add('app', 'de', 'Hello', 'Hallo')
+        self.db.add('app', 'de', 'Bye', 'Tschüss')
+        self.clock = FakeClock()
+        self.provider = CachedTranslationProvider(self.db, check_interval=30, clock=self.clock)
+
+    def test_loads_all_translations_for_locale_in_bulk(self):
+        assert_equals('Hallo', self.provider.gettext('Hello', 'app', 'de'))
+        assert_equals(['version', 'message'], self.db.queries)
+
+        assert_equals('Tschüss', self.provider.gettext('Bye', 'app', 'de'))
+        assert_equals('unknown', self.provider.gettext('unknown', 'app', 'de'))
+        assert_equals(2, len(self.db.queries))
+
+    def test_can_preload_translations(self):
+        self.provider.preload('app', ['de', 'fr'])
+        assert_equals(4, len(self.db.queries))
+        assert_equals('Hallo', self.provider.gettext('Hello', 'app', 'de'))
+        assert_equals('Hello', self.provider.gettext('Hello', 'app', 'fr'))
+        assert_equals(4, len(self.db.queries))
+
+    def test_caches_single_translations_without_bulk_loading(self):
+        db = SQLiteWithoutBulkLoading()
+        db.add('app', 'de', 'Hello', 'Hallo')
+        provider = CachedTranslationProvider(db, clock=self.clock)
+
+        assert_equals('Hallo', provider.gettext('Hello', 'app', 'de'))
+        assert_equals('Hallo', provider.gettext('Hello', 'app', 'de'))
+        assert_equals('Bye', provider.gettext('Bye', 'app', 'de'))
+        assert_equals('Bye', provider.gettext('Bye', 'app', 'de'))
+        assert_equals(['version', 'translation', 'translation'], db.queries)
+
+    def test_reloads_translations_after_version_changed(self):
+        assert_equals('Hallo', self.provider.gettext('Hello', 'app', 'de'))
+        self.db.add('app', 'de', 'Thanks', 'Danke')
+        # version is not checked again before "check_interval" passed
+        assert_equals('Thanks', self.provider.gettext('Thanks', 'app', 'de'))
+
+        self.clock.now += 30
+        assert_equals('Danke', self.provider.gettext('Thanks', 'app', 'de'))
+        nr_queries = len(self.db.queries)
+        self.clock.now += 30
+        assert_equals('Danke', self.provider.gettext('Thanks', 'app', 'de'))
+        assert_equals(['version'], self.db.queries[nr_queries:],
+            message='unchanged version must not trigger a reload')
+
+    def test_can_invalidate_cached_translations(self):
+        assert_equals('Hallo', self.provider.gettext('Hello', 'app', 'de'))
+        self.db.add('app', 'de', 'Thanks', 'Danke')
+        self.provider.invalidate('app', 'de')
+        assert_equals('Danke', self.provider.gettext('Thanks', 'app', 'de'))
+        self.provider.invalidate()
+        assert_equals(0, self.provider.cache_stats()['size'])
+
+    def test_can_invalidate_all_locales_of_a_domain(self):
+        assert_equals('Hallo', self.provider.gettext('Hello', 'app', 'de'))
+        assert_equals('Hello', self.provider.gettext('Hello', 'app', 'fr'))
+        assert_equals('Hello', self.provider.gettext('Hello', 'other', 'de'))
+        self.db.add('app', 'de', 'Thanks', 'Danke')
+        self.db.add('app', 'fr', 'Hello', 'Bonjour')
+
+        self.provider.invalidate('app')
+        assert_equals('Danke', self.provider.gettext('Thanks', 'app', 'de'))
+        assert_equals('Bonjour', self.provider.gettext('Hello', 'app', 'fr'))
+        assert_equals(3, self.provider.cache_stats()['size'])
+
+        self.provider.invalidate(locale='fr')
+        assert_equals(2, self.provider.cache_stats()['size'])
+        self.provider.invalidate('other', 'de')
+        assert_equals(1, self.provider.cache_stats()['size'])
+
+    def test_uses_first_locale_with_translation(self):
+        self.db.add('app', 'fr', 'Bye', 'Au revoir')
+        assert_equals('Au revoir', self.provider.gettext('Bye', 'app', ('fr', 'de')))
+        assert_equals('Hallo', self.provider.gettext('Hello', 'app', ('fr', 'de')))
+        assert_equals('Hello', self.provider.gettext('Hello', 'app', ('it', )))
+
+
+class GettextProviderTest(PythonicTestCase):
+    def test_can_translate_messages_from_gettext_catalogs(self):
+        provider = GettextProvider()
+        assert_equals('Bitte geben Sie eine Zahl ein.',
+            provider.translate('Please enter a number.', 'pycerberus', 'de'))
+        assert_none(provider.translate('Please enter a number.', 'pycerberus', 'xx'))
+        assert_none(provider.translate('unknown', 'pycerberus', 'de'))
+
+    def test_cached_provider_uses_monotonic_clock_if_available(self):
+        provider = CachedTranslationProvider(GettextProvider())
+        assert_equals(getattr(time, 'monotonic', time.time), provider.clock)
+
+    def test_cached_provider_can_be_pickled(self):
+        provider = CachedTranslationProvider(GettextProvider(), maxsize=10)
+        assert_equals('Bitte geben Sie eine Zahl ein.',
+            provider.translate('Please enter a number.', 'pycerberus', 'de'))
+
+        unpickled = pickle.loads(pickle.dumps(provider))
+        assert_equals(0, unpickled.cache_stats()['size'])
+        assert_equals(10, unpickled.cache_stats()['maxsize'])
+        assert_equals('Bitte geben Sie eine Zahl ein.',
+            unpickled.translate('Please enter a number.', 'pycerberus', 'de'))
+
+
+class ValidatorWithTranslationProviderTest(PythonicTestCase):
+    def test_validators_can_use_translation_provider(self):
+        db = SQLiteTranslations()
+        db.add('app', 'de', 'Please enter a number.', 'Eine Zahl, bitte!')
+        provider = CachedTranslationProvider(db)
+
+        class AppValidator(IntegerValidator):
+            def messages(self):
+                return {'invalid_number': _('Please enter a number.')}
+
+            def translation_parameters(self, context):
+                return {'domain': 'app', 'provider': provider}
+
+        validator = AppValidator(exception_if_invalid=False)
+        error, = validator.process('abc', {'locale': 'de'}).errors
+        assert_equals('Eine Zahl, bitte!', error.msg)
+        error, = validator.process('abc', {'locale': 'en'}).errors
+        assert_equals('Please enter a number.', error.msg)
+        # built-in messages still use gettext
+        error, = validator.process(None, {'locale': 'de'}).errors
+        assert_equals('Bitte geben Sie einen Wert ein.', error.msg)
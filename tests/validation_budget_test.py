@@ -0,0 +1,94 @@
+# -*- coding: UTF-8 -*-
+# This file is a part of pycerberus.
+# The source code contained in this file is licensed under the MIT license.
+# See LICENSE.txt in the main project directory, for more information.
+# SPDX-License-Identifier: MIT
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import time
+
+from pythonic_testcase import *
+
+from pycerberus.api import Validator
+from pycerberus.budget import ValidationBudget
+from pycerberus.errors import BudgetExceededError
+from pycerberus.schema import SchemaValidator
+from pycerberus.test_util import error_keys, ValidationTest
+from pycerberus.validators import ForEach, IntegerValidator
+
+
+class CountingValidator(Validator):
+    exception_if_invalid = False
+
+    def __init__(self, values, **kwargs):
+        self.values = values
+        super(CountingValidator, self).__init__(**kwargs)
+
+    def convert(self, value, context):
+        self.values.append(value)
+        return value
+
+
+class ValidationBudgetTest(ValidationTest):
+
+    def test_can_limit_number_of_steps(self):
+        budget = ValidationBudget(max_steps=2)
+        assert_true(budget.charge())
+        assert_true(budget.charge())
+        assert_false(budget.charge())
+        assert_true(budget.is_exceeded())
+
+    def test_can_limit_duration(self):
+        now = [100]
+        budget = ValidationBudget(max_seconds=2, clock=lambda: now[0])
+        assert_true(budget.charge())
+        now[0] += 2
+        assert_true(budget.charge())
+        now[0] += 1
+        assert_false(budget.charge())
+        assert_false(budget.charge())
+
+    def test_uses_monotonic_clock_if_available(self):
+        budget = ValidationBudget(max_seconds=2)
+        assert_equals(getattr(time, 'monotonic', time.time), budget.clock)
+
+    def test_validator_raises_error_if_budget_is_exceeded(self):
+        context = {'budget': ValidationBudget(max_steps=1)}
+        validator = IntegerValidator()
+        assert_equals(42, validator.process('42', context=context))
+
+        with assert_raises(BudgetExceededError) as exc_ctx:
+            validator.process('42', context=context)
+        e = exc_ctx.caught_exception
+        assert_equals('budget_exceeded', e.details().key())
+        assert_equals('Validation aborted because it required too much work.', e.details().msg())
+
+    def test_can_return_error_if_budget_is_exceeded(self):
+        self.init_validator(IntegerValidator(exception_if_invalid=False))
+        context = {'budget': ValidationBudget(max_steps=0), 'locale': 'de'}
+        result = self.assert_error('42', context=context)
+        assert_equals(('budget_exceeded',), error_keys(result.errors))
+        assert_equals('Die Prüfung wurde abgebrochen, weil sie zu aufwändig war.', result.errors[0].msg)
+
+    def test_stops_processing_foreach_items_if_budget_is_exceeded(self):
+        values = []
+        foreach = ForEach(CountingValidator(values))
+        context = {'budget': ValidationBudget(max_steps=4)}
+
+        result = foreach.process(list(range(100)), context=context)
+        assert_equals([0, 1, 2], values)
+        assert_true(result.contains_error())
+        assert_equals(('budget_exceeded',), error_keys(result.global_errors))
+
+    def test_schema_reports_exceeded_budget_for_remaining_fields(self):
+        values = []
+        schema = SchemaValidator(exception_if_invalid=False)
+        schema.add('first', CountingValidator(values))
+        schema.add('second', CountingValidator(values))
+        context = {'budget': ValidationBudget(max_steps=2)}
+
+        result = schema.process({'first': 1, 'second': 2}, context=context)
+        assert_equals([1], values)
+        assert_equals(('second',), tuple(result.errors))
+        assert_equals(('budget_exceeded',), error_keys(result.errors['second']))